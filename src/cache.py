@@ -0,0 +1,248 @@
+"""Response cache for read tools.
+
+Responses are stored as JSON text keyed by tool name plus normalized
+arguments. Each tool has its own TTL, the in-memory tier is bounded by total
+bytes and evicts the least recently used entries first. An optional SQLite
+tier (YOUTUBE_CACHE_PATH) keeps responses across server restarts.
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from src.config import get_config
+from src.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Seconds a response stays fresh. Channel metadata and transcripts rarely
+# change; anything carrying view/like counts goes stale quickly.
+DEFAULT_TTLS: Dict[str, int] = {
+    "youtube_search": 600,
+    "youtube_get_video": 3600,
+    "youtube_get_videos": 3600,
+    "youtube_get_channel": 3600,
+    "youtube_get_transcript": 86400,
+    # Served from the transcript cache; whole bulk responses are not stored
+    "youtube_get_transcripts": 0,
+    # Answers depend on which transcripts are loaded, so they are not cached
+    "youtube_search_transcripts": 0,
+    "youtube_get_playlist": 900,
+    "youtube_playlist_details": 3600,
+    "youtube_list_playlists": 1800,
+    "youtube_get_channel_videos": 900,
+    "youtube_channel_uploads": 86400,
+    "youtube_get_comments": 300,
+}
+DEFAULT_TTL = 300
+STATISTICS_TTL = 300
+# Misses (unknown videos and channels, disabled transcripts) are remembered
+# briefly so retries are answered locally; override with "negative" in
+# YOUTUBE_CACHE_TTLS
+NEGATIVE_TTL = 300
+NEGATIVE_ERROR_CODES = ("NotFound", "TranscriptsDisabled")
+
+
+class ResponseCache:
+    """Byte-bounded LRU cache with per-entry expiry.
+
+    Args:
+        max_bytes: Bound for the in-memory tier (0 disables it)
+        ttls: Per-tool TTL overrides in seconds
+        disk: Optional persistent tier consulted on memory misses
+    """
+
+    def __init__(self, max_bytes: int, ttls: Optional[Dict[str, int]] = None,
+                 disk: Optional[DiskCache] = None):
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.disk = disk
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(tool: str, arguments: dict) -> str:
+        """Build a cache key from a tool name and its validated arguments."""
+        return json.dumps([tool, arguments], sort_keys=True, separators=(",", ":"), default=str)
+
+    def ttl_for(self, tool: str, arguments: Optional[dict] = None) -> int:
+        """TTL for a tool; requests that include statistics use the short TTL."""
+        ttl = self.ttls.get(tool, DEFAULT_TTL)
+        parts = (arguments or {}).get("part") or []
+        if "statistics" in parts:
+            ttl = min(ttl, self.ttls.get("statistics", STATISTICS_TTL))
+        return ttl
+
+    @property
+    def negative_ttl(self) -> int:
+        """TTL for negative answers."""
+        return self.ttls.get("negative", NEGATIVE_TTL)
+
+    def ttl_for_result(self, tool: str, arguments: Optional[dict], result: dict) -> int:
+        """TTL for a tool result: errors are only cached when they are negative answers."""
+        error = result.get("error")
+        if error is None:
+            return self.ttl_for(tool, arguments)
+        if error.get("code") in NEGATIVE_ERROR_CODES:
+            return min(self.ttl_for(tool, arguments), self.negative_ttl)
+        return 0
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a fresh copy of the cached value, or None on miss/expiry."""
+        payload = self._memory_get(key)
+        if payload is None and self.disk is not None:
+            payload = self._promote(key, self.disk.get(key))
+        return self._count(payload)
+
+    async def aget(self, key: str) -> Optional[dict]:
+        """Like get, with the disk tier read off the event loop."""
+        return (await self.aget_first([key]))[1]
+
+    async def aget_first(self, keys: List[str]) -> Tuple[Optional[str], Optional[dict]]:
+        """The first of several keys that is cached, counted as one lookup.
+
+        Memory is checked for every key before the disk tier, which is
+        queried once for all of them.
+
+        Returns:
+            (key, value), or (None, None) if none is cached
+        """
+        for key in keys:
+            payload = self._memory_get(key)
+            if payload is not None:
+                return key, self._count(payload)
+        if self.disk is not None:
+            found = await self.disk.run(self.disk.get_first, keys)
+            if found is not None:
+                key, payload, expires_at = found
+                return key, self._count(self._promote(key, (payload, expires_at)))
+        return None, self._count(None)
+
+    def set(self, key: str, value: dict, ttl: int):
+        """Store a JSON-serializable value for ttl seconds."""
+        if ttl <= 0:
+            return
+        payload = json.dumps(value, separators=(",", ":"), default=str)
+        self._memory_set(key, payload, ttl)
+        if self.disk is not None:
+            self.disk.set(key, payload, time.time() + ttl)
+
+    async def aset(self, key: str, value: dict, ttl: int):
+        """Like set, with the disk tier written off the event loop."""
+        if ttl <= 0:
+            return
+        payload = json.dumps(value, separators=(",", ":"), default=str)
+        self._memory_set(key, payload, ttl)
+        if self.disk is not None:
+            await self.disk.run(self.disk.set, key, payload, time.time() + ttl)
+
+    def _promote(self, key: str, found: Optional[tuple]) -> Optional[str]:
+        """Copy a disk hit into the memory tier and return its payload."""
+        if found is None:
+            return None
+        payload, expires_at = found
+        self._memory_set(key, payload, expires_at - time.time())
+        return payload
+
+    def _count(self, payload: Optional[str]) -> Optional[dict]:
+        with self._lock:
+            if payload is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(payload)
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, _, payload = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def _memory_set(self, key: str, payload: str, ttl: float):
+        size = len(payload.encode("utf-8"))
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, size, payload)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry, including the persistent tier."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxBytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+        if self.disk is not None:
+            stats["disk"] = self.disk.stats()
+        return stats
+
+    def _remove(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the process-wide response cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                config = get_config(require_api_key=False)
+                disk = None
+                if config.cache_path:
+                    try:
+                        disk = DiskCache(config.cache_path, max_bytes=config.cache_disk_max_bytes)
+                    except (OSError, sqlite3.Error) as e:
+                        # The cache never fails a tool call: run memory-only instead
+                        logger.warning("Disk cache disabled, cannot open %s: %s", config.cache_path, e)
+                _cache = ResponseCache(
+                    max_bytes=config.cache_max_bytes,
+                    ttls=config.cache_ttls,
+                    disk=disk
+                )
+    return _cache
+
+
+def reset_response_cache():
+    """Drop the shared cache so the next call recreates it from config."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -0,0 +1,132 @@
+"""Channel handle and legacy username to channel ID map.
+
+Resolving `@handle` or a legacy username costs a channels.list request.
+Channel IDs never change and handles rarely do, so each resolution is
+remembered (in memory, and in the SQLite file when YOUTUBE_CACHE_PATH is
+set) and later lookups by the same name go straight to the channel ID.
+"""
+import threading
+import time
+from typing import Dict, List, Optional
+
+from src.cache import get_response_cache
+
+# Seconds a resolved name is trusted; handles can be given up and reclaimed
+HANDLE_TTL = 30 * 86400
+
+
+def normalize_handle(name: str) -> str:
+    """Map key for a handle or username (both are case-insensitive)."""
+    return name.strip().lower()
+
+
+def lookup_params(name: str) -> List[dict]:
+    """channels.list parameters to try, in order, for a handle or username.
+
+    "@name" is looked up as a handle first; a bare name as a legacy username
+    first. Each falls back to the other form.
+    """
+    name = name.strip()
+    bare = name.lstrip("@")
+    handle = {"forHandle": f"@{bare}"}
+    username = {"forUsername": bare}
+    return [handle, username] if name.startswith("@") else [username, handle]
+
+
+class ChannelHandleMap:
+    """Names already resolved to channel IDs.
+
+    Args:
+        store: Optional DiskCache; mappings are then shared with other
+            server processes and kept across restarts
+        ttl: Seconds a mapping is trusted
+    """
+
+    def __init__(self, store=None, ttl: float = HANDLE_TTL):
+        self.store = store
+        self.ttl = ttl
+        self._ids: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str) -> Optional[str]:
+        """Channel ID a handle or username resolved to, or None if unknown."""
+        key = normalize_handle(name)
+        entry = self._memory_get(key)
+        if entry is None and self.store is not None:
+            entry = self._promote(key, self.store.get_channel_handle(key))
+        return self._count(entry)
+
+    async def aget(self, name: str) -> Optional[str]:
+        """Like get, with the store read off the event loop."""
+        key = normalize_handle(name)
+        entry = self._memory_get(key)
+        if entry is None and self.store is not None:
+            entry = self._promote(key, await self.store.run(self.store.get_channel_handle, key))
+        return self._count(entry)
+
+    def set(self, name: str, channel_id: str):
+        """Remember the channel ID a handle or username resolved to."""
+        key, expires_at = self._memory_set(name, channel_id)
+        if self.store is not None:
+            self.store.set_channel_handle(key, channel_id, expires_at)
+
+    async def aset(self, name: str, channel_id: str):
+        """Like set, with the store written off the event loop."""
+        key, expires_at = self._memory_set(name, channel_id)
+        if self.store is not None:
+            await self.store.run(self.store.set_channel_handle, key, channel_id, expires_at)
+
+    def _memory_get(self, key: str) -> Optional[tuple]:
+        with self._lock:
+            entry = self._ids.get(key)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry
+
+    def _memory_set(self, name: str, channel_id: str) -> tuple:
+        key = normalize_handle(name)
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._ids[key] = (channel_id, expires_at)
+        return key, expires_at
+
+    def _promote(self, key: str, entry: Optional[tuple]) -> Optional[tuple]:
+        if entry is not None:
+            with self._lock:
+                self._ids[key] = entry
+        return entry
+
+    def _count(self, entry: Optional[tuple]) -> Optional[str]:
+        with self._lock:
+            if entry is None or entry[1] <= time.time():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[0]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"names": len(self._ids), "hits": self.hits, "misses": self.misses}
+
+
+_handles: Optional[ChannelHandleMap] = None
+_handles_lock = threading.Lock()
+
+
+def get_channel_handles() -> ChannelHandleMap:
+    """Get or create the process-wide handle map."""
+    global _handles
+    if _handles is None:
+        with _handles_lock:
+            if _handles is None:
+                _handles = ChannelHandleMap(store=get_response_cache().disk)
+    return _handles
+
+
+def reset_channel_handles():
+    """Drop the shared map so the next call recreates it."""
+    global _handles
+    with _handles_lock:
+        _handles = None
@@ -0,0 +1,143 @@
+"""Request coalescing (micro-batching) for single-ID lookups.
+
+Agents often fire many youtube_get_video / youtube_get_channel calls at
+once. Instead of one API request per call, lookups that arrive within a
+short window are collected and served from a single batched list call.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, List, Optional
+
+from src.config import get_config
+from src.executor import execute
+
+# videos.list / channels.list accept at most 50 comma-separated IDs per call
+MAX_IDS_PER_REQUEST = 50
+
+# fetch_batch(group, ids) -> {id: resource or Exception}; absent IDs are not found
+BatchFetcher = Callable[[Hashable, List[str]], Awaitable[Dict[str, object]]]
+
+
+async def fetch_by_id(list_method, ids: List[str], part: str, fields: Optional[str] = None) -> Dict[str, object]:
+    """Fetch resources with one list call per 50 IDs, chunks issued concurrently.
+
+    Args:
+        list_method: Bound list method, e.g. client.client.videos().list
+        ids: Resource IDs (duplicates are fetched once)
+        part: Comma-separated parts to retrieve
+        fields: Optional API fields mask; must select items/id
+
+    Returns:
+        Mapping of ID to its resource, or to the exception raised by the
+        chunk that contained it; IDs the API did not return are absent
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    chunks = [
+        unique_ids[i:i + MAX_IDS_PER_REQUEST]
+        for i in range(0, len(unique_ids), MAX_IDS_PER_REQUEST)
+    ]
+    params = {"part": part}
+    if fields:
+        params["fields"] = fields
+    responses = await asyncio.gather(
+        *(execute(list_method(id=",".join(chunk), **params)) for chunk in chunks),
+        return_exceptions=True
+    )
+
+    found = {}
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, Exception):
+            for resource_id in chunk:
+                found[resource_id] = response
+            continue
+        for item in response.get("items", []):
+            found[item.get("id")] = item
+    return found
+
+
+class RequestCoalescer:
+    """Collect single-ID lookups per group and fetch them in one batch.
+
+    Lookups are grouped by a hashable key (e.g. the requested parts) since
+    only requests for the same parts can share one API call.
+
+    Args:
+        fetch_batch: Coroutine fetching many IDs for one group
+        window: Seconds to wait for more lookups; None reads
+            YOUTUBE_COALESCE_WINDOW_MS on first use, 0 disables batching
+        max_batch: Flush as soon as a group reaches this many distinct IDs
+    """
+
+    def __init__(self, fetch_batch: BatchFetcher, window: Optional[float] = None, max_batch: int = 50):
+        self.fetch_batch = fetch_batch
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[Hashable, Dict[str, List[asyncio.Future]]] = {}
+        self._timers: Dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks = set()
+        self.requests = 0
+        self.batches = 0
+
+    def _window(self) -> float:
+        if self.window is None:
+            self.window = get_config(require_api_key=False).coalesce_window_ms / 1000
+        return self.window
+
+    async def load(self, group: Hashable, key: str):
+        """Return the resource for key, or None if the API did not return it.
+
+        Raises:
+            Exception: Whatever the batched request raised for this key
+        """
+        self.requests += 1
+        window = self._window()
+        if window <= 0:
+            self.batches += 1
+            result = (await self.fetch_batch(group, [key])).get(key)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.setdefault(group, {})
+        batch.setdefault(key, []).append(future)
+        if len(batch) >= self.max_batch:
+            self._flush(group)
+        elif group not in self._timers:
+            self._timers[group] = loop.call_later(window, self._flush, group)
+        return await future
+
+    def _flush(self, group: Hashable):
+        timer = self._timers.pop(group, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(group, None)
+        if not batch:
+            return
+        self.batches += 1
+        task = asyncio.ensure_future(self._run(group, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, group: Hashable, batch: Dict[str, List[asyncio.Future]]):
+        try:
+            results = await self.fetch_batch(group, list(batch))
+        except Exception as e:
+            results = {key: e for key in batch}
+        for key, futures in batch.items():
+            result = results.get(key)
+            for future in futures:
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def stats(self) -> dict:
+        """Lookup and batch counters."""
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "saved": self.requests - self.batches,
+        }
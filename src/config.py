@@ -1,6 +1,7 @@
 """Configuration for YouTube MCP Server."""
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
 
 @dataclass
@@ -8,16 +9,86 @@ class Config:
     """Server configuration."""
     api_key: str
     rate_limit: int = 100
+    rate_limit_period: str = "second"
+    rate_limit_max_wait: float = 30.0
+    max_workers: int = 8
+    prebuild_client: bool = True
+    cache_max_bytes: int = 64 * 1024 * 1024
+    cache_ttls: Dict[str, int] = field(default_factory=dict)
+    cache_path: Optional[str] = None
+    cache_disk_max_bytes: int = 256 * 1024 * 1024
+    coalesce_window_ms: float = 5.0
+    quota_daily_budget: int = 10000
+    quota_tool_budgets: Dict[str, int] = field(default_factory=dict)
+    transcript_concurrency: int = 4
+    transcript_timeout: float = 30.0
 
 
-def get_config() -> Config:
-    """Load configuration from environment variables."""
+def get_config(require_api_key: bool = True) -> Config:
+    """Load configuration from environment variables.
+
+    Args:
+        require_api_key: Raise if YOUTUBE_API_KEY is unset. Components that
+            only need tuning settings (thread pool, caches) pass False.
+    """
     api_key = os.getenv("YOUTUBE_API_KEY", "")
-    if not api_key:
+    if not api_key and require_api_key:
         raise ValueError(
             "YOUTUBE_API_KEY environment variable is required. "
             "Set it or add it to your MCP configuration."
         )
 
     rate_limit = int(os.getenv("YOUTUBE_RATE_LIMIT", "100"))
-    return Config(api_key=api_key, rate_limit=rate_limit)
+    rate_limit_period = os.getenv("YOUTUBE_RATE_LIMIT_PERIOD", "second").strip().lower()
+    if rate_limit_period not in ("second", "minute"):
+        raise ValueError(
+            f"YOUTUBE_RATE_LIMIT_PERIOD must be 'second' or 'minute', got '{rate_limit_period}'"
+        )
+    rate_limit_max_wait = float(os.getenv("YOUTUBE_RATE_LIMIT_MAX_WAIT", "30"))
+    max_workers = int(os.getenv("YOUTUBE_MAX_WORKERS", "8"))
+    prebuild_client = _env_bool("YOUTUBE_PREBUILD_CLIENT", True)
+    cache_max_bytes = int(os.getenv("YOUTUBE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+    cache_ttls = _env_int_map("YOUTUBE_CACHE_TTLS")
+    cache_path = os.getenv("YOUTUBE_CACHE_PATH") or None
+    cache_disk_max_bytes = int(os.getenv("YOUTUBE_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
+    coalesce_window_ms = float(os.getenv("YOUTUBE_COALESCE_WINDOW_MS", "5"))
+    quota_daily_budget = int(os.getenv("YOUTUBE_QUOTA_DAILY_BUDGET", "10000"))
+    quota_tool_budgets = _env_int_map("YOUTUBE_QUOTA_TOOL_BUDGETS")
+    transcript_concurrency = int(os.getenv("YOUTUBE_TRANSCRIPT_CONCURRENCY", "4"))
+    transcript_timeout = float(os.getenv("YOUTUBE_TRANSCRIPT_TIMEOUT", "30"))
+    return Config(
+        api_key=api_key,
+        rate_limit=rate_limit,
+        rate_limit_period=rate_limit_period,
+        rate_limit_max_wait=rate_limit_max_wait,
+        max_workers=max(1, max_workers),
+        prebuild_client=prebuild_client,
+        cache_max_bytes=cache_max_bytes,
+        cache_ttls=cache_ttls,
+        cache_path=cache_path,
+        cache_disk_max_bytes=cache_disk_max_bytes,
+        coalesce_window_ms=coalesce_window_ms,
+        quota_daily_budget=quota_daily_budget,
+        quota_tool_budgets=quota_tool_budgets,
+        transcript_concurrency=max(1, transcript_concurrency),
+        transcript_timeout=transcript_timeout,
+    )
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean flag such as 1/0, true/false, yes/no."""
+    value = os.getenv(name)
+    if value is None or value.strip() == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _env_int_map(name: str) -> Dict[str, int]:
+    """Read a mapping written as "key=value,key=value" with integer values."""
+    result = {}
+    for item in os.getenv(name, "").split(","):
+        if "=" not in item:
+            continue
+        key, value = item.split("=", 1)
+        result[key.strip()] = int(value)
+    return result
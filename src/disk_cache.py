@@ -0,0 +1,229 @@
+"""Persistent SQLite response cache.
+
+MCP clients start a new server process per session, so the in-memory cache
+is lost between sessions. This store keeps responses in one SQLite file (WAL
+mode, so several server processes can share it) with zlib-compressed values,
+TTL expiry and least-recently-used eviction once the file grows past its
+size bound. The same file records daily quota usage so budgets hold across
+sessions too, and the channel handles already resolved to channel IDs.
+"""
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Refreshing accessed_at on every read would turn reads into writes; a
+# coarse timestamp is enough for LRU ordering.
+_TOUCH_INTERVAL = 60
+# Size check cadence, in writes.
+_EVICT_EVERY = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    value BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS quota_usage (
+    day TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    units INTEGER NOT NULL,
+    PRIMARY KEY (day, tool)
+);
+CREATE TABLE IF NOT EXISTS channel_handles (
+    handle TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class DiskCache:
+    """SQLite-backed key/value store for serialized responses.
+
+    Failures (locked database, disk full) are logged and treated as misses;
+    the cache never fails a tool call. Async callers go through run(), which
+    keeps SQLite, compression and eviction off the event loop on a single
+    dedicated thread.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="youtube-cache")
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's connection (sqlite3 connections are per-thread)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=1.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def submit(self, func, *args) -> Future:
+        """Queue a blocking call on this store's thread without waiting for it."""
+        return self._executor.submit(func, *args)
+
+    async def run(self, func, *args):
+        """Run one of this store's blocking methods on its own thread and await it."""
+        return await asyncio.wrap_future(self.submit(func, *args))
+
+    def get(self, key: str) -> Optional[tuple]:
+        """Return (payload, expires_at) for a fresh entry, or None."""
+        found = self.get_first([key])
+        return found[1:] if found is not None else None
+
+    def get_first(self, keys: List[str]) -> Optional[tuple]:
+        """Return (key, payload, expires_at) for the first key with a fresh entry, or None.
+
+        All keys are looked up in one query and counted as one hit or miss.
+        """
+        now = time.time()
+        try:
+            conn = self._connection()
+            rows = conn.execute(
+                "SELECT key, value, expires_at, accessed_at FROM responses "
+                f"WHERE key IN ({','.join('?' * len(keys))}) AND expires_at > ?",
+                (*keys, now)
+            ).fetchall()
+            if not rows:
+                self.misses += 1
+                return None
+            order = {key: position for position, key in enumerate(keys)}
+            key, value, expires_at, accessed_at = min(rows, key=lambda row: order[row[0]])
+            if now - accessed_at > _TOUCH_INTERVAL:
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return key, zlib.decompress(value).decode("utf-8"), expires_at
+        except (sqlite3.Error, zlib.error) as e:
+            self.errors += 1
+            logger.debug("Disk cache read failed: %s", e)
+            return None
+
+    def set(self, key: str, payload: str, expires_at: float):
+        """Store a serialized payload until expires_at (wall-clock seconds)."""
+        value = zlib.compress(payload.encode("utf-8"))
+        if len(value) > self.max_bytes:
+            return
+        now = time.time()
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, accessed_at, size, value) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, expires_at, now, len(value), value)
+            )
+            self._writes += 1
+            if self._writes % _EVICT_EVERY == 1:
+                self.evict()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.debug("Disk cache write failed: %s", e)
+
+    def evict(self):
+        """Drop expired entries, then least recently used ones until under max_bytes."""
+        conn = self._connection()
+        conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        doomed = []
+        for key, size in rows:
+            if excess <= 0:
+                break
+            doomed.append((key,))
+            excess -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def record_quota(self, day: str, tool: str, units: int):
+        """Add quota units spent by a tool on a given day."""
+        try:
+            self._connection().execute(
+                "INSERT INTO quota_usage (day, tool, units) VALUES (?, ?, ?) "
+                "ON CONFLICT (day, tool) DO UPDATE SET units = units + excluded.units",
+                (day, tool, units)
+            )
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.debug("Disk cache quota write failed: %s", e)
+
+    def quota_usage(self, day: str) -> Optional[dict]:
+        """Units spent per tool on a given day, across all server processes."""
+        try:
+            rows = self._connection().execute(
+                "SELECT tool, units FROM quota_usage WHERE day = ?", (day,)
+            ).fetchall()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.debug("Disk cache quota read failed: %s", e)
+            return None
+        return dict(rows)
+
+    def get_channel_handle(self, handle: str) -> Optional[tuple]:
+        """Return (channel_id, expires_at) for a fresh handle mapping, or None."""
+        try:
+            row = self._connection().execute(
+                "SELECT channel_id, expires_at FROM channel_handles WHERE handle = ? AND expires_at > ?",
+                (handle, time.time())
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.debug("Disk cache handle read failed: %s", e)
+            return None
+        return tuple(row) if row is not None else None
+
+    def set_channel_handle(self, handle: str, channel_id: str, expires_at: float):
+        """Record the channel ID a handle or username resolves to."""
+        try:
+            self._connection().execute(
+                "INSERT OR REPLACE INTO channel_handles (handle, channel_id, expires_at) VALUES (?, ?, ?)",
+                (handle, channel_id, expires_at)
+            )
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.debug("Disk cache handle write failed: %s", e)
+
+    def clear(self):
+        """Delete every cached response."""
+        self._connection().execute("DELETE FROM responses")
+
+    def stats(self) -> dict:
+        """Entry count, stored bytes and hit/miss counters."""
+        try:
+            entries, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        except sqlite3.Error:
+            entries, size = None, None
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": size,
+            "maxBytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+        }
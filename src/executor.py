@@ -0,0 +1,81 @@
+"""Execution layer for blocking YouTube calls.
+
+googleapiclient and youtube-transcript-api are synchronous. Every network
+call is handed to a bounded thread pool so that one slow request does not
+stall the other MCP calls the server is handling.
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from src.config import get_config
+from src.quota import get_quota_accountant
+from src.rate_limiter import get_rate_limiter, RateLimitExceeded
+from src.youtube_client import thread_http
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get or create the shared thread pool (sized by YOUTUBE_MAX_WORKERS)."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                config = get_config(require_api_key=False)
+                _executor = ThreadPoolExecutor(
+                    max_workers=config.max_workers,
+                    thread_name_prefix="youtube-api"
+                )
+    return _executor
+
+
+def shutdown_executor(wait: bool = True):
+    """Shut down the shared thread pool; the next call creates a new one."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait)
+            _executor = None
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking callable on the shared thread pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_executor(),
+        functools.partial(func, *args, **kwargs)
+    )
+
+
+def _execute_request(request):
+    return request.execute(http=thread_http())
+
+
+async def execute(request):
+    """Execute a googleapiclient request on the shared thread pool.
+
+    The call is charged to the quota budget and then waits for a token from
+    the shared rate limiter, so every Data API call counts against both.
+
+    Args:
+        request: An unexecuted googleapiclient HttpRequest
+
+    Returns:
+        Parsed JSON response
+
+    Raises:
+        QuotaExceeded: If the call would exceed a daily quota budget
+        RateLimitExceeded: If the request would queue longer than allowed
+    """
+    quota = get_quota_accountant()
+    units = quota.reserve(getattr(request, "methodId", None))
+    try:
+        await get_rate_limiter().acquire()
+    except (RateLimitExceeded, asyncio.CancelledError):
+        quota.refund(units)
+        raise
+    return await run_blocking(_execute_request, request)
@@ -0,0 +1,218 @@
+"""Partial-response field projections.
+
+Tools accept a `fields` selector in the YouTube Data API syntax
+(`snippet(title,thumbnails/high/url),statistics`) that applies to each
+returned resource. It is sent to the API as the `fields` parameter so
+unneeded data never crosses the wire, and applied locally to results
+served from cache or assembled from several calls.
+"""
+import json
+from typing import Dict, Iterable, Optional, Union
+
+# A parsed selector: field name -> nested selector, or True for the whole value
+FieldTree = Dict[str, Union["FieldTree", bool]]
+
+# Selector meaning "return full resources"
+ALL_FIELDS = "*"
+
+FIELDS_DESCRIPTION = (
+    "Fields to return per resource in YouTube API syntax, e.g. 'id,snippet(title,publishedAt)'; "
+    "omit for a slim default, '*' for full resources"
+)
+
+_VIDEO_FIELDS = (
+    "id,snippet(publishedAt,channelId,channelTitle,title,description,tags,categoryId,"
+    "defaultAudioLanguage,thumbnails/high/url),statistics,contentDetails(duration,definition,caption)"
+)
+
+# Slim projections used when a caller does not pass fields. They drop the
+# bulk of the payload (thumbnails at every resolution, localized copies,
+# etags) while keeping what agents read.
+DEFAULT_FIELDS: Dict[str, str] = {
+    "youtube_search": (
+        "id,snippet(publishedAt,channelId,channelTitle,title,description,thumbnails/medium/url),"
+        "statistics,contentDetails(duration,definition,caption)"
+    ),
+    "youtube_get_video": _VIDEO_FIELDS,
+    "youtube_get_videos": _VIDEO_FIELDS,
+    "youtube_get_channel": (
+        "id,snippet(title,description,customUrl,publishedAt,country,thumbnails/high/url),"
+        "statistics,contentDetails/relatedPlaylists/uploads"
+    ),
+    "youtube_get_playlist": (
+        "snippet(publishedAt,title,position,videoOwnerChannelId,videoOwnerChannelTitle,"
+        "resourceId/videoId),contentDetails(videoId,videoPublishedAt)"
+    ),
+    "youtube_list_playlists": (
+        "id,snippet(publishedAt,channelId,channelTitle,title,description,thumbnails/medium/url),"
+        "contentDetails/itemCount"
+    ),
+    "youtube_get_comments": (
+        "id,snippet(totalReplyCount,topLevelComment/snippet(authorDisplayName,authorChannelId,"
+        "textDisplay,likeCount,publishedAt,updatedAt)),"
+        "replies/comments(id,snippet(authorDisplayName,authorChannelId,textDisplay,likeCount,"
+        "publishedAt,parentId))"
+    ),
+}
+
+
+def default_fields(tool: str, parts: Optional[Iterable[str]] = None) -> Optional[str]:
+    """A tool's slim default selector, widened to cover the requested parts.
+
+    The defaults only trim the parts tools fetch by default; any other
+    requested part (status, topicDetails, player, ...) is kept whole.
+
+    Returns:
+        A selector, or None if the tool has no default
+    """
+    spec = DEFAULT_FIELDS.get(tool)
+    if spec is None or not parts:
+        return spec
+    tree = parse_fields(spec)
+    extra = []
+    for part in parts:
+        for name in part.split(","):
+            name = name.strip()
+            if name and name not in tree and name not in extra:
+                extra.append(name)
+    return ",".join([spec, *extra])
+
+
+def parse_fields(spec: str) -> FieldTree:
+    """Parse a fields selector into a tree.
+
+    Raises:
+        ValueError: If the selector is malformed
+    """
+    tree, pos = _parse_list(spec, 0)
+    if pos != len(spec):
+        raise ValueError(f"Invalid fields selector {spec!r}: unexpected {spec[pos]!r} at {pos}")
+    return tree
+
+
+def _parse_list(spec: str, pos: int):
+    tree: FieldTree = {}
+    while True:
+        start = pos
+        while pos < len(spec) and spec[pos] not in ",()":
+            pos += 1
+        path = [name.strip() for name in spec[start:pos].split("/")]
+        if not all(path):
+            raise ValueError(f"Invalid fields selector {spec!r}: empty field name at {start}")
+        sub: Union[FieldTree, bool] = True
+        if pos < len(spec) and spec[pos] == "(":
+            sub, pos = _parse_list(spec, pos + 1)
+            if pos >= len(spec) or spec[pos] != ")":
+                raise ValueError(f"Invalid fields selector {spec!r}: missing ')'")
+            pos += 1
+        for name in reversed(path[1:]):
+            sub = {name: sub}
+        _merge(tree, path[0], sub)
+        if pos < len(spec) and spec[pos] == ",":
+            pos += 1
+            continue
+        return tree, pos
+
+
+def _merge(tree: FieldTree, name: str, sub):
+    existing = tree.get(name)
+    if existing is True or sub is True:
+        tree[name] = True
+    elif isinstance(existing, dict):
+        for key, value in sub.items():
+            _merge(existing, key, value)
+    else:
+        tree[name] = sub
+
+
+def to_selector(tree: FieldTree) -> str:
+    """Serialize a tree back into selector syntax."""
+    return ",".join(
+        name if sub is True else f"{name}({to_selector(sub)})"
+        for name, sub in tree.items()
+    )
+
+
+def project(value, tree: Union[FieldTree, bool]):
+    """Keep only the selected fields of a value (lists are projected per element)."""
+    if tree is True:
+        return value
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if ALL_FIELDS in tree:
+        return {key: project(item, tree[ALL_FIELDS]) for key, item in value.items()}
+    return {key: project(value[key], sub) for key, sub in tree.items() if key in value}
+
+
+def api_fields(fields: Optional[str], include_id: bool = False, exclude=()) -> Optional[str]:
+    """Build the API `fields` parameter for a list call.
+
+    Args:
+        fields: Per-resource selector, or None for full responses
+        include_id: Always select items/id (batched lookups are matched by ID)
+        exclude: Top-level fields added locally rather than by this call
+
+    Returns:
+        A selector over the whole list response, or None
+    """
+    if not fields or fields == ALL_FIELDS:
+        return None
+    tree = parse_fields(fields)
+    for name in exclude:
+        tree.pop(name, None)
+    if include_id:
+        tree["id"] = True
+    return f"items({to_selector(tree)}),nextPageToken,pageInfo"
+
+
+def project_result(tool: str, result: dict, fields: Optional[str]) -> dict:
+    """Apply a per-resource selector to a tool result's data.
+
+    Returns a new result dict; the input is not modified.
+    """
+    if not fields or fields == ALL_FIELDS or result.get("data") is None:
+        return result
+    tree = parse_fields(fields)
+    data = result["data"]
+    if tool in ("youtube_get_playlist", "youtube_get_channel_videos"):
+        data = {**data, "items": project(data.get("items", []), tree)}
+    elif tool == "youtube_search_transcripts":
+        data = {**data, "hits": project(data.get("hits", []), tree)}
+    elif tool in ("youtube_get_videos", "youtube_get_transcripts"):
+        # Keep {"id", "error"} markers for IDs that could not be fetched
+        data = [item if "error" in item else project(item, tree) for item in data]
+    else:
+        data = project(data, tree)
+    return {**result, "data": data}
+
+
+class ProjectionStats:
+    """Bytes of result data before and after local projection, per tool.
+
+    Recorded only when a projection is served from a cached full response:
+    live results already had the same selector applied by the API as its
+    `fields` mask, so measuring them would cost two serializations per call
+    for a saving of roughly nothing.
+    """
+
+    def __init__(self):
+        self.by_tool: Dict[str, Dict[str, int]] = {}
+
+    def record(self, tool: str, before: dict, after: dict):
+        entry = self.by_tool.setdefault(tool, {"calls": 0, "bytesIn": 0, "bytesOut": 0})
+        entry["calls"] += 1
+        entry["bytesIn"] += payload_size(before)
+        entry["bytesOut"] += payload_size(after)
+
+    def stats(self) -> dict:
+        return {
+            tool: {**entry, "localBytesSaved": entry["bytesIn"] - entry["bytesOut"]}
+            for tool, entry in self.by_tool.items()
+        }
+
+
+def payload_size(value) -> int:
+    """Size of a value as compact JSON, in bytes."""
+    return len(json.dumps(value, separators=(",", ":"), default=str).encode("utf-8"))
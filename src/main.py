@@ -1,26 +1,95 @@
 """MCP Server entry point - YouTube MCP Server."""
 import asyncio
+import json
+import logging
+import os
 import mcp.types as types
 from mcp.server import Server
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from src.cache import get_response_cache
+from src.channel_handles import get_channel_handles
+from src.config import get_config
+from src.executor import run_blocking
+from src.fields import ALL_FIELDS, ProjectionStats, default_fields, parse_fields, project_result
+from src.quota import get_quota_accountant, start_call
+from src.rate_limiter import get_rate_limiter
+from src.singleflight import SingleFlight
+from src.youtube_client import client_stats, get_youtube_client
+
+logger = logging.getLogger(__name__)
 
 server = Server("youtube-connector-mcp")
 
 # Import all tools
 from src.tools.search import youtube_search, SearchArgs
-from src.tools.video import youtube_get_video, GetVideoArgs
-from src.tools.transcript import youtube_get_transcript, GetTranscriptArgs
+from src.tools.video import youtube_get_video, youtube_get_videos, GetVideoArgs, GetVideosArgs, video_coalescer
+from src.tools.transcript import (
+    youtube_get_transcript, youtube_get_transcripts, youtube_search_transcripts,
+    GetTranscriptArgs, GetTranscriptsArgs, SearchTranscriptsArgs,
+    transcript_search, transcript_stats
+)
 from src.tools.playlist import youtube_get_playlist, youtube_list_playlists, GetPlaylistArgs, ListPlaylistsArgs
 from src.tools.comments import youtube_get_comments, GetCommentsArgs
-from src.tools.channel import youtube_get_channel, GetChannelArgs
+from src.tools.channel import youtube_get_channel, GetChannelArgs, channel_coalescer
+from src.tools.channel_videos import youtube_get_channel_videos, GetChannelVideosArgs
+
+
+TOOL_ARGS = {
+    "youtube_search": SearchArgs,
+    "youtube_get_video": GetVideoArgs,
+    "youtube_get_videos": GetVideosArgs,
+    "youtube_get_channel": GetChannelArgs,
+    "youtube_get_channel_videos": GetChannelVideosArgs,
+    "youtube_get_transcript": GetTranscriptArgs,
+    "youtube_get_transcripts": GetTranscriptsArgs,
+    "youtube_search_transcripts": SearchTranscriptsArgs,
+    "youtube_get_playlist": GetPlaylistArgs,
+    "youtube_list_playlists": ListPlaylistsArgs,
+    "youtube_get_comments": GetCommentsArgs,
+}
+
+STATS_URI = "youtube://server/stats"
+
+# Identical concurrent calls (same tool, same normalized arguments) share one fetch
+singleflight = SingleFlight()
+projections = ProjectionStats()
+
+
+def server_stats():
+    """Collect runtime metrics for the stats resource."""
+    return {
+        "client": client_stats(),
+        "cache": get_response_cache().stats(),
+        "singleflight": singleflight.stats(),
+        "rateLimit": get_rate_limiter().stats(),
+        "quota": get_quota_accountant().stats(),
+        "localProjection": projections.stats(),
+        "transcripts": transcript_stats(),
+        "transcriptSearch": transcript_search.stats(),
+        "channelHandles": get_channel_handles().stats(),
+        "coalescing": {
+            "videos": video_coalescer.stats(),
+            "channels": channel_coalescer.stats(),
+        },
+    }
 
 
 @server.list_resources()
 async def list_resources():
-    return []
+    return [
+        types.Resource(
+            uri=STATS_URI,
+            name="server-stats",
+            description="Runtime metrics: client build, cache, single-flight, coalescing, rate limiter and quota usage",
+            mimeType="application/json"
+        )
+    ]
 
 
 @server.read_resource()
 async def read_resource(uri):
+    if str(uri) == STATS_URI:
+        return [ReadResourceContents(content=json.dumps(server_stats()), mime_type="application/json")]
     raise ValueError(f"Resource not found: {uri}")
 
 
@@ -38,16 +107,36 @@ async def list_tools():
             description="Get detailed information about a YouTube video",
             inputSchema=GetVideoArgs.model_json_schema()
         ),
+        types.Tool(
+            name="youtube_get_videos",
+            description="Get details for many YouTube videos in one call (50 IDs per API request)",
+            inputSchema=GetVideosArgs.model_json_schema()
+        ),
         types.Tool(
             name="youtube_get_channel",
             description="Get channel information",
             inputSchema=GetChannelArgs.model_json_schema()
         ),
+        types.Tool(
+            name="youtube_get_channel_videos",
+            description="List a channel's uploaded videos via its uploads playlist (1 quota unit per 50 videos)",
+            inputSchema=GetChannelVideosArgs.model_json_schema()
+        ),
         types.Tool(
             name="youtube_get_transcript",
             description="Get transcript/captions for a YouTube video",
             inputSchema=GetTranscriptArgs.model_json_schema()
         ),
+        types.Tool(
+            name="youtube_get_transcripts",
+            description="Get transcripts for many videos, or a playlist's videos, in one call",
+            inputSchema=GetTranscriptsArgs.model_json_schema()
+        ),
+        types.Tool(
+            name="youtube_search_transcripts",
+            description="Find where keywords are mentioned in loaded transcripts (timestamped passages, no API quota)",
+            inputSchema=SearchTranscriptsArgs.model_json_schema()
+        ),
         types.Tool(
             name="youtube_get_playlist",
             description="Get playlist details and video list",
@@ -68,69 +157,238 @@ async def list_tools():
 
 @server.call_tool()
 async def call_tool(name, arguments):
-    """Route tool calls to appropriate functions."""
+    """Route tool calls to appropriate functions.
+
+    Repeats are served from cache (negative answers such as NotFound for a
+    short TTL) and identical concurrent calls share one
+    fetch. Results carry the quota spent by the call and the budget left today.
+    """
+    args_model = TOOL_ARGS.get(name)
+    if args_model is None:
+        raise ValueError(f"Unknown tool: {name}")
+    args = args_model(**(arguments or {}))
+
+    fields = resolve_fields(name, args)
+    call_units = start_call(name)
+    cache = get_response_cache()
+    normalized = args.model_dump()
+    key = cache.make_key(name, normalized)
+    keys = [key]
+    if fields is not None:
+        # A cached full response can answer any projection
+        keys.append(cache.make_key(name, {**normalized, "fields": ALL_FIELDS}))
+    found_key, result = await cache.aget_first(keys)
+
+    if result is not None and found_key != key:
+        full = result
+        result = project_result(name, full, fields)
+        projections.record(name, full["data"], result["data"])
+
+    if result is None:
+        async def fetch():
+            raw = await dispatch_tool(name, args, fields)
+            result = project_result(name, raw, fields)
+            await cache.aset(key, result, cache.ttl_for_result(name, normalized, result))
+            return result
+
+        result = await singleflight.do(key, fetch)
+
+    # Copy: single-flight waiters share the same result object
+    quota = get_quota_accountant().remaining(name)
+    quota["callCost"] = call_units[0]
+    return {**result, "quota": quota}
+
+
+def resolve_fields(name, args):
+    """Fields selector for a call: the caller's, or the tool's slim default.
+
+    Returns:
+        A validated selector, or None for full resources
+
+    Raises:
+        ValueError: If the selector is malformed
+    """
+    fields = args.fields
+    if fields is None:
+        if name == "youtube_get_playlist" and args.all_pages:
+            # Items are already compact
+            return None
+        fields = default_fields(name, getattr(args, "part", None))
+    if fields is None or fields == ALL_FIELDS:
+        return None
+    parse_fields(fields)
+    return fields
+
+
+def progress_reporter():
+    """Progress callback for the current request, or None if none was requested.
+
+    Clients opt in by sending a progressToken in the request's _meta.
+    """
+    try:
+        ctx = server.request_context
+    except LookupError:
+        return None
+    token = ctx.meta.progressToken if ctx.meta is not None else None
+    if token is None:
+        return None
+
+    async def report(progress, total=None, message=None):
+        if message is None:
+            await ctx.session.send_progress_notification(token, progress, total)
+        else:
+            await ctx.session.send_progress_notification(token, progress, total, message=message)
+
+    return report
+
+
+async def dispatch_tool(name, args, fields=None):
+    """Call the tool function for already-validated arguments."""
     if name == "youtube_search":
-        args = SearchArgs(**arguments)
         return await youtube_search(
             query=args.query,
             max_results=args.max_results,
             order=args.order,
-            type=args.type
+            type=args.type,
+            page_token=args.page_token,
+            pages=args.pages,
+            enrich=args.enrich,
+            fields=fields
         )
     elif name == "youtube_get_video":
-        args = GetVideoArgs(**arguments)
         return await youtube_get_video(
             video_id=args.video_id,
-            part=args.part
+            part=args.part,
+            fields=fields
+        )
+    elif name == "youtube_get_videos":
+        return await youtube_get_videos(
+            video_ids=args.video_ids,
+            part=args.part,
+            fields=fields
         )
     elif name == "youtube_get_channel":
-        args = GetChannelArgs(**arguments)
         return await youtube_get_channel(
             channel_id=args.channel_id,
-            username=args.username
+            username=args.username,
+            fields=fields
+        )
+    elif name == "youtube_get_channel_videos":
+        return await youtube_get_channel_videos(
+            channel_id=args.channel_id,
+            username=args.username,
+            limit=args.limit,
+            published_after=args.published_after,
+            page_token=args.page_token,
+            enrich=args.enrich,
+            progress=progress_reporter()
         )
     elif name == "youtube_get_transcript":
-        args = GetTranscriptArgs(**arguments)
         return await youtube_get_transcript(
             video_id=args.video_id,
-            language=args.language
+            language=args.language,
+            include_tracks=args.include_tracks,
+            start_time=args.start_time,
+            end_time=args.end_time,
+            offset=args.offset,
+            limit=args.limit,
+            include_text=args.include_text,
+            include_segments=args.include_segments,
+            format=args.format,
+            chunk_chars=args.chunk_chars,
+            chunk_pause=args.chunk_pause
+        )
+    elif name == "youtube_get_transcripts":
+        return await youtube_get_transcripts(
+            video_ids=args.video_ids,
+            playlist_id=args.playlist_id,
+            language=args.language,
+            max_videos=args.max_videos,
+            include_text=args.include_text,
+            include_segments=args.include_segments,
+            format=args.format,
+            chunk_chars=args.chunk_chars,
+            chunk_pause=args.chunk_pause,
+            concurrency=args.concurrency,
+            timeout=args.timeout,
+            progress=progress_reporter()
+        )
+    elif name == "youtube_search_transcripts":
+        return await youtube_search_transcripts(
+            query=args.query,
+            video_ids=args.video_ids,
+            language=args.language,
+            limit=args.limit
         )
     elif name == "youtube_get_playlist":
-        args = GetPlaylistArgs(**arguments)
         return await youtube_get_playlist(
             playlist_id=args.playlist_id,
-            max_results=args.max_results
+            max_results=args.max_results,
+            page_token=args.page_token,
+            all_pages=args.all_pages,
+            limit=args.limit,
+            progress=progress_reporter(),
+            fields=fields
         )
     elif name == "youtube_list_playlists":
-        args = ListPlaylistsArgs(**arguments)
         return await youtube_list_playlists(
             channel_id=args.channel_id,
-            max_results=args.max_results
+            max_results=args.max_results,
+            fields=fields,
+            username=args.username
         )
     elif name == "youtube_get_comments":
-        args = GetCommentsArgs(**arguments)
         return await youtube_get_comments(
             video_id=args.video_id,
             max_results=args.max_results,
-            page_token=args.page_token
+            page_token=args.page_token,
+            crawl=args.crawl,
+            chunk_size=args.chunk_size,
+            progress=progress_reporter(),
+            fields=fields
         )
     else:
         raise ValueError(f"Unknown tool: {name}")
 
 
+async def prebuild_client():
+    """Build the shared YouTube client before the first tool call.
+
+    Returns:
+        Seconds spent building the client, or None if it could not be built
+    """
+    try:
+        client = get_youtube_client()
+        return await run_blocking(client.warm_up)
+    except Exception as e:
+        logger.warning("Skipping YouTube client pre-build: %s", e)
+        return None
+
+
 async def main():
     from mcp.server.stdio import stdio_server
 
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    if get_config(require_api_key=False).prebuild_client:
+        await prebuild_client()
+    # Starts loading today's quota usage from the cache file in the background
+    get_quota_accountant()
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        # Quota charges are written in batches; keep the last ones
+        get_quota_accountant().flush()
 
 
 def cli_main():
     """Entry point for CLI - runs async main."""
+    # stdout carries the MCP protocol, so logs go to stderr
+    logging.basicConfig(level=os.getenv("YOUTUBE_LOG_LEVEL", "WARNING").upper())
     asyncio.run(main())
 
 
@@ -0,0 +1,264 @@
+"""Quota-unit accounting for YouTube Data API calls.
+
+The Data API charges very different amounts per method (search.list costs
+100 units, videos.list costs 1) against a daily budget that resets at
+midnight Pacific time. Every request is charged here before it is sent, so
+per-tool and global budgets can be enforced and reported back to agents.
+
+With a store, charges are counted in memory and written in batches from the
+store's own thread, so the event loop never waits on SQLite per request.
+"""
+import contextvars
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from src.cache import get_response_cache
+from src.config import get_config
+
+try:
+    from zoneinfo import ZoneInfo
+    QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+except Exception:
+    # No tz database (e.g. Windows without tzdata): Pacific standard time
+    QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+# Units per call, keyed by googleapiclient method ID
+QUOTA_COSTS: Dict[str, int] = {
+    "youtube.search.list": 100,
+    "youtube.captions.list": 50,
+    "youtube.videos.list": 1,
+    "youtube.channels.list": 1,
+    "youtube.playlists.list": 1,
+    "youtube.playlistItems.list": 1,
+    "youtube.commentThreads.list": 1,
+    "youtube.comments.list": 1,
+}
+DEFAULT_COST = 1
+
+# Seconds between writing pending charges to the store and reading back
+# what other server processes have spent
+QUOTA_SYNC_INTERVAL = 5.0
+
+# Tool whose call is being served; set by call_tool, inherited by tasks it starts
+current_tool: contextvars.ContextVar[str] = contextvars.ContextVar("current_tool", default="unknown")
+# Units charged while serving the current tool call
+_call_units: contextvars.ContextVar[Optional[List[int]]] = contextvars.ContextVar("call_units", default=None)
+
+
+class QuotaExceeded(Exception):
+    """Raised when a request would exceed the daily global or per-tool budget."""
+
+
+class QuotaAccountant:
+    """Track quota units spent per day and per tool, and enforce budgets.
+
+    Args:
+        daily_budget: Units allowed per day across all tools (0 = unlimited)
+        tool_budgets: Units allowed per day for individual tools
+        store: Optional DiskCache; usage is then shared with other server
+            processes and survives restarts
+        sync_interval: Seconds between store syncs
+    """
+
+    def __init__(self, daily_budget: int, tool_budgets: Optional[Dict[str, int]] = None, store=None,
+                 sync_interval: float = QUOTA_SYNC_INTERVAL):
+        self.daily_budget = daily_budget
+        self.tool_budgets = dict(tool_budgets or {})
+        self.store = store
+        self.sync_interval = sync_interval
+        self._day = None
+        self._usage: Dict[str, int] = {}
+        # Units charged since the last sync, not yet in the store
+        self._pending: Dict[str, int] = {}
+        self._synced_at = 0.0
+        self._syncing = False
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.rejected = 0
+        if store is not None:
+            # Load today's usage in the background before the first request
+            self._syncing = True
+            store.submit(self.flush)
+
+    @staticmethod
+    def cost_of(method_id) -> int:
+        """Quota units charged for one call to the given method."""
+        return QUOTA_COSTS.get(method_id, DEFAULT_COST) if isinstance(method_id, str) else DEFAULT_COST
+
+    @staticmethod
+    def today() -> str:
+        """The current quota day (dates roll over at midnight Pacific time)."""
+        return datetime.now(QUOTA_TIMEZONE).date().isoformat()
+
+    def _current_usage(self) -> Dict[str, int]:
+        """Today's usage; call with _lock held. Never touches the store inline."""
+        day = self.today()
+        if day != self._day:
+            if self.store is not None and self._pending:
+                self.store.submit(self._write, self._day, self._pending)
+            self._day = day
+            self._usage = {}
+            self._pending = {}
+            if self.store is not None and not self._syncing:
+                # Pick up what other processes have already spent today
+                self._syncing = True
+                self.store.submit(self.flush)
+        return self._usage
+
+    def _write(self, day: str, pending: Dict[str, int]):
+        for tool, units in pending.items():
+            if units:
+                self.store.record_quota(day, tool, units)
+
+    def _charge(self, tool: str, units: int):
+        """Apply units to the in-memory usage and queue them for the store."""
+        usage = self._current_usage()
+        usage[tool] = max(usage.get(tool, 0) + units, 0)
+        if self.store is None:
+            return
+        self._pending[tool] = self._pending.get(tool, 0) + units
+        if not self._syncing and time.monotonic() - self._synced_at >= self.sync_interval:
+            self._syncing = True
+            self.store.submit(self.flush)
+
+    def flush(self):
+        """Write pending charges to the store and pick up other processes' usage.
+
+        Runs on the store's thread at startup, at each quota day rollover
+        and every sync_interval seconds while charges are made; call it
+        directly before exit so no charges are lost.
+        """
+        if self.store is None:
+            return
+        with self._flush_lock:
+            with self._lock:
+                self._current_usage()
+                day, pending = self._day, self._pending
+                self._pending = {}
+            self._write(day, pending)
+            stored = self.store.quota_usage(day)
+            with self._lock:
+                self._syncing = False
+                self._synced_at = time.monotonic()
+                if stored is not None and day == self._day:
+                    usage = dict(stored)
+                    for tool, units in self._pending.items():
+                        usage[tool] = max(usage.get(tool, 0) + units, 0)
+                    self._usage = usage
+                if self._pending and self.sync_interval <= 0:
+                    # Charged while this sync ran
+                    self._syncing = True
+                    self.store.submit(self.flush)
+
+    def reserve(self, method_id, tool: Optional[str] = None) -> int:
+        """Charge one call to method_id against the budgets.
+
+        Returns:
+            Units charged
+
+        Raises:
+            QuotaExceeded: If the call would exceed the global or tool budget
+        """
+        tool = tool or current_tool.get()
+        cost = self.cost_of(method_id)
+        with self._lock:
+            usage = self._current_usage()
+            used = sum(usage.values())
+            if self.daily_budget and used + cost > self.daily_budget:
+                self.rejected += 1
+                raise QuotaExceeded(
+                    f"Daily quota budget exhausted: {method_id} costs {cost} units, "
+                    f"{max(self.daily_budget - used, 0)} of {self.daily_budget} left today"
+                )
+            tool_budget = self.tool_budgets.get(tool)
+            tool_used = usage.get(tool, 0)
+            if tool_budget is not None and tool_used + cost > tool_budget:
+                self.rejected += 1
+                raise QuotaExceeded(
+                    f"Daily quota budget for {tool} exhausted: {method_id} costs {cost} units, "
+                    f"{max(tool_budget - tool_used, 0)} of {tool_budget} left today"
+                )
+            self._charge(tool, cost)
+        units = _call_units.get()
+        if units is not None:
+            units[0] += cost
+        return cost
+
+    def refund(self, units: int, tool: Optional[str] = None):
+        """Give back units charged for a request that was never sent."""
+        tool = tool or current_tool.get()
+        with self._lock:
+            self._charge(tool, -units)
+        call_units = _call_units.get()
+        if call_units is not None:
+            call_units[0] -= units
+
+    def remaining(self, tool: Optional[str] = None) -> dict:
+        """Budget metadata for tool results."""
+        with self._lock:
+            usage = self._current_usage()
+            used = sum(usage.values())
+            info = {
+                "day": self._day,
+                "used": used,
+                "budget": self.daily_budget or None,
+                "remaining": max(self.daily_budget - used, 0) if self.daily_budget else None,
+            }
+            if tool is not None:
+                tool_budget = self.tool_budgets.get(tool)
+                tool_used = usage.get(tool, 0)
+                info["tool"] = {
+                    "name": tool,
+                    "used": tool_used,
+                    "budget": tool_budget,
+                    "remaining": max(tool_budget - tool_used, 0) if tool_budget is not None else None,
+                }
+        return info
+
+    def stats(self) -> dict:
+        """Usage per tool for the current day."""
+        info = self.remaining()
+        with self._lock:
+            info["byTool"] = dict(self._usage)
+        info["rejected"] = self.rejected
+        return info
+
+
+def start_call(tool: str) -> List[int]:
+    """Mark the current context as serving a tool call.
+
+    Returns:
+        A one-element list that accumulates units charged during the call
+    """
+    units = [0]
+    current_tool.set(tool)
+    _call_units.set(units)
+    return units
+
+
+_accountant: Optional[QuotaAccountant] = None
+_accountant_lock = threading.Lock()
+
+
+def get_quota_accountant() -> QuotaAccountant:
+    """Get or create the process-wide quota accountant from configuration."""
+    global _accountant
+    if _accountant is None:
+        with _accountant_lock:
+            if _accountant is None:
+                config = get_config(require_api_key=False)
+                _accountant = QuotaAccountant(
+                    daily_budget=config.quota_daily_budget,
+                    tool_budgets=config.quota_tool_budgets,
+                    store=get_response_cache().disk
+                )
+    return _accountant
+
+
+def reset_quota_accountant():
+    """Drop the shared accountant so the next call recreates it from config."""
+    global _accountant
+    with _accountant_lock:
+        _accountant = None
@@ -0,0 +1,137 @@
+"""Token-bucket rate limiting for YouTube Data API requests.
+
+All tools share one bucket sized by YOUTUBE_RATE_LIMIT requests per
+YOUTUBE_RATE_LIMIT_PERIOD. Bursts beyond the bucket are queued (in arrival
+order) rather than sent straight to the API, up to a bounded wait.
+"""
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from src.config import get_config
+
+PERIOD_SECONDS = {"second": 1.0, "minute": 60.0}
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request would have to wait longer than the allowed maximum."""
+
+
+class TokenBucket:
+    """Token bucket that makes callers wait for a token instead of failing.
+
+    Each caller reserves the next token immediately (the balance may go
+    negative) and sleeps until that token has been refilled, which keeps
+    waiters in FIFO order without a lock.
+
+    Args:
+        rate: Requests allowed per period (0 disables limiting)
+        period: Period length in seconds
+        burst: Bucket capacity; defaults to one period's worth of requests
+        max_wait: Longest a caller may queue before RateLimitExceeded
+    """
+
+    def __init__(self, rate: float, period: float = 1.0, burst: Optional[float] = None, max_wait: float = 30.0):
+        self.rate = rate
+        self.period = period
+        self.capacity = burst if burst is not None else rate
+        self.max_wait = max_wait
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self.queued = 0
+        self.acquired = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.longest_wait = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0
+
+    def _refill(self):
+        now = time.monotonic()
+        per_second = self.rate / self.period
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * per_second)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Wait for a token.
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitExceeded: If the wait would exceed max_wait
+        """
+        if not self.enabled:
+            return 0.0
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            self.acquired += 1
+            return 0.0
+
+        wait = -self._tokens * self.period / self.rate
+        if wait > self.max_wait:
+            self._tokens += 1
+            self.rejected += 1
+            raise RateLimitExceeded(
+                f"Rate limit queue is full: request would wait {wait:.1f}s "
+                f"(limit {self.rate:g} requests per {self.period:g}s, max wait {self.max_wait:g}s)"
+            )
+
+        self.queued += 1
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            self._tokens += 1
+            raise
+        finally:
+            self.queued -= 1
+        self.acquired += 1
+        self.total_wait += wait
+        self.longest_wait = max(self.longest_wait, wait)
+        return wait
+
+    def stats(self) -> dict:
+        """Queue depth, wait times and counters."""
+        if self.enabled:
+            self._refill()
+        return {
+            "enabled": self.enabled,
+            "rate": self.rate,
+            "periodSeconds": self.period,
+            "availableTokens": round(max(self._tokens, 0.0), 2),
+            "queueDepth": self.queued,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "totalWaitSeconds": round(self.total_wait, 3),
+            "longestWaitSeconds": round(self.longest_wait, 3),
+        }
+
+
+_limiter: Optional[TokenBucket] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket:
+    """Get or create the process-wide rate limiter from configuration."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                config = get_config(require_api_key=False)
+                _limiter = TokenBucket(
+                    rate=config.rate_limit,
+                    period=PERIOD_SECONDS[config.rate_limit_period],
+                    max_wait=config.rate_limit_max_wait
+                )
+    return _limiter
+
+
+def reset_rate_limiter():
+    """Drop the shared limiter so the next call recreates it from config."""
+    global _limiter
+    with _limiter_lock:
+        _limiter = None
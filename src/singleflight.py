@@ -0,0 +1,61 @@
+"""Single-flight deduplication of identical in-flight requests.
+
+If two MCP calls ask for the same thing (same tool, same normalized
+arguments) while the first is still running, the second waits for the
+first call's result instead of issuing its own fetch.
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Share one running call among all concurrent callers with the same key."""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.collapsed = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable]):
+        """Run fn() unless a call with the same key is already in flight.
+
+        Every waiter receives the same result object (or exception).
+        """
+        self.calls += 1
+        future = self._inflight.get(key)
+        if future is not None:
+            self.collapsed += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The leading call was cancelled, not us: run it ourselves
+                return await self.do(key, fn)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fn()
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # The leader re-raises; waiters (if any) get the same exception
+                future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def stats(self) -> dict:
+        """Call counters; collapsed calls shared another call's fetch."""
+        return {
+            "calls": self.calls,
+            "collapsed": self.collapsed,
+            "inFlight": len(self._inflight),
+        }
@@ -1,40 +1,105 @@
 """YouTube Channel Tool."""
-from typing import Optional
-from src.config import get_config
-from src.youtube_client import YouTubeClient
+from typing import Dict, List, Optional
+from src.youtube_client import get_youtube_client
+from src.channel_handles import get_channel_handles, lookup_params, normalize_handle
+from src.executor import execute
+from src.coalescer import RequestCoalescer, fetch_by_id
+from src.fields import FIELDS_DESCRIPTION, api_fields
+from src.singleflight import SingleFlight
 from pydantic import BaseModel, Field
 
 
 class GetChannelArgs(BaseModel):
     """Arguments for getting channel details."""
     channel_id: Optional[str] = Field(default=None, description="YouTube channel ID")
-    username: Optional[str] = Field(default=None, description="Channel username (e.g., @channel)")
+    username: Optional[str] = Field(default=None, description="Channel handle (e.g., @channel) or legacy username")
+    fields: Optional[str] = Field(default=None, description=FIELDS_DESCRIPTION)
 
 
-_client: Optional[YouTubeClient] = None
+CHANNEL_PART = "snippet,statistics,contentDetails"
 
 
-def _get_client() -> YouTubeClient:
-    """Get or create YouTube client singleton."""
-    global _client
-    if _client is None:
-        config = get_config()
-        _client = YouTubeClient(api_key=config.api_key)
-    return _client
+async def fetch_channels_by_id(channel_ids: List[str], part: str = CHANNEL_PART,
+                               fields: Optional[str] = None) -> Dict[str, dict]:
+    """Fetch channel resources with one channels.list call per 50 IDs.
+
+    Args:
+        channel_ids: Channel IDs (duplicates are fetched once)
+        part: Comma-separated parts to retrieve
+        fields: Optional per-channel fields selector
+
+    Returns:
+        Mapping of channel ID to its resource or exception; missing IDs are absent
+    """
+    client = get_youtube_client()
+    return await fetch_by_id(
+        client.client.channels().list, channel_ids, part,
+        fields=api_fields(fields, include_id=True)
+    )
+
+
+# Concurrent lookups by channel ID for the same fields share one channels.list call
+channel_coalescer = RequestCoalescer(
+    lambda fields, channel_ids: fetch_channels_by_id(channel_ids, CHANNEL_PART, fields)
+)
+
+
+# Concurrent first lookups of the same name share one channels.list call
+_lookup_flight = SingleFlight()
+
+
+async def lookup_channel(name: str, part: str = CHANNEL_PART, fields: Optional[str] = None) -> Optional[dict]:
+    """Fetch a channel by handle or legacy username and remember its ID.
+
+    Args:
+        name: "@handle" or legacy username
+        part: Comma-separated parts to retrieve
+        fields: Optional per-channel fields selector
+
+    Returns:
+        The channel resource, or None if no channel has that name
+    """
+    async def fetch():
+        client = get_youtube_client()
+        for params in lookup_params(name):
+            response = await execute(client.client.channels().list(
+                part=part,
+                fields=api_fields(fields, include_id=True),
+                **params
+            ))
+            items = response.get("items")
+            if items:
+                await get_channel_handles().aset(name, items[0]["id"])
+                return items[0]
+        return None
+
+    return await _lookup_flight.do((normalize_handle(name), part, fields), fetch)
+
+
+async def resolve_channel_id(name: str) -> Optional[str]:
+    """Channel ID for a handle or legacy username.
+
+    Names resolved before are answered from the handle map without a request.
+    """
+    channel_id = await get_channel_handles().aget(name)
+    if channel_id is None:
+        item = await lookup_channel(name, part="id", fields="id")
+        channel_id = item["id"] if item is not None else None
+    return channel_id
 
 
-async def youtube_get_channel(channel_id: str = None, username: str = None):
+async def youtube_get_channel(channel_id: str = None, username: str = None, fields: Optional[str] = None):
     """Get channel information.
 
     Args:
         channel_id: YouTube channel ID (24 characters)
-        username: Channel username starting with @
+        username: Channel handle ("@name") or legacy username; resolved
+            once, then looked up by channel ID
+        fields: Optional fields selector passed to the API
 
     Returns:
         Dictionary with channel data or error
     """
-    client = _get_client()
-
     if not channel_id and not username:
         return {
             "data": None,
@@ -46,20 +111,15 @@ async def youtube_get_channel(channel_id: str = None, username: str = None):
         }
 
     try:
-        params = {
-            "part": "snippet,statistics,contentDetails"
-        }
-
-        if username:
-            # Convert username to channel ID
-            # For API v3, we use 'forUsername' parameter
-            params["forUsername"] = username.lstrip("@")
-        else:
-            params["id"] = channel_id
-
-        response = client.client.channels().list(**params).execute()
-
-        if not response.get("items"):
+        if username and not channel_id:
+            # Names seen before are looked up by ID, which batches with other lookups
+            channel_id = await get_channel_handles().aget(username)
+            if channel_id is None:
+                item = await lookup_channel(username, CHANNEL_PART, fields)
+        if channel_id:
+            item = await channel_coalescer.load(fields, channel_id)
+
+        if item is None:
             return {
                 "data": None,
                 "error": {
@@ -70,7 +130,7 @@ async def youtube_get_channel(channel_id: str = None, username: str = None):
             }
 
         return {
-            "data": response["items"][0],
+            "data": item,
             "error": None,
             "pagination": None
         }
@@ -92,7 +152,8 @@ def register_channel_tools(server):
         args = GetChannelArgs(**arguments)
         return await youtube_get_channel(
             channel_id=args.channel_id,
-            username=args.username
+            username=args.username,
+            fields=args.fields
         )
 
     @server.list_tools()
@@ -0,0 +1,201 @@
+"""YouTube Channel Videos Tool."""
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+from src.cache import get_response_cache
+from src.fields import FIELDS_DESCRIPTION
+from src.tools.channel import channel_coalescer, resolve_channel_id
+from src.tools.playlist import ProgressCallback, iter_playlist_pages
+from src.tools.search import ENRICH_PART, merge_enrichment
+from src.tools.video import fetch_videos_by_id
+from pydantic import BaseModel, Field
+
+# Walking the uploads playlist costs 1 unit per 50 videos (plus 1 per 50 to
+# enrich), against 100 units per 50 results for search.list
+MAX_CHANNEL_VIDEOS = 1000
+UPLOADS_FIELDS = "id,contentDetails/relatedPlaylists/uploads"
+
+
+class GetChannelVideosArgs(BaseModel):
+    """Arguments for listing a channel's uploads."""
+    channel_id: Optional[str] = Field(default=None, description="YouTube channel ID")
+    username: Optional[str] = Field(default=None, description="Channel handle (e.g., @channel) or legacy username")
+    limit: int = Field(default=50, description=f"Maximum videos to return (1-{MAX_CHANNEL_VIDEOS})")
+    published_after: Optional[str] = Field(
+        default=None,
+        description="Only videos published after this ISO 8601 date or time; paging stops at the first older video"
+    )
+    page_token: Optional[str] = Field(default=None, description="Page token to continue from")
+    enrich: bool = Field(
+        default=True,
+        description="Add statistics and contentDetails to each video (one batched lookup per 50 videos)"
+    )
+    fields: Optional[str] = Field(default=None, description=FIELDS_DESCRIPTION)
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 date or time; naive values are taken as UTC.
+
+    Raises:
+        ValueError: If the value is not ISO 8601
+    """
+    parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+async def get_uploads_playlist_id(channel_id: str) -> Optional[str]:
+    """The ID of a channel's uploads playlist, cached like playlist details.
+
+    Returns:
+        The playlist ID, or None if the channel does not exist
+    """
+    cache = get_response_cache()
+    key = cache.make_key("youtube_channel_uploads", {"channel_id": channel_id})
+    cached = await cache.aget(key)
+    if cached is not None:
+        return cached["uploads"]
+
+    channel = await channel_coalescer.load(UPLOADS_FIELDS, channel_id)
+    if channel is None:
+        return None
+    uploads = channel.get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+    await cache.aset(key, {"uploads": uploads}, cache.ttl_for("youtube_channel_uploads"))
+    return uploads
+
+
+async def youtube_get_channel_videos(channel_id: Optional[str] = None, username: Optional[str] = None,
+                                     limit: int = 50, published_after: Optional[str] = None,
+                                     page_token: Optional[str] = None, enrich: bool = True,
+                                     progress: Optional[ProgressCallback] = None):
+    """List a channel's uploads, newest first.
+
+    Walks the channel's uploads playlist rather than searching, so each 50
+    videos cost 1 quota unit instead of 100. Each page's enrichment lookup
+    runs while the next page is fetched.
+
+    Args:
+        channel_id: YouTube channel ID
+        username: Channel handle or legacy username, used without channel_id
+        limit: Maximum videos to return
+        published_after: Stop at the first video published before this
+            ISO 8601 date or time
+        page_token: Page token to continue from
+        enrich: Merge statistics and contentDetails into each video
+        progress: Optional callback invoked after each page
+
+    Returns:
+        Dictionary with the channel ID, uploads playlist ID and compact
+        video items, or error
+    """
+    if not channel_id and not username:
+        return {
+            "data": None,
+            "error": {
+                "code": "InvalidInput",
+                "message": "Either channel_id or username is required"
+            },
+            "pagination": None
+        }
+    try:
+        cutoff = parse_timestamp(published_after) if published_after else None
+    except ValueError:
+        return {
+            "data": None,
+            "error": {
+                "code": "InvalidInput",
+                "message": f"published_after must be an ISO 8601 date or time, got {published_after!r}"
+            },
+            "pagination": None
+        }
+
+    lookups = []
+    try:
+        if not channel_id:
+            channel_id = await resolve_channel_id(username)
+        uploads = await get_uploads_playlist_id(channel_id) if channel_id else None
+        if uploads is None:
+            return {
+                "data": None,
+                "error": {"code": "NotFound", "message": f"Channel not found: {channel_id or username}"},
+                "pagination": None
+            }
+
+        limit = max(1, min(limit, MAX_CHANNEL_VIDEOS))
+        items = []
+        next_page_token = None
+        total = 0
+        async for page in iter_playlist_pages(uploads, limit=limit, page_token=page_token):
+            page_items = page["items"]
+            next_page_token = page["nextPageToken"]
+            total = page["totalResults"]
+            if cutoff is not None:
+                kept = [
+                    item for item in page_items
+                    if not item["publishedAt"] or parse_timestamp(item["publishedAt"]) > cutoff
+                ]
+                if len(kept) < len(page_items):
+                    # Uploads are newest first: everything after this is older
+                    page_items, next_page_token = kept, None
+            items.extend(page_items)
+
+            video_ids = [item["videoId"] for item in page_items if item["videoId"]]
+            if enrich and video_ids:
+                lookups.append((page_items, asyncio.ensure_future(fetch_videos_by_id(video_ids, ENRICH_PART))))
+            if progress is not None:
+                await progress(len(items), min(total, limit) if total else None)
+            if next_page_token is None:
+                break
+
+        for page_items, lookup in lookups:
+            merge_enrichment(page_items, await lookup, lambda item: item.get("videoId"))
+
+        return {
+            "data": {
+                "channelId": channel_id,
+                "uploadsPlaylistId": uploads,
+                "items": items
+            },
+            "error": None,
+            "pagination": {
+                "nextPageToken": next_page_token,
+                "totalResults": total
+            }
+        }
+    except Exception as e:
+        return {
+            "data": None,
+            "error": {"code": type(e).__name__, "message": str(e)},
+            "pagination": None
+        }
+    finally:
+        for _, lookup in lookups:
+            if not lookup.done():
+                lookup.cancel()
+
+
+def register_channel_videos_tools(server):
+    """Register channel videos tools with MCP server."""
+    @server.call_tool()
+    async def call_youtube_get_channel_videos(name, arguments):
+        if name != "youtube_get_channel_videos":
+            return None
+
+        args = GetChannelVideosArgs(**arguments)
+        return await youtube_get_channel_videos(
+            channel_id=args.channel_id,
+            username=args.username,
+            limit=args.limit,
+            published_after=args.published_after,
+            page_token=args.page_token,
+            enrich=args.enrich
+        )
+
+    @server.list_tools()
+    async def list_channel_videos_tools():
+        return [{
+            "name": "youtube_get_channel_videos",
+            "description": "List a channel's uploaded videos via its uploads playlist",
+            "inputSchema": GetChannelVideosArgs.model_json_schema()
+        }]
@@ -1,43 +1,145 @@
 """YouTube Comments Tool."""
-from typing import Optional
-from src.config import get_config
-from src.youtube_client import YouTubeClient
+import asyncio
+from typing import AsyncIterator, Optional
+from src.youtube_client import get_youtube_client
+from src.executor import execute
+from src.fields import FIELDS_DESCRIPTION, api_fields
+from src.tools.playlist import ProgressCallback
 from pydantic import BaseModel, Field
 
+# Threads whose replies are being fetched at once during a crawl
+REPLY_CONCURRENCY = 8
+
 
 class GetCommentsArgs(BaseModel):
     """Arguments for getting comments."""
     video_id: str = Field(description="YouTube video ID")
     max_results: int = Field(default=20, description="Maximum comments (1-100)")
     page_token: Optional[str] = Field(default=None, description="Page token for pagination")
+    crawl: bool = Field(
+        default=False,
+        description="Walk all threads server-side with complete replies, returned in chunks"
+    )
+    chunk_size: int = Field(default=500, description="Maximum threads per crawl chunk")
+    fields: Optional[str] = Field(default=None, description=FIELDS_DESCRIPTION)
+
+
+async def fetch_all_replies(parent_id: str) -> list:
+    """Fetch every reply to a top-level comment via comments.list(parentId)."""
+    client = get_youtube_client()
+    replies = []
+    page_token = None
+    while True:
+        response = await execute(client.client.comments().list(
+            parentId=parent_id,
+            part="snippet",
+            maxResults=100,
+            pageToken=page_token
+        ))
+        replies.extend(response.get("items", []))
+        page_token = response.get("nextPageToken")
+        if not page_token:
+            return replies
+
+
+async def iter_comment_threads(video_id: str, limit: Optional[int] = None,
+                               page_token: Optional[str] = None) -> AsyncIterator[dict]:
+    """Walk a video's comment threads, completing truncated reply lists.
+
+    commentThreads.list only inlines a few replies per thread; threads with
+    more are completed with fetch_all_replies(), REPLY_CONCURRENCY at a time.
+    The next thread page is requested while the current page's replies are
+    being fetched.
 
+    Args:
+        video_id: YouTube video ID
+        limit: Stop after this many threads (None walks every thread)
+        page_token: Page to start from
 
-_client: Optional[YouTubeClient] = None
-
-
-def _get_client() -> YouTubeClient:
-    """Get or create YouTube client singleton."""
-    global _client
-    if _client is None:
-        config = get_config()
-        _client = YouTubeClient(api_key=config.api_key)
-    return _client
+    Yields:
+        Dicts with "items" (threads) and "nextPageToken"
+    """
+    client = get_youtube_client()
+    semaphore = asyncio.Semaphore(REPLY_CONCURRENCY)
+
+    def request_page(token, remaining):
+        return asyncio.ensure_future(execute(client.client.commentThreads().list(
+            part="snippet,replies",
+            videoId=video_id,
+            maxResults=100 if remaining is None else min(remaining, 100),
+            order="relevance",
+            pageToken=token
+        )))
+
+    async def complete_replies(thread):
+        inline = thread.get("replies", {}).get("comments", [])
+        if thread.get("snippet", {}).get("totalReplyCount", 0) > len(inline):
+            async with semaphore:
+                thread["replies"] = {"comments": await fetch_all_replies(thread["id"])}
+
+    remaining = limit
+    next_page = request_page(page_token, remaining)
+    try:
+        while next_page is not None:
+            response = await next_page
+            threads = response.get("items", [])
+            page_token = response.get("nextPageToken")
+            if remaining is not None:
+                remaining -= len(threads)
+            more = page_token and threads and (remaining is None or remaining > 0)
+            next_page = request_page(page_token, remaining) if more else None
+            await asyncio.gather(*(complete_replies(thread) for thread in threads))
+            yield {"items": threads, "nextPageToken": page_token}
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+async def _crawl_comments(video_id: str, chunk_size: int, page_token: Optional[str],
+                          progress: Optional[ProgressCallback]) -> dict:
+    """Collect one chunk of fully-replied threads."""
+    threads = []
+    next_page_token = None
+    async for page in iter_comment_threads(video_id, limit=max(chunk_size, 1), page_token=page_token):
+        threads.extend(page["items"])
+        next_page_token = page["nextPageToken"]
+        if progress is not None:
+            await progress(len(threads), None)
+    return {
+        "data": threads,
+        "error": None,
+        "pagination": {
+            "nextPageToken": next_page_token,
+            "totalResults": len(threads)
+        }
+    }
 
 
-async def youtube_get_comments(video_id: str, max_results: int = 20, page_token: str = None):
+async def youtube_get_comments(video_id: str, max_results: int = 20, page_token: str = None,
+                               crawl: bool = False, chunk_size: int = 500,
+                               progress: Optional[ProgressCallback] = None, fields: Optional[str] = None):
     """Get comments for a YouTube video.
 
     Args:
         video_id: 11-character YouTube video ID
         max_results: Maximum comments (1-100)
         page_token: Pagination token for next page
+        crawl: Walk threads server-side with complete replies; pass the
+            returned nextPageToken back to fetch the next chunk
+        chunk_size: Maximum threads per crawl chunk
+        progress: Optional callback invoked after each page in crawl mode
+        fields: Optional per-thread fields selector passed to the API (not in
+            crawl mode, which needs reply counts to complete threads)
 
     Returns:
         Dictionary with comments or error
     """
-    client = _get_client()
+    client = get_youtube_client()
 
     try:
+        if crawl:
+            return await _crawl_comments(video_id, chunk_size, page_token, progress)
+
         params = {
             "part": "snippet",
             "videoId": video_id,
@@ -47,8 +149,11 @@ async def youtube_get_comments(video_id: str, max_results: int = 20, page_token:
 
         if page_token:
             params["pageToken"] = page_token
+        mask = api_fields(fields)
+        if mask:
+            params["fields"] = mask
 
-        response = client.client.commentThreads().list(**params).execute()
+        response = await execute(client.client.commentThreads().list(**params))
 
         return {
             "data": response.get("items", []),
@@ -77,7 +182,10 @@ def register_comments_tools(server):
         return await youtube_get_comments(
             video_id=args.video_id,
             max_results=args.max_results,
-            page_token=args.page_token
+            page_token=args.page_token,
+            crawl=args.crawl,
+            chunk_size=args.chunk_size,
+            fields=args.fields
         )
 
     @server.list_tools()
@@ -1,61 +1,198 @@
 """YouTube Playlist Tools."""
-from typing import Optional
-from src.config import get_config
-from src.youtube_client import YouTubeClient
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Optional
+from src.youtube_client import get_youtube_client
+from src.cache import get_response_cache
+from src.executor import execute
+from src.fields import FIELDS_DESCRIPTION, api_fields
+from src.tools.channel import resolve_channel_id
 from pydantic import BaseModel, Field
 
+# Regular playlists hold at most 5000 videos; the bound also caps the
+# pages (1 quota unit each) a single all_pages call can walk
+MAX_PLAYLIST_ITEMS = 5000
+
 
 class GetPlaylistArgs(BaseModel):
     """Arguments for getting playlist details."""
     playlist_id: str = Field(description="YouTube playlist ID")
     max_results: int = Field(default=50, description="Maximum videos (1-50)")
+    page_token: Optional[str] = Field(default=None, description="Page token to continue from")
+    all_pages: bool = Field(
+        default=False,
+        description="Walk every page server-side; items are returned in compact form"
+    )
+    limit: int = Field(
+        default=1000,
+        description=f"Maximum videos when all_pages is set (1-{MAX_PLAYLIST_ITEMS})"
+    )
+    fields: Optional[str] = Field(default=None, description=FIELDS_DESCRIPTION)
+
+
+# Only what compact_playlist_item() reads, so full pages are never transferred
+COMPACT_ITEM_FIELDS = (
+    "nextPageToken,pageInfo/totalResults,"
+    "items(snippet(title,position,videoOwnerChannelId,videoOwnerChannelTitle,resourceId/videoId),"
+    "contentDetails(videoId,videoPublishedAt))"
+)
+
+# progress(items_so_far, total_items_or_None[, message])
+ProgressCallback = Callable[..., Awaitable[None]]
 
 
 class ListPlaylistsArgs(BaseModel):
     """Arguments for listing playlists."""
-    channel_id: Optional[str] = Field(default=None, description="Channel ID (required)")
+    channel_id: Optional[str] = Field(default=None, description="Channel ID (this or username is required)")
+    username: Optional[str] = Field(default=None, description="Channel handle (e.g., @channel) or legacy username")
     max_results: int = Field(default=25, description="Maximum playlists (1-50)")
+    fields: Optional[str] = Field(default=None, description=FIELDS_DESCRIPTION)
+
 
+async def get_playlist_details(playlist_id: str) -> dict:
+    """Fetch playlist metadata, cached separately from the item pages.
 
-_client: Optional[YouTubeClient] = None
+    Paging through a playlist repeats the same details lookup for every
+    page; caching it on its own means only the first page pays for it.
 
+    Args:
+        playlist_id: YouTube playlist ID
+
+    Returns:
+        The playlist resource
+    """
+    cache = get_response_cache()
+    key = cache.make_key("youtube_playlist_details", {"playlist_id": playlist_id})
+    cached = await cache.aget(key)
+    if cached is not None:
+        return cached
 
-def _get_client() -> YouTubeClient:
-    """Get or create YouTube client singleton."""
-    global _client
-    if _client is None:
-        config = get_config()
-        _client = YouTubeClient(api_key=config.api_key)
-    return _client
+    client = get_youtube_client()
+    response = await execute(client.client.playlists().list(
+        id=playlist_id,
+        part="snippet,contentDetails"
+    ))
+    details = response.get("items", [{}])[0]
+    await cache.aset(key, details, cache.ttl_for("youtube_playlist_details"))
+    return details
 
 
-async def youtube_get_playlist(playlist_id: str, max_results: int = 50):
+def compact_playlist_item(item: dict) -> dict:
+    """Project a playlistItems resource to the fields agents use."""
+    snippet = item.get("snippet", {})
+    content = item.get("contentDetails", {})
+    return {
+        "videoId": content.get("videoId") or snippet.get("resourceId", {}).get("videoId"),
+        "title": snippet.get("title"),
+        "position": snippet.get("position"),
+        "channelId": snippet.get("videoOwnerChannelId"),
+        "channelTitle": snippet.get("videoOwnerChannelTitle"),
+        "publishedAt": content.get("videoPublishedAt"),
+    }
+
+
+async def iter_playlist_pages(playlist_id: str, limit: Optional[int] = None,
+                              page_token: Optional[str] = None) -> AsyncIterator[dict]:
+    """Walk a playlist page by page, yielding compact items as they arrive.
+
+    Each API page is projected and dropped before the next one is fetched,
+    so memory holds compact items only.
+
+    Args:
+        playlist_id: YouTube playlist ID
+        limit: Stop after this many items (None walks the whole playlist)
+        page_token: Page to start from
+
+    Yields:
+        Dicts with "items", "nextPageToken" and "totalResults"
+    """
+    client = get_youtube_client()
+    remaining = limit
+    while remaining is None or remaining > 0:
+        response = await execute(client.client.playlistItems().list(
+            playlistId=playlist_id,
+            part="snippet,contentDetails",
+            maxResults=50 if remaining is None else min(remaining, 50),
+            pageToken=page_token,
+            fields=COMPACT_ITEM_FIELDS
+        ))
+        items = [compact_playlist_item(item) for item in response.get("items", [])]
+        if remaining is not None:
+            remaining -= len(items)
+        page_token = response.get("nextPageToken")
+        yield {
+            "items": items,
+            "nextPageToken": page_token,
+            "totalResults": response.get("pageInfo", {}).get("totalResults", 0),
+        }
+        if not page_token or not items:
+            return
+
+
+async def _collect_playlist(playlist_id: str, limit: int, page_token: Optional[str],
+                            progress: Optional[ProgressCallback]) -> dict:
+    """Gather every page of compact items, reporting progress per page."""
+    items = []
+    next_page_token = None
+    total = 0
+    async for page in iter_playlist_pages(playlist_id, limit=limit, page_token=page_token):
+        items.extend(page["items"])
+        next_page_token = page["nextPageToken"]
+        total = page["totalResults"]
+        if progress is not None:
+            await progress(len(items), min(total, limit) if total else None)
+    return {"items": items, "nextPageToken": next_page_token, "totalResults": total}
+
+
+async def youtube_get_playlist(playlist_id: str, max_results: int = 50, page_token: Optional[str] = None,
+                               all_pages: bool = False, limit: int = 1000,
+                               progress: Optional[ProgressCallback] = None, fields: Optional[str] = None):
     """Get playlist details and video list.
 
     Args:
         playlist_id: YouTube playlist ID
         max_results: Maximum videos to return (1-50)
+        page_token: Page token to continue from
+        all_pages: Walk every page server-side and return compact items
+        limit: Maximum videos when all_pages is set, capped at
+            MAX_PLAYLIST_ITEMS
+        progress: Optional callback invoked after each page in all_pages mode
+        fields: Optional per-item fields selector passed to the API in
+            single-page mode
 
     Returns:
         Dictionary with playlist data or error
     """
-    client = _get_client()
+    client = get_youtube_client()
 
     try:
-        # Get playlist items
-        items_response = client.client.playlistItems().list(
-            playlistId=playlist_id,
-            part="snippet,contentDetails",
-            maxResults=min(max_results, 50)
-        ).execute()
-
-        # Get playlist details
-        playlists_response = client.client.playlists().list(
-            id=playlist_id,
-            part="snippet,contentDetails"
-        ).execute()
+        if all_pages:
+            collected, playlist_details = await asyncio.gather(
+                _collect_playlist(playlist_id, max(1, min(limit, MAX_PLAYLIST_ITEMS)), page_token, progress),
+                get_playlist_details(playlist_id)
+            )
+            return {
+                "data": {
+                    "details": playlist_details,
+                    "items": collected["items"]
+                },
+                "error": None,
+                "pagination": {
+                    "nextPageToken": collected["nextPageToken"],
+                    "totalResults": collected["totalResults"]
+                }
+            }
 
-        playlist_details = playlists_response.get("items", [{}])[0]
+        # Items and details are independent: fetch them concurrently
+        items_response, playlist_details = await asyncio.gather(
+            execute(client.client.playlistItems().list(
+                playlistId=playlist_id,
+                part="snippet,contentDetails",
+                maxResults=min(max_results, 50),
+                pageToken=page_token,
+                fields=api_fields(fields)
+            )),
+            get_playlist_details(playlist_id)
+        )
 
         return {
             "data": {
@@ -76,24 +213,48 @@ async def youtube_get_playlist(playlist_id: str, max_results: int = 50):
         }
 
 
-async def youtube_list_playlists(channel_id: str, max_results: int = 25):
+async def youtube_list_playlists(channel_id: Optional[str] = None, max_results: int = 25,
+                                 fields: Optional[str] = None, username: Optional[str] = None):
     """List playlists for a channel.
 
     Args:
         channel_id: YouTube channel ID
         max_results: Maximum playlists to return (1-50)
+        fields: Optional per-playlist fields selector passed to the API
+        username: Channel handle or legacy username, used without channel_id;
+            resolved once and remembered
 
     Returns:
         Dictionary with playlists or error
     """
-    client = _get_client()
+    if not channel_id and not username:
+        return {
+            "data": None,
+            "error": {
+                "code": "InvalidInput",
+                "message": "Either channel_id or username is required"
+            },
+            "pagination": None
+        }
+
+    client = get_youtube_client()
 
     try:
-        response = client.client.playlists().list(
+        if not channel_id:
+            channel_id = await resolve_channel_id(username)
+            if channel_id is None:
+                return {
+                    "data": None,
+                    "error": {"code": "NotFound", "message": f"Channel not found: {username}"},
+                    "pagination": None
+                }
+
+        response = await execute(client.client.playlists().list(
             channelId=channel_id,
             part="snippet,contentDetails",
-            maxResults=min(max_results, 50)
-        ).execute()
+            maxResults=min(max_results, 50),
+            fields=api_fields(fields)
+        ))
 
         return {
             "data": response.get("items", []),
@@ -120,7 +281,11 @@ def register_playlist_tools(server):
         args = GetPlaylistArgs(**arguments)
         return await youtube_get_playlist(
             playlist_id=args.playlist_id,
-            max_results=args.max_results
+            max_results=args.max_results,
+            page_token=args.page_token,
+            all_pages=args.all_pages,
+            limit=args.limit,
+            fields=args.fields
         )
 
     @server.call_tool()
@@ -130,7 +295,9 @@ def register_playlist_tools(server):
         args = ListPlaylistsArgs(**arguments)
         return await youtube_list_playlists(
             channel_id=args.channel_id,
-            max_results=args.max_results
+            max_results=args.max_results,
+            fields=args.fields,
+            username=args.username
         )
 
     @server.list_tools()
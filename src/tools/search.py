@@ -1,9 +1,17 @@
 """YouTube Search Tool."""
-from typing import Optional
-from src.config import get_config
-from src.youtube_client import YouTubeClient
+import asyncio
+from typing import Callable, Optional
+from src.youtube_client import get_youtube_client
+from src.executor import execute
+from src.fields import FIELDS_DESCRIPTION, api_fields
+from src.tools.video import fetch_videos_by_id
 from pydantic import BaseModel, Field
 
+# Parts merged into video hits by enrich; each page costs one videos.list unit
+ENRICH_PART = ["statistics", "contentDetails"]
+# search.list costs 100 quota units per page
+MAX_SEARCH_PAGES = 10
+
 
 class SearchArgs(BaseModel):
     """Arguments for YouTube search."""
@@ -17,33 +25,65 @@ class SearchArgs(BaseModel):
         default="video",
         description="Resource type: video, channel, playlist"
     )
+    page_token: Optional[str] = Field(default=None, description="Page token for pagination")
+    pages: int = Field(default=1, description="Result pages to fetch (1-10, 100 quota units each)")
+    enrich: bool = Field(
+        default=False,
+        description="Add statistics and contentDetails to video hits (one batched lookup per page)"
+    )
+    fields: Optional[str] = Field(default=None, description=FIELDS_DESCRIPTION)
+
+
+def _video_ids(items: list) -> list:
+    return [
+        item["id"]["videoId"] for item in items
+        if isinstance(item.get("id"), dict) and item["id"].get("videoId")
+    ]
+
 
+def merge_enrichment(items: list, videos: dict, video_id: Callable[[dict], Optional[str]]):
+    """Copy statistics/contentDetails from video resources onto result items.
 
-_client: Optional[YouTubeClient] = None
+    Args:
+        items: Search hits or compact playlist items, updated in place
+        videos: Video resources by ID, as from fetch_videos_by_id()
+        video_id: Returns an item's video ID (or None)
+    """
+    for item in items:
+        video = videos.get(video_id(item))
+        if isinstance(video, dict):
+            for part in ENRICH_PART:
+                if part in video:
+                    item[part] = video[part]
 
 
-def _get_client() -> YouTubeClient:
-    """Get or create YouTube client singleton."""
-    global _client
-    if _client is None:
-        config = get_config()
-        _client = YouTubeClient(api_key=config.api_key)
-    return _client
+def _hit_video_id(item: dict) -> Optional[str]:
+    return (item.get("id") or {}).get("videoId")
 
 
-async def youtube_search(query: str, max_results: int = 10, order: str = "relevance", type: str = "video"):
+async def youtube_search(query: str, max_results: int = 10, order: str = "relevance", type: str = "video",
+                         page_token: Optional[str] = None, pages: int = 1, enrich: bool = False,
+                         fields: Optional[str] = None):
     """Search YouTube for videos, channels, or playlists.
 
+    With several pages, page N+1's search is requested while page N's
+    enrichment lookup is in flight.
+
     Args:
         query: Search terms
-        max_results: Number of results (1-50)
+        max_results: Number of results per page (1-50)
         order: Sort order (relevance, date, viewCount, rating)
         type: Resource type (video, channel, playlist)
+        page_token: Page token for pagination
+        pages: Number of pages to fetch (1-10)
+        enrich: Merge statistics and contentDetails into video hits
+        fields: Optional fields selector passed to the API (enriched parts
+            are merged whole)
 
     Returns:
         Dictionary with search results or error
     """
-    client = _get_client()
+    client = get_youtube_client()
 
     search_params = {
         "q": query,
@@ -52,15 +92,44 @@ async def youtube_search(query: str, max_results: int = 10, order: str = "releva
         "type": type,
         "part": "id,snippet"
     }
-
+    mask = api_fields(fields, exclude=ENRICH_PART)
+    if mask:
+        search_params["fields"] = mask
+
+    def request_page(token):
+        params = dict(search_params, pageToken=token) if token else search_params
+        return asyncio.ensure_future(execute(client.client.search().list(**params)))
+
+    pages = max(1, min(pages, MAX_SEARCH_PAGES))
+    items = []
+    lookups = []
+    next_search = request_page(page_token)
     try:
-        response = client.client.search().list(**search_params).execute()
+        total_results = None
+        for page in range(pages):
+            response = await next_search
+            page_items = response.get("items", [])
+            page_token = response.get("nextPageToken")
+            if total_results is None:
+                total_results = response.get("pageInfo", {}).get("totalResults", 0)
+            next_search = request_page(page_token) if page_token and page + 1 < pages else None
+
+            items.extend(page_items)
+            video_ids = _video_ids(page_items)
+            if enrich and video_ids:
+                lookups.append((page_items, asyncio.ensure_future(fetch_videos_by_id(video_ids, ENRICH_PART))))
+            if next_search is None:
+                break
+
+        for page_items, lookup in lookups:
+            merge_enrichment(page_items, await lookup, _hit_video_id)
+
         return {
-            "data": response.get("items", []),
+            "data": items,
             "error": None,
             "pagination": {
-                "nextPageToken": response.get("nextPageToken"),
-                "totalResults": response.get("pageInfo", {}).get("totalResults", 0)
+                "nextPageToken": page_token,
+                "totalResults": total_results
             }
         }
     except Exception as e:
@@ -69,6 +138,10 @@ async def youtube_search(query: str, max_results: int = 10, order: str = "releva
             "error": {"code": e.__class__.__name__, "message": str(e)},
             "pagination": None
         }
+    finally:
+        for task in [next_search] + [lookup for _, lookup in lookups]:
+            if task is not None and not task.done():
+                task.cancel()
 
 
 def register_search_tools(server):
@@ -83,7 +156,11 @@ def register_search_tools(server):
             query=args.query,
             max_results=args.max_results,
             order=args.order,
-            type=args.type
+            type=args.type,
+            page_token=args.page_token,
+            pages=args.pages,
+            enrich=args.enrich,
+            fields=args.fields
         )
 
     @server.list_tools()
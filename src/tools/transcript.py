@@ -1,141 +1,510 @@
 """YouTube Transcript Tool."""
-from typing import Optional
+import asyncio
+import time
+from collections import OrderedDict
+from typing import List, Optional
+from src.youtube_client import get_transcript_api
+from src.cache import get_response_cache
 from src.config import get_config
-from src.youtube_client import YouTubeClient
+from src.executor import run_blocking
+from src.fields import FIELDS_DESCRIPTION
+from src.singleflight import SingleFlight
+from src.transcript_search import TranscriptSearchIndex
+from src.transcript_store import TranscriptCache, TranscriptIndex
+from src.tools.playlist import ProgressCallback, iter_playlist_pages
 from pydantic import BaseModel, Field
-from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
+from youtube_transcript_api import TranscriptsDisabled
 
 
 class GetTranscriptArgs(BaseModel):
     """Arguments for getting transcript."""
     video_id: str = Field(description="YouTube video ID")
     language: str = Field(default="en", description="Language code (e.g., en, es, zh)")
+    include_tracks: bool = Field(default=False, description="Also list the video's available caption tracks")
+    start_time: Optional[float] = Field(default=None, description="Only segments after this time (seconds)")
+    end_time: Optional[float] = Field(default=None, description="Only segments before this time (seconds)")
+    offset: int = Field(default=0, description="Skip this many segments of the selected range")
+    limit: Optional[int] = Field(default=None, description="Maximum segments to return")
+    include_text: bool = Field(default=True, description="Return the joined text of the selected segments")
+    include_segments: bool = Field(default=True, description="Return the individual timed segments")
+    format: str = Field(
+        default="segments",
+        description=(
+            "Segment layout: segments (list of objects), columnar (starts/durations/texts arrays) "
+            "or chunks (segments merged into paragraphs with start/end times)"
+        )
+    )
+    chunk_chars: Optional[int] = Field(default=1000, description="chunks format: maximum characters per paragraph")
+    chunk_pause: Optional[float] = Field(
+        default=None,
+        description="chunks format: start a new paragraph after a pause of at least this many seconds"
+    )
+    fields: Optional[str] = Field(default=None, description=FIELDS_DESCRIPTION)
+
+
+class GetTranscriptsArgs(BaseModel):
+    """Arguments for getting many transcripts."""
+    video_ids: Optional[List[str]] = Field(default=None, description="YouTube video IDs")
+    playlist_id: Optional[str] = Field(default=None, description="Fetch transcripts for the videos of this playlist")
+    language: str = Field(default="en", description="Language code (e.g., en, es, zh)")
+    max_videos: int = Field(
+        default=50,
+        description="Maximum playlist videos to fetch transcripts for (video_ids are always fetched in full)"
+    )
+    include_text: bool = Field(default=True, description="Return each transcript's joined text")
+    include_segments: bool = Field(default=False, description="Return each transcript's timed segments")
+    format: str = Field(default="segments", description="Segment layout: segments, columnar or chunks")
+    chunk_chars: Optional[int] = Field(default=1000, description="chunks format: maximum characters per paragraph")
+    chunk_pause: Optional[float] = Field(
+        default=None,
+        description="chunks format: start a new paragraph after a pause of at least this many seconds"
+    )
+    concurrency: Optional[int] = Field(
+        default=None,
+        description="Transcripts fetched at once (capped by YOUTUBE_TRANSCRIPT_CONCURRENCY)"
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        description="Seconds to wait for each transcript (default YOUTUBE_TRANSCRIPT_TIMEOUT)"
+    )
+    fields: Optional[str] = Field(default=None, description=FIELDS_DESCRIPTION)
+
+
+class SearchTranscriptsArgs(BaseModel):
+    """Arguments for searching transcripts."""
+    query: str = Field(description="Keywords to look for")
+    video_ids: Optional[List[str]] = Field(
+        default=None,
+        description="Only search these videos, fetching transcripts not yet loaded; omit to search every loaded transcript"
+    )
+    language: str = Field(default="en", description="Language code used when fetching missing transcripts")
+    limit: int = Field(default=10, description="Maximum passages to return")
+    fields: Optional[str] = Field(default=None, description=FIELDS_DESCRIPTION)
+
+
+TRANSCRIPT_FORMATS = ("segments", "columnar", "chunks")
+
+# Track lists are reused for this long; the caption URLs they hold expire
+TRACK_LIST_TTL = 1800
+TRACK_LIST_MAX_VIDEOS = 256
+
+_track_lists: "OrderedDict[str, tuple]" = OrderedDict()
+_track_list_flight = SingleFlight()
+
+# Fetched transcripts, keyed by (video_id, requested language), so ranges
+# and pages of a long transcript are served without refetching it
+TRANSCRIPT_TTL = 86400
+transcript_cache = TranscriptCache(ttl=TRANSCRIPT_TTL, max_segments=500_000)
+_transcript_flight = SingleFlight()
+
+# Videos without a usable transcript, so retries fail without a round trip;
+# entries live for the response cache's negative TTL
+_transcript_failures: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+# Every loaded transcript is also indexed for youtube_search_transcripts
+transcript_search = TranscriptSearchIndex()
+
+
+class TranscriptNotFound(Exception):
+    """Raised when a video has no caption track at all."""
+
+
+def describe_tracks(transcript_list) -> list:
+    """Summarize the caption tracks in a youtube-transcript-api TranscriptList."""
+    return [
+        {
+            "language": t.language_code,
+            "name": t.language,
+            "kind": "asr" if t.is_generated else "standard",
+            "translatable": t.is_translatable
+        }
+        for t in transcript_list
+    ]
+
+
+async def get_track_list(video_id: str) -> list:
+    """List a video's caption tracks, reusing a recent listing.
+
+    Concurrent requests for the same video share one listing request.
+
+    Raises:
+        TranscriptsDisabled: If the video has captions turned off
+    """
+    entry = _track_lists.get(video_id)
+    if entry is not None and entry[0] > time.monotonic():
+        _track_lists.move_to_end(video_id)
+        return entry[1]
+
+    async def list_tracks():
+        tracks = list(await run_blocking(get_transcript_api().list, video_id))
+        _track_lists[video_id] = (time.monotonic() + TRACK_LIST_TTL, tracks)
+        _track_lists.move_to_end(video_id)
+        while len(_track_lists) > TRACK_LIST_MAX_VIDEOS:
+            _track_lists.popitem(last=False)
+        return tracks
+
+    return await _track_list_flight.do(video_id, list_tracks)
+
+
+def reset_transcript_caches():
+    """Forget cached track lists and transcripts."""
+    _track_lists.clear()
+    _transcript_failures.clear()
+    transcript_cache.clear()
+    transcript_search.clear()
+
+
+def choose_track(tracks: list, language: str):
+    """Pick the best track for a language.
 
+    Preference: manual then generated track in the exact language, then in
+    a regional variant (en-GB for en), then a translation of a manual or
+    generated track, then any track at all.
 
-_client: Optional[YouTubeClient] = None
-_transcript_api: Optional[YouTubeTranscriptApi] = None
+    Returns:
+        (transcript, translated), or (None, False) if there are no tracks
+    """
+    base = language.split("-")[0].lower()
+    matchers = [
+        lambda t: t.language_code == language,
+        lambda t: t.language_code.split("-")[0].lower() == base,
+    ]
+    for matches in matchers:
+        for generated in (False, True):
+            for track in tracks:
+                if track.is_generated == generated and matches(track):
+                    return track, False
+    for generated in (False, True):
+        for track in tracks:
+            if track.is_generated == generated and any(
+                tl.language_code == language for tl in track.translation_languages
+            ):
+                return track.translate(language), True
+    for generated in (False, True):
+        for track in tracks:
+            if track.is_generated == generated:
+                return track, False
+    return None, False
+
+
+def _remember_failure(key: tuple, error: Exception):
+    _transcript_failures[key] = (time.monotonic() + get_response_cache().negative_ttl, error)
+    _transcript_failures.move_to_end(key)
+    while len(_transcript_failures) > TRACK_LIST_MAX_VIDEOS:
+        _transcript_failures.popitem(last=False)
+
+
+def transcript_stats() -> dict:
+    """Transcript cache counters plus remembered failures."""
+    return {**transcript_cache.stats(), "failures": len(_transcript_failures)}
+
+
+async def load_transcript(video_id: str, language: str = "en") -> TranscriptIndex:
+    """Fetch (or reuse) the best transcript of a video for a language.
+
+    Raises:
+        TranscriptsDisabled: If the video has captions turned off
+        TranscriptNotFound: If the video has no caption tracks
+    """
+    key = (video_id, language)
+    index = transcript_cache.get(key)
+    if index is not None:
+        return index
+    failure = _transcript_failures.get(key)
+    if failure is not None:
+        if failure[0] > time.monotonic():
+            raise failure[1]
+        del _transcript_failures[key]
+
+    async def fetch():
+        try:
+            tracks = await get_track_list(video_id)
+        except TranscriptsDisabled as e:
+            _remember_failure(key, e)
+            raise
+        track, translated = choose_track(tracks, language)
+        if track is None:
+            error = TranscriptNotFound(f"No transcript available for video {video_id}")
+            _remember_failure(key, error)
+            raise error
+        fetched = await run_blocking(track.fetch)
+        starts, durations, texts = [], [], []
+        for segment in fetched:
+            text = segment.text.strip()
+            if text:
+                starts.append(segment.start)
+                durations.append(segment.duration)
+                texts.append(text)
+        index = TranscriptIndex(
+            video_id,
+            track.language_code,
+            "asr" if track.is_generated else "standard",
+            translated,
+            starts,
+            durations,
+            texts
+        )
+        transcript_cache.set(key, index)
+        transcript_search.add(index)
+        return index
 
+    return await _transcript_flight.do(key, fetch)
 
-def _get_client() -> YouTubeClient:
-    """Get or create YouTube client singleton."""
-    global _client
-    if _client is None:
-        config = get_config()
-        _client = YouTubeClient(api_key=config.api_key)
-    return _client
 
+def transcript_error(video_id: str, error: Exception) -> dict:
+    """Tool error object for a failed transcript load."""
+    if isinstance(error, TranscriptsDisabled):
+        return {"code": "TranscriptsDisabled", "message": f"Transcripts are disabled for video {video_id}"}
+    if isinstance(error, TranscriptNotFound):
+        return {"code": "NotFound", "message": str(error)}
+    if isinstance(error, asyncio.TimeoutError):
+        return {"code": "Timeout", "message": f"Timed out fetching the transcript of video {video_id}"}
+    return {"code": type(error).__name__, "message": str(error)}
 
-def _get_transcript_api() -> YouTubeTranscriptApi:
-    """Get or create transcript API singleton."""
-    global _transcript_api
-    if _transcript_api is None:
-        _transcript_api = YouTubeTranscriptApi()
-    return _transcript_api
 
+def render_transcript(index: TranscriptIndex, positions: slice, include_text: bool = True,
+                      include_segments: bool = True, format: str = "segments",
+                      chunk_chars: Optional[int] = 1000, chunk_pause: Optional[float] = None) -> dict:
+    """Tool data for the segments of a transcript at the given positions."""
+    data = {
+        "videoId": index.video_id,
+        "language": index.language,
+        "trackKind": index.track_kind,
+        "translated": index.translated,
+        "segmentCount": positions.stop - positions.start
+    }
+    if include_text:
+        data["text"] = index.text(positions)
+    if include_segments:
+        if format == "columnar":
+            data["columns"] = index.columns(positions)
+        elif format == "chunks":
+            data["chunks"] = index.chunks(positions, chunk_chars, chunk_pause)
+        else:
+            data["segments"] = index.segments(positions)
+    return data
 
-async def youtube_get_transcript(video_id: str, language: str = "en"):
+
+def _invalid_format() -> dict:
+    return {
+        "data": None,
+        "error": {
+            "code": "InvalidInput",
+            "message": f"format must be one of: {', '.join(TRANSCRIPT_FORMATS)}"
+        },
+        "pagination": None
+    }
+
+
+async def youtube_get_transcript(video_id: str, language: str = "en", include_tracks: bool = False,
+                                 start_time: Optional[float] = None, end_time: Optional[float] = None,
+                                 offset: int = 0, limit: Optional[int] = None,
+                                 include_text: bool = True, include_segments: bool = True,
+                                 format: str = "segments", chunk_chars: Optional[int] = 1000,
+                                 chunk_pause: Optional[float] = None):
     """Get transcript/captions for a YouTube video.
 
-    Uses youtube-transcript-api to fetch actual transcript text.
+    Uses youtube-transcript-api: the video's tracks are listed once (and
+    cached), the best match for the language is chosen, and only that
+    track is fetched. No YouTube Data API quota is spent. The fetched
+    transcript is cached, so time ranges and pages of it are cheap.
 
     Args:
         video_id: 11-character YouTube video ID
         language: Language code (default: en)
+        include_tracks: Also list available caption tracks
+        start_time: Only segments still running at or after this time (seconds)
+        end_time: Only segments starting before this time (seconds)
+        offset: Skip this many segments of the selected range
+        limit: Maximum segments to return
+        include_text: Return the joined text of the selected segments
+        include_segments: Return the individual timed segments
+        format: "segments" for a list of {text, start, duration} objects, or
+            "columnar" for a "columns" object of parallel starts, durations
+            and texts arrays (smaller for long transcripts), or "chunks" for
+            a "chunks" list of {start, end, text} paragraphs
+        chunk_chars: Maximum characters per paragraph (chunks format)
+        chunk_pause: Start a new paragraph after a pause of at least this
+            many seconds (chunks format)
 
     Returns:
-        Dictionary with transcript or error
+        Dictionary with transcript or error; pagination.nextOffset is the
+        offset of the next page within the range
     """
+    if format not in TRANSCRIPT_FORMATS:
+        return _invalid_format()
+
     try:
-        api = _get_transcript_api()
+        try:
+            index = await load_transcript(video_id, language)
+        except (TranscriptsDisabled, TranscriptNotFound) as e:
+            return {"data": None, "error": transcript_error(video_id, e), "pagination": None}
 
-        # Try to get transcript in requested language
-        transcript_data = None
-        used_language = language
+        selection = index.select(start_time, end_time, offset, limit)
+        data = render_transcript(
+            index, selection["slice"], include_text, include_segments, format, chunk_chars, chunk_pause
+        )
+        if include_tracks:
+            data["availableTracks"] = describe_tracks(await get_track_list(video_id))
 
-        try:
-            transcript_data = api.fetch(video_id, languages=[language])
-        except NoTranscriptFound:
-            # If requested language not found, try auto-generated (any available)
-            try:
-                transcript_data = api.fetch(video_id)
-                used_language = "auto"
-            except NoTranscriptFound:
-                # List available languages for better error message
-                available_languages = []
+        return {
+            "data": data,
+            "error": None,
+            "pagination": {
+                "nextPageToken": None,
+                "totalResults": selection["total"],
+                "nextOffset": selection["nextOffset"]
+            }
+        }
+
+    except Exception as e:
+        return {
+            "data": None,
+            "error": {"code": type(e).__name__, "message": str(e)},
+            "pagination": None
+        }
+
+
+async def youtube_get_transcripts(video_ids: Optional[List[str]] = None, playlist_id: Optional[str] = None,
+                                  language: str = "en", max_videos: int = 50, include_text: bool = True,
+                                  include_segments: bool = False, format: str = "segments",
+                                  chunk_chars: Optional[int] = 1000, chunk_pause: Optional[float] = None,
+                                  concurrency: Optional[int] = None, timeout: Optional[float] = None,
+                                  progress: Optional[ProgressCallback] = None):
+    """Get transcripts for many videos at once.
+
+    Transcripts are loaded concurrently (at most YOUTUBE_TRANSCRIPT_CONCURRENCY
+    at a time) through the same cache as youtube_get_transcript, each with
+    its own timeout. A progress notification naming the video is sent as
+    each one completes. Listing a playlist costs 1 quota unit per 50 videos;
+    the transcripts themselves cost none.
+
+    Args:
+        video_ids: YouTube video IDs
+        playlist_id: Also fetch the videos of this playlist
+        language: Language code (default: en)
+        max_videos: Maximum videos taken from the playlist
+        include_text: Return each transcript's joined text
+        include_segments: Return each transcript's timed segments
+        format: Segment layout, as for youtube_get_transcript
+        chunk_chars: Maximum characters per paragraph (chunks format)
+        chunk_pause: Paragraph-breaking pause in seconds (chunks format)
+        concurrency: Transcripts fetched at once, up to the configured cap
+        timeout: Seconds to wait for each transcript
+        progress: Optional async callback(done, total, message)
+
+    Returns:
+        Dictionary with one entry per video in input order (transcript data,
+        or {"videoId", "error"}) or error
+    """
+    if not video_ids and not playlist_id:
+        return {
+            "data": None,
+            "error": {
+                "code": "InvalidInput",
+                "message": "Either video_ids or playlist_id is required"
+            },
+            "pagination": None
+        }
+    if format not in TRANSCRIPT_FORMATS:
+        return _invalid_format()
+
+    try:
+        # max_videos bounds the playlist expansion only; explicit IDs are all fetched
+        ids = list(video_ids or [])
+        if playlist_id:
+            listed = []
+            async for page in iter_playlist_pages(playlist_id, limit=max(max_videos, 1)):
+                listed.extend(item["videoId"] for item in page["items"] if item["videoId"])
+            ids.extend(listed[:max_videos])
+        ids = list(dict.fromkeys(ids))
+
+        config = get_config(require_api_key=False)
+        semaphore = asyncio.Semaphore(max(1, min(concurrency or config.transcript_concurrency,
+                                                 config.transcript_concurrency)))
+        timeout = timeout or config.transcript_timeout
+        done = 0
+
+        async def fetch_one(video_id):
+            nonlocal done
+            async with semaphore:
                 try:
-                    transcript_list = api.list(video_id)
-                    for t in transcript_list:
-                        available_languages.append(t.language_code)
-                except Exception:
-                    pass
-
-                return {
-                    "data": None,
-                    "error": {
-                        "code": "NotFound",
-                        "message": f"No transcript available for video {video_id} in language '{language}'. "
-                        f"Available languages: {', '.join(available_languages) if available_languages else 'None'}"
-                    },
-                    "pagination": None
-                }
-        except TranscriptsDisabled:
-            return {
-                "data": None,
-                "error": {
-                    "code": "TranscriptsDisabled",
-                    "message": f"Transcripts are disabled for video {video_id}"
-                },
-                "pagination": None
+                    index = await asyncio.wait_for(load_transcript(video_id, language), timeout)
+                except Exception as e:
+                    entry = {"videoId": video_id, "error": transcript_error(video_id, e)}
+                else:
+                    entry = render_transcript(
+                        index, slice(0, len(index)), include_text, include_segments,
+                        format, chunk_chars, chunk_pause
+                    )
+            done += 1
+            if progress is not None:
+                status = entry["error"]["code"] if "error" in entry else "ok"
+                await progress(done, len(ids), f"{video_id}: {status}")
+            return entry
+
+        results = await asyncio.gather(*(fetch_one(video_id) for video_id in ids))
+
+        return {
+            "data": results,
+            "error": None,
+            "pagination": {
+                "nextPageToken": None,
+                "totalResults": sum(1 for entry in results if "error" not in entry)
             }
+        }
 
-        # Combine transcript segments into continuous text
-        full_text = []
-        segments = []
+    except Exception as e:
+        return {
+            "data": None,
+            "error": {"code": type(e).__name__, "message": str(e)},
+            "pagination": None
+        }
 
-        for segment in transcript_data:
-            text = segment.text.strip()
-            if text:
-                full_text.append(text)
-                segments.append({
-                    "text": text,
-                    "start": segment.start,
-                    "duration": segment.duration
-                })
 
-        combined_text = " ".join(full_text)
+async def youtube_search_transcripts(query: str, video_ids: Optional[List[str]] = None, language: str = "en",
+                                     limit: int = 10):
+    """Search loaded transcripts for keywords.
 
-        # Also get available languages from YouTube API for completeness
-        available_tracks = []
-        try:
-            client = _get_client()
-            captions_response = client.client.captions().list(
-                part="snippet",
-                videoId=video_id
-            ).execute()
-
-            items = captions_response.get("items", [])
-            available_tracks = [
-                {
-                    "id": item.get("id"),
-                    "language": item.get("snippet", {}).get("languageCode"),
-                    "kind": item.get("snippet", {}).get("trackKind")
-                }
-                for item in items
+    Ranks passages (a few sentences each) of every transcript the server
+    has loaded with BM25. With video_ids, only those videos are searched
+    and any whose transcript is not loaded yet is fetched first.
+
+    Args:
+        query: Keywords to look for
+        video_ids: Only search these videos
+        language: Language code used when fetching missing transcripts
+        limit: Maximum passages to return
+
+    Returns:
+        Dictionary with hits (videoId, language, start, end, text, score),
+        the videos whose transcripts could not be loaded, or error
+    """
+    try:
+        unavailable = []
+        if video_ids:
+            missing = [v for v in dict.fromkeys(video_ids) if not transcript_search.has_video(v)]
+            results = await asyncio.gather(
+                *(load_transcript(video_id, language) for video_id in missing),
+                return_exceptions=True
+            )
+            unavailable = [
+                {"videoId": video_id, "error": {"code": type(result).__name__, "message": str(result)}}
+                for video_id, result in zip(missing, results)
+                if isinstance(result, Exception)
             ]
-        except Exception:
-            pass
 
+        found = transcript_search.search(query, video_ids=video_ids or None, limit=limit)
         return {
             "data": {
-                "videoId": video_id,
-                "language": used_language,
-                "text": combined_text,
-                "segments": segments,
-                "segmentCount": len(segments),
-                "availableTracks": available_tracks
+                "hits": found["hits"],
+                "unavailable": unavailable
             },
             "error": None,
-            "pagination": None
+            "pagination": {
+                "nextPageToken": None,
+                "totalResults": found["total"]
+            }
         }
 
     except Exception as e:
@@ -156,13 +525,68 @@ def register_transcript_tools(server):
         args = GetTranscriptArgs(**arguments)
         return await youtube_get_transcript(
             video_id=args.video_id,
-            language=args.language
+            language=args.language,
+            include_tracks=args.include_tracks,
+            start_time=args.start_time,
+            end_time=args.end_time,
+            offset=args.offset,
+            limit=args.limit,
+            include_text=args.include_text,
+            include_segments=args.include_segments,
+            format=args.format,
+            chunk_chars=args.chunk_chars,
+            chunk_pause=args.chunk_pause
+        )
+
+    @server.call_tool()
+    async def call_youtube_get_transcripts(name, arguments):
+        if name != "youtube_get_transcripts":
+            return None
+
+        args = GetTranscriptsArgs(**arguments)
+        return await youtube_get_transcripts(
+            video_ids=args.video_ids,
+            playlist_id=args.playlist_id,
+            language=args.language,
+            max_videos=args.max_videos,
+            include_text=args.include_text,
+            include_segments=args.include_segments,
+            format=args.format,
+            chunk_chars=args.chunk_chars,
+            chunk_pause=args.chunk_pause,
+            concurrency=args.concurrency,
+            timeout=args.timeout
+        )
+
+    @server.call_tool()
+    async def call_youtube_search_transcripts(name, arguments):
+        if name != "youtube_search_transcripts":
+            return None
+
+        args = SearchTranscriptsArgs(**arguments)
+        return await youtube_search_transcripts(
+            query=args.query,
+            video_ids=args.video_ids,
+            language=args.language,
+            limit=args.limit
         )
 
     @server.list_tools()
     async def list_transcript_tools():
-        return [{
-            "name": "youtube_get_transcript",
-            "description": "Get transcript/captions for a YouTube video. Returns actual transcript text.",
-            "inputSchema": GetTranscriptArgs.model_json_schema()
-        }]
+        return [
+            {
+                "name": "youtube_get_transcript",
+                "description": "Get transcript/captions for a YouTube video. Returns actual transcript text.",
+                "inputSchema": GetTranscriptArgs.model_json_schema()
+            },
+            {
+                "name": "youtube_get_transcripts",
+                "description": "Get transcripts for many videos (or a playlist) in one call",
+                "inputSchema": GetTranscriptsArgs.model_json_schema()
+            },
+            {
+                "name": "youtube_search_transcripts",
+                "description": "Find where keywords are mentioned in loaded transcripts",
+                "inputSchema": SearchTranscriptsArgs.model_json_schema()
+            }
+        ]
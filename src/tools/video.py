@@ -1,7 +1,8 @@
-"""YouTube Video Details Tool."""
-from typing import Optional, List
-from src.config import get_config
-from src.youtube_client import YouTubeClient
+"""YouTube Video Details Tools."""
+from typing import Dict, List, Optional
+from src.youtube_client import get_youtube_client
+from src.coalescer import RequestCoalescer, fetch_by_id
+from src.fields import FIELDS_DESCRIPTION, api_fields
 from pydantic import BaseModel, Field
 
 
@@ -12,26 +13,57 @@ class GetVideoArgs(BaseModel):
         default=["snippet", "statistics", "contentDetails"],
         description="Parts to retrieve: snippet, statistics, contentDetails"
     )
+    fields: Optional[str] = Field(default=None, description=FIELDS_DESCRIPTION)
 
 
-_client: Optional[YouTubeClient] = None
+class GetVideosArgs(BaseModel):
+    """Arguments for getting details of many videos."""
+    video_ids: List[str] = Field(description="YouTube video IDs (any number; fetched 50 per request)")
+    part: List[str] = Field(
+        default=["snippet", "statistics", "contentDetails"],
+        description="Parts to retrieve: snippet, statistics, contentDetails"
+    )
+    fields: Optional[str] = Field(default=None, description=FIELDS_DESCRIPTION)
+
+
+async def fetch_videos_by_id(video_ids: List[str], part: List[str],
+                             fields: Optional[str] = None) -> Dict[str, dict]:
+    """Fetch video resources with one videos.list call per 50 IDs.
+
+    Chunks are requested concurrently. A chunk that fails maps each of its
+    IDs to the exception instead of a resource.
+
+    Args:
+        video_ids: Video IDs (duplicates are fetched once)
+        part: List of parts to retrieve
+        fields: Optional per-video fields selector
+
+    Returns:
+        Mapping of video ID to its resource or exception; missing IDs are absent
+    """
+    client = get_youtube_client()
+    return await fetch_by_id(
+        client.client.videos().list, video_ids, ",".join(part),
+        fields=api_fields(fields, include_id=True)
+    )
+
 
+async def _fetch_video_group(group: tuple, video_ids: List[str]) -> Dict[str, dict]:
+    part, fields = group
+    return await fetch_videos_by_id(video_ids, list(part), fields)
 
-def _get_client() -> YouTubeClient:
-    """Get or create YouTube client singleton."""
-    global _client
-    if _client is None:
-        config = get_config()
-        _client = YouTubeClient(api_key=config.api_key)
-    return _client
 
+# Concurrent single-video lookups for the same parts and fields share one videos.list call
+video_coalescer = RequestCoalescer(_fetch_video_group)
 
-async def youtube_get_video(video_id: str, part: list = None):
+
+async def youtube_get_video(video_id: str, part: list = None, fields: Optional[str] = None):
     """Get detailed information about a YouTube video.
 
     Args:
         video_id: 11-character YouTube video ID
         part: List of parts to retrieve
+        fields: Optional fields selector passed to the API
 
     Returns:
         Dictionary with video details or error
@@ -39,15 +71,10 @@ async def youtube_get_video(video_id: str, part: list = None):
     if part is None:
         part = ["snippet", "statistics", "contentDetails"]
 
-    client = _get_client()
-
     try:
-        response = client.client.videos().list(
-            id=video_id,
-            part=",".join(part)
-        ).execute()
+        item = await video_coalescer.load((tuple(part), fields), video_id)
 
-        if not response.get("items"):
+        if item is None:
             return {
                 "data": None,
                 "error": {
@@ -58,7 +85,7 @@ async def youtube_get_video(video_id: str, part: list = None):
             }
 
         return {
-            "data": response["items"][0],
+            "data": item,
             "error": None,
             "pagination": None
         }
@@ -70,6 +97,68 @@ async def youtube_get_video(video_id: str, part: list = None):
         }
 
 
+async def youtube_get_videos(video_ids: List[str], part: list = None, fields: Optional[str] = None):
+    """Get details for many YouTube videos in as few API calls as possible.
+
+    Args:
+        video_ids: YouTube video IDs
+        part: List of parts to retrieve
+        fields: Optional per-video fields selector passed to the API
+
+    Returns:
+        Dictionary with one entry per input ID, in input order. IDs that
+        could not be fetched get {"id": ..., "error": {...}} markers.
+    """
+    if part is None:
+        part = ["snippet", "statistics", "contentDetails"]
+
+    if not video_ids:
+        return {
+            "data": None,
+            "error": {
+                "code": "InvalidInput",
+                "message": "video_ids must contain at least one ID"
+            },
+            "pagination": None
+        }
+
+    try:
+        found = await fetch_videos_by_id(video_ids, part, fields)
+    except Exception as e:
+        return {
+            "data": None,
+            "error": {"code": type(e).__name__, "message": str(e)},
+            "pagination": None
+        }
+
+    data = []
+    found_count = 0
+    for video_id in video_ids:
+        item = found.get(video_id)
+        if item is None:
+            data.append({
+                "id": video_id,
+                "error": {"code": "NotFound", "message": f"Video not found: {video_id}"}
+            })
+        elif isinstance(item, Exception):
+            data.append({
+                "id": video_id,
+                "error": {"code": type(item).__name__, "message": str(item)}
+            })
+        else:
+            data.append(item)
+            found_count += 1
+
+    return {
+        "data": data,
+        "error": None,
+        "pagination": {
+            "nextPageToken": None,
+            "totalResults": found_count
+        }
+    }
+
+
 def register_video_tools(server):
     """Register video tools with MCP server."""
     @server.call_tool()
@@ -80,13 +169,33 @@ def register_video_tools(server):
         args = GetVideoArgs(**arguments)
         return await youtube_get_video(
             video_id=args.video_id,
-            part=args.part
+            part=args.part,
+            fields=args.fields
+        )
+
+    @server.call_tool()
+    async def call_youtube_get_videos(name, arguments):
+        if name != "youtube_get_videos":
+            return None
+
+        args = GetVideosArgs(**arguments)
+        return await youtube_get_videos(
+            video_ids=args.video_ids,
+            part=args.part,
+            fields=args.fields
         )
 
     @server.list_tools()
     async def list_video_tools():
-        return [{
-            "name": "youtube_get_video",
-            "description": "Get detailed information about a YouTube video",
-            "inputSchema": GetVideoArgs.model_json_schema()
-        }]
+        return [
+            {
+                "name": "youtube_get_video",
+                "description": "Get detailed information about a YouTube video",
+                "inputSchema": GetVideoArgs.model_json_schema()
+            },
+            {
+                "name": "youtube_get_videos",
+                "description": "Get details for many YouTube videos in one call",
+                "inputSchema": GetVideosArgs.model_json_schema()
+            }
+        ]
@@ -0,0 +1,148 @@
+"""Keyword search over fetched transcripts.
+
+Every transcript the server loads is split into passages of a few
+sentences and added to an in-memory inverted index, so "where is X
+mentioned" can be answered with BM25-ranked, timestamped passages instead
+of resending whole transcripts.
+"""
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional
+
+from src.transcript_store import TranscriptIndex
+
+_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens of a text."""
+    return _TOKEN.findall(text.lower())
+
+
+class TranscriptSearchIndex:
+    """BM25-ranked inverted index of transcript passages.
+
+    Transcripts are added one at a time as they are fetched; re-adding a
+    transcript replaces its passages. The least recently added transcripts
+    are dropped beyond max_transcripts.
+
+    Args:
+        passage_chars: Target passage length in characters
+        max_transcripts: Transcripts kept in the index
+        k1: BM25 term-frequency saturation
+        b: BM25 length normalization
+    """
+
+    def __init__(self, passage_chars: int = 300, max_transcripts: int = 1000, k1: float = 1.2, b: float = 0.75):
+        self.passage_chars = passage_chars
+        self.max_transcripts = max_transcripts
+        self.k1 = k1
+        self.b = b
+        # term -> {passage id: term frequency}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        # passage id -> (transcript key, start, end, text, token count)
+        self._passages: Dict[int, tuple] = {}
+        self._transcripts: "OrderedDict[Hashable, List[int]]" = OrderedDict()
+        self._total_length = 0
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def add(self, index: TranscriptIndex):
+        """Index a transcript's passages, replacing any earlier copy."""
+        key = (index.video_id, index.language)
+        passages = [
+            (chunk, Counter(tokenize(chunk["text"])))
+            for chunk in index.chunks(max_chars=self.passage_chars)
+        ]
+        with self._lock:
+            if key in self._transcripts:
+                self._remove(key)
+            ids = []
+            for chunk, counts in passages:
+                passage_id = self._next_id
+                self._next_id += 1
+                length = sum(counts.values())
+                self._passages[passage_id] = (key, chunk["start"], chunk["end"], chunk["text"], length)
+                self._total_length += length
+                for term, tf in counts.items():
+                    self._postings.setdefault(term, {})[passage_id] = tf
+                ids.append(passage_id)
+            self._transcripts[key] = ids
+            while len(self._transcripts) > self.max_transcripts:
+                self._remove(next(iter(self._transcripts)))
+
+    def has_video(self, video_id: str) -> bool:
+        with self._lock:
+            return any(key[0] == video_id for key in self._transcripts)
+
+    def search(self, query: str, video_ids: Optional[Iterable[str]] = None, limit: int = 10) -> dict:
+        """Rank passages against a keyword query.
+
+        Args:
+            query: Free-text query; every word is a search term
+            video_ids: Only search these videos
+            limit: Maximum hits to return
+
+        Returns:
+            Dict with "hits" (videoId, language, start, end, text, score;
+            best first) and "total" (passages matching any term)
+        """
+        terms = set(tokenize(query))
+        allowed = set(video_ids) if video_ids is not None else None
+        with self._lock:
+            count = len(self._passages)
+            if not terms or not count:
+                return {"hits": [], "total": 0}
+            avg_length = self._total_length / count
+            scores: Dict[int, float] = {}
+            for term in terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+                for passage_id, tf in postings.items():
+                    passage = self._passages[passage_id]
+                    if allowed is not None and passage[0][0] not in allowed:
+                        continue
+                    norm = self.k1 * (1 - self.b + self.b * passage[4] / avg_length)
+                    scores[passage_id] = scores.get(passage_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:max(limit, 0)]
+            hits = []
+            for passage_id, score in ranked:
+                (video_id, language), start, end, text, _ = self._passages[passage_id]
+                hits.append({
+                    "videoId": video_id,
+                    "language": language,
+                    "start": start,
+                    "end": end,
+                    "text": text,
+                    "score": round(score, 3),
+                })
+            return {"hits": hits, "total": len(scores)}
+
+    def clear(self):
+        with self._lock:
+            self._postings.clear()
+            self._passages.clear()
+            self._transcripts.clear()
+            self._total_length = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "transcripts": len(self._transcripts),
+                "passages": len(self._passages),
+                "terms": len(self._postings),
+            }
+
+    def _remove(self, key: Hashable):
+        for passage_id in self._transcripts.pop(key):
+            _, _, _, text, length = self._passages.pop(passage_id)
+            self._total_length -= length
+            for term in set(tokenize(text)):
+                postings = self._postings[term]
+                del postings[passage_id]
+                if not postings:
+                    del self._postings[term]
@@ -0,0 +1,207 @@
+"""In-memory transcript segment store.
+
+Fetched transcripts are kept as parallel columns sorted by start time, so
+a time range or a page of segments can be cut out with a binary search
+instead of refetching or re-serializing the whole transcript. Start times
+and durations live in float arrays rather than one dict per segment,
+which keeps a long transcript several times smaller in memory.
+"""
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Hashable, Iterable, List, Optional
+
+
+class TranscriptIndex:
+    """The segments of one transcript as columns sorted by start time.
+
+    Args:
+        video_id: YouTube video ID
+        language: Language code of the fetched track
+        track_kind: "standard" or "asr"
+        translated: Whether the track is a machine translation
+        starts: Segment start times in seconds
+        durations: Segment durations in seconds
+        texts: Segment texts
+    """
+
+    __slots__ = ("video_id", "language", "track_kind", "translated", "starts", "durations", "texts")
+
+    def __init__(self, video_id: str, language: str, track_kind: str, translated: bool,
+                 starts: Iterable[float], durations: Iterable[float], texts: Iterable[str]):
+        self.video_id = video_id
+        self.language = language
+        self.track_kind = track_kind
+        self.translated = translated
+        rows = sorted(zip(starts, durations, texts), key=lambda row: row[0])
+        self.starts = array("d", (row[0] for row in rows))
+        self.durations = array("d", (row[1] for row in rows))
+        self.texts: List[str] = [row[2] for row in rows]
+
+    @classmethod
+    def from_segments(cls, video_id: str, language: str, track_kind: str, translated: bool,
+                      segments: List[dict]) -> "TranscriptIndex":
+        """Build an index from dicts with text, start and duration."""
+        return cls(
+            video_id, language, track_kind, translated,
+            [s["start"] for s in segments],
+            [s["duration"] for s in segments],
+            [s["text"] for s in segments],
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def range(self, start_time: Optional[float] = None, end_time: Optional[float] = None) -> tuple:
+        """Index bounds [lo, hi) of segments overlapping [start_time, end_time)."""
+        lo = 0
+        if start_time is not None:
+            # The segment starting at or before start_time may still be running
+            lo = max(bisect_right(self.starts, start_time) - 1, 0)
+            if lo < len(self) and self.starts[lo] + self.durations[lo] <= start_time:
+                lo += 1
+        hi = len(self)
+        if end_time is not None:
+            hi = max(bisect_left(self.starts, end_time), lo)
+        return lo, hi
+
+    def select(self, start_time: Optional[float] = None, end_time: Optional[float] = None,
+               offset: int = 0, limit: Optional[int] = None) -> dict:
+        """Bounds of a page of segments in a time range.
+
+        Returns:
+            Dict with "slice" (segment positions to return), "total"
+            (segments in the range) and "nextOffset" (None on the last or
+            an empty page, so following it always terminates)
+        """
+        lo, hi = self.range(start_time, end_time)
+        first = min(lo + max(offset, 0), hi)
+        last = hi if limit is None else min(hi, first + max(limit, 0))
+        return {
+            "slice": slice(first, last),
+            "total": hi - lo,
+            "nextOffset": last - lo if first < last < hi else None,
+        }
+
+    def segments(self, positions: slice = slice(None)) -> List[dict]:
+        """Segments as a list of {text, start, duration} dicts."""
+        return [
+            {"text": text, "start": start, "duration": duration}
+            for text, start, duration in zip(
+                self.texts[positions], self.starts[positions], self.durations[positions]
+            )
+        ]
+
+    def columns(self, positions: slice = slice(None)) -> dict:
+        """Segments as parallel starts/durations/texts lists."""
+        return {
+            "starts": self.starts[positions].tolist(),
+            "durations": self.durations[positions].tolist(),
+            "texts": self.texts[positions],
+        }
+
+    def chunks(self, positions: slice = slice(None), max_chars: Optional[int] = None,
+               min_pause: Optional[float] = None) -> List[dict]:
+        """Merge consecutive segments into paragraphs.
+
+        A new paragraph starts when adding the next segment would take the
+        text past max_chars, or when the silence before it is at least
+        min_pause seconds. A single segment longer than max_chars is kept
+        whole.
+
+        Returns:
+            List of {start, end, text} dicts, times in seconds
+        """
+        result: List[dict] = []
+        texts: List[str] = []
+        size = 0
+        chunk_start = chunk_end = 0.0
+        for i in range(*positions.indices(len(self))):
+            start, text = self.starts[i], self.texts[i]
+            if texts and (
+                (max_chars is not None and size + 1 + len(text) > max_chars)
+                or (min_pause is not None and start - chunk_end >= min_pause)
+            ):
+                result.append(_chunk(chunk_start, chunk_end, texts))
+                texts, size = [], 0
+            if texts:
+                size += 1 + len(text)
+            else:
+                chunk_start = chunk_end = start
+                size = len(text)
+            texts.append(text)
+            # Captions overlap, so the paragraph ends with its latest-ending segment
+            chunk_end = max(chunk_end, start + self.durations[i])
+        if texts:
+            result.append(_chunk(chunk_start, chunk_end, texts))
+        return result
+
+    def text(self, positions: slice = slice(None)) -> str:
+        """Joined text of the segments."""
+        return " ".join(self.texts[positions])
+
+
+def _chunk(start: float, end: float, texts: List[str]) -> dict:
+    return {"start": start, "end": round(end, 3), "text": " ".join(texts)}
+
+
+class TranscriptCache:
+    """LRU cache of transcript indexes bounded by total segment count.
+
+    Args:
+        ttl: Seconds an index stays fresh
+        max_segments: Total segments kept across all cached transcripts
+    """
+
+    def __init__(self, ttl: float, max_segments: int):
+        self.ttl = ttl
+        self.max_segments = max_segments
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._segments = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[TranscriptIndex]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, index: TranscriptIndex):
+        if len(index) > self.max_segments:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl, index)
+            self._segments += len(index)
+            while self._segments > self.max_segments:
+                self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._segments = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "transcripts": len(self._entries),
+                "segments": self._segments,
+                "maxSegments": self.max_segments,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _remove(self, key: Hashable):
+        _, index = self._entries.pop(key)
+        self._segments -= len(index)
@@ -1,7 +1,25 @@
-"""YouTube API Client wrapper."""
-from googleapiclient.discovery import build
+"""YouTube API Client wrapper.
+
+Owns the process-wide clients shared by every tool: one built Data API
+service, the per-worker-thread HTTP connections used to execute its
+requests, and one transcript API instance on a pooled requests session.
+"""
+import logging
+import threading
+import time
 from typing import Optional
 
+import httplib2
+import requests
+from requests.adapters import HTTPAdapter
+from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+from youtube_transcript_api import YouTubeTranscriptApi
+
+from src.config import get_config
+
+logger = logging.getLogger(__name__)
+
 
 class YouTubeClient:
     """Wrapper for YouTube Data API v3."""
@@ -9,10 +27,132 @@ class YouTubeClient:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self._client: Optional["build"] = None
+        self._lock = threading.Lock()
+        self.build_seconds: Optional[float] = None
+        # True when warm_up() built the client before any tool needed it
+        self.prebuilt = False
 
     @property
     def client(self):
-        """Lazy-load the YouTube API client."""
+        """Lazy-load the YouTube API client.
+
+        Uses the discovery document bundled with googleapiclient, so building
+        the service needs no network round trip and no discovery file cache.
+        """
         if self._client is None:
-            self._client = build("youtube", "v3", developerKey=self.api_key)
+            with self._lock:
+                if self._client is None:
+                    started = time.perf_counter()
+                    self._client = build(
+                        "youtube",
+                        "v3",
+                        developerKey=self.api_key,
+                        static_discovery=True,
+                        cache_discovery=False
+                    )
+                    self.build_seconds = time.perf_counter() - started
+                    logger.info("Built YouTube API client in %.1f ms", self.build_seconds * 1000)
         return self._client
+
+    def warm_up(self) -> float:
+        """Build the API client now instead of on the first tool call.
+
+        Returns:
+            Seconds spent building the client
+        """
+        if self._client is None:
+            self.client
+            self.prebuilt = True
+        return self.build_seconds
+
+    def stats(self) -> dict:
+        """Build metrics for the stats resource."""
+        return {
+            "built": self._client is not None,
+            "buildSeconds": round(self.build_seconds, 4) if self.build_seconds is not None else None,
+            "prebuilt": self.prebuilt,
+        }
+
+
+_client: Optional[YouTubeClient] = None
+_transcript_api: Optional[YouTubeTranscriptApi] = None
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_youtube_client() -> YouTubeClient:
+    """Get or create the process-wide YouTube client."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                config = get_config()
+                _client = YouTubeClient(api_key=config.api_key)
+    return _client
+
+
+def client_stats() -> dict:
+    """Build metrics of the shared client, without creating it."""
+    client = _client
+    if client is None:
+        return {"built": False, "buildSeconds": None, "prebuilt": False}
+    return client.stats()
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to every request.
+
+    youtube-transcript-api calls session.get/post without a timeout, so a
+    stalled socket would otherwise hold its worker thread indefinitely.
+    """
+
+    def __init__(self, timeout: float, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=timeout if timeout is not None else self.timeout, **kwargs)
+
+
+def get_transcript_api() -> YouTubeTranscriptApi:
+    """Get or create the process-wide transcript API.
+
+    The underlying requests session keeps one connection pool sized to the
+    worker thread pool, so concurrent transcript fetches reuse connections,
+    and gives every request YOUTUBE_TRANSCRIPT_TIMEOUT as its socket timeout.
+    """
+    global _transcript_api
+    if _transcript_api is None:
+        with _lock:
+            if _transcript_api is None:
+                config = get_config(require_api_key=False)
+                session = requests.Session()
+                adapter = _TimeoutAdapter(config.transcript_timeout, pool_maxsize=config.max_workers)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _transcript_api = YouTubeTranscriptApi(http_client=session)
+    return _transcript_api
+
+
+def thread_http() -> httplib2.Http:
+    """Return the calling thread's Data API connection.
+
+    httplib2.Http is not thread-safe, so each executor thread keeps one
+    persistent connection and reuses it for every request it executes.
+    Built like googleapiclient's own default connection: a bare
+    httplib2.Http has no socket timeout, so a stalled request would hold a
+    worker thread forever.
+    """
+    http = getattr(_local, "http", None)
+    if http is None:
+        http = build_http()
+        _local.http = http
+    return http
+
+
+def reset_clients():
+    """Drop the shared clients so the next call rebuilds them (e.g. new API key)."""
+    global _client, _transcript_api
+    with _lock:
+        _client = None
+        _transcript_api = None
@@ -21,6 +21,28 @@ def pytest_configure(config):
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_state():
+    """Give every test a fresh response cache, rate limiter, quota accountant,
+    channel handle map and transcript caches."""
+    from src.cache import reset_response_cache
+    from src.channel_handles import reset_channel_handles
+    from src.quota import reset_quota_accountant
+    from src.rate_limiter import reset_rate_limiter
+    from src.tools.transcript import reset_transcript_caches
+    reset_response_cache()
+    reset_rate_limiter()
+    reset_quota_accountant()
+    reset_channel_handles()
+    reset_transcript_caches()
+    yield
+    reset_response_cache()
+    reset_rate_limiter()
+    reset_quota_accountant()
+    reset_channel_handles()
+    reset_transcript_caches()
+
+
 # Test data IDs (real, public content for integration tests)
 @pytest.fixture
 def test_video_id():
@@ -0,0 +1,154 @@
+"""Unit tests for the in-memory response cache."""
+import os
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.cache import ResponseCache, get_response_cache, reset_response_cache, NEGATIVE_TTL, STATISTICS_TTL
+from src.main import call_tool, server_stats
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    """Test ResponseCache behaviour."""
+
+    def test_get_miss_then_hit(self):
+        """get() should miss before set() and hit after."""
+        cache = ResponseCache(max_bytes=1024)
+        assert cache.get("k") is None
+        cache.set("k", {"data": 1}, ttl=60)
+        assert cache.get("k") == {"data": 1}
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_get_returns_copy(self):
+        """Mutating a returned value should not change the cached entry."""
+        cache = ResponseCache(max_bytes=1024)
+        cache.set("k", {"data": [1]}, ttl=60)
+        cache.get("k")["data"].append(2)
+        assert cache.get("k") == {"data": [1]}
+
+    def test_entry_expires(self):
+        """Entries should expire after their TTL."""
+        cache = ResponseCache(max_bytes=1024)
+        with patch("src.cache.time.monotonic", return_value=100.0):
+            cache.set("k", {"data": 1}, ttl=10)
+        with patch("src.cache.time.monotonic", return_value=111.0):
+            assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction_by_bytes(self):
+        """The least recently used entry should be evicted when over the byte bound."""
+        value = {"data": "x" * 40}
+        cache = ResponseCache(max_bytes=120)
+        cache.set("a", value, ttl=60)
+        cache.set("b", value, ttl=60)
+        cache.get("a")
+        cache.set("c", value, ttl=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == value
+        assert cache.get("c") == value
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] <= 120
+
+    def test_oversized_value_not_stored(self):
+        """Values larger than the whole cache should be skipped."""
+        cache = ResponseCache(max_bytes=10)
+        cache.set("k", {"data": "x" * 100}, ttl=60)
+        assert cache.get("k") is None
+
+    def test_make_key_ignores_argument_order(self):
+        """Keys should be stable regardless of argument order."""
+        assert ResponseCache.make_key("t", {"a": 1, "b": 2}) == ResponseCache.make_key("t", {"b": 2, "a": 1})
+
+    def test_ttl_for_statistics_is_short(self):
+        """Requests that include statistics should use the short TTL."""
+        cache = ResponseCache(max_bytes=1024)
+        assert cache.ttl_for("youtube_get_video", {"part": ["snippet"]}) == 3600
+        assert cache.ttl_for("youtube_get_video", {"part": ["snippet", "statistics"]}) == STATISTICS_TTL
+
+    def test_ttl_overrides(self):
+        """Configured TTLs should override defaults."""
+        cache = ResponseCache(max_bytes=1024, ttls={"youtube_get_channel": 5})
+        assert cache.ttl_for("youtube_get_channel") == 5
+
+    def test_ttl_for_result(self):
+        """Negative answers get the short negative TTL; other errors are not cached."""
+        cache = ResponseCache(max_bytes=1024)
+        ok = {"data": {}, "error": None}
+        assert cache.ttl_for_result("youtube_get_channel", {}, ok) == 3600
+        for code in ("NotFound", "TranscriptsDisabled"):
+            missing = {"data": None, "error": {"code": code, "message": ""}}
+            assert cache.ttl_for_result("youtube_get_transcript", {}, missing) == NEGATIVE_TTL
+        failed = {"data": None, "error": {"code": "HttpError", "message": ""}}
+        assert cache.ttl_for_result("youtube_get_channel", {}, failed) == 0
+
+    def test_negative_ttl_override(self):
+        """The negative TTL is configured under the "negative" key, capped by the tool TTL."""
+        missing = {"data": None, "error": {"code": "NotFound", "message": ""}}
+        assert ResponseCache(max_bytes=1024, ttls={"negative": 30}).negative_ttl == 30
+        cache = ResponseCache(max_bytes=1024, ttls={"youtube_get_video": 10})
+        assert cache.ttl_for_result("youtube_get_video", {}, missing) == 10
+
+    def test_shared_cache_from_config(self):
+        """get_response_cache() should read its bound and TTLs from the environment."""
+        with patch.dict(os.environ, {"YOUTUBE_CACHE_MAX_BYTES": "2048", "YOUTUBE_CACHE_TTLS": "youtube_search=7"}):
+            reset_response_cache()
+            cache = get_response_cache()
+        assert cache is get_response_cache()
+        assert cache.max_bytes == 2048
+        assert cache.ttl_for("youtube_search") == 7
+
+
+@pytest.mark.unit
+class TestCallToolCaching:
+    """Test caching in the call_tool dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_call_served_from_cache(self):
+        """A repeated call with the same arguments should not reach the tool."""
+        result = {"data": {"id": "abc123"}, "error": None, "pagination": None}
+        with patch("src.main.youtube_get_video", new=AsyncMock(return_value=result)) as mock_tool:
+            first = await call_tool("youtube_get_video", {"video_id": "abc123"})
+            second = await call_tool("youtube_get_video", {"video_id": "abc123"})
+
+        first.pop("quota")
+        second.pop("quota")
+        assert first == second == result
+        assert mock_tool.await_count == 1
+        assert server_stats()["cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_defaults_normalized_in_key(self):
+        """Explicit default arguments should hit the same entry as omitted ones."""
+        result = {"data": [], "error": None, "pagination": None}
+        with patch("src.main.youtube_search", new=AsyncMock(return_value=result)) as mock_tool:
+            await call_tool("youtube_search", {"query": "python"})
+            await call_tool("youtube_search", {"query": "python", "max_results": 10, "order": "relevance"})
+
+        assert mock_tool.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_not_found_cached_briefly(self):
+        """A NotFound answer should be served from cache until the negative TTL passes."""
+        result = {"data": None, "error": {"code": "NotFound", "message": "Video not found: nope"}, "pagination": None}
+        with patch("src.main.youtube_get_video", new=AsyncMock(return_value=result)) as mock_tool:
+            first = await call_tool("youtube_get_video", {"video_id": "nope"})
+            second = await call_tool("youtube_get_video", {"video_id": "nope"})
+            with patch("src.cache.time.monotonic", return_value=time.monotonic() + NEGATIVE_TTL + 1):
+                await call_tool("youtube_get_video", {"video_id": "nope"})
+
+        assert first["error"] == second["error"] == result["error"]
+        assert second["quota"]["callCost"] == 0
+        assert mock_tool.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self):
+        """Error responses should not be cached."""
+        result = {"data": None, "error": {"code": "HttpError", "message": "boom"}, "pagination": None}
+        with patch("src.main.youtube_get_channel", new=AsyncMock(return_value=result)) as mock_tool:
+            await call_tool("youtube_get_channel", {"channel_id": "UCabc"})
+            await call_tool("youtube_get_channel", {"channel_id": "UCabc"})
+
+        assert mock_tool.await_count == 2
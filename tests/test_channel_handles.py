@@ -0,0 +1,51 @@
+"""Unit tests for the channel handle map."""
+import pytest
+from unittest.mock import patch
+
+from src.channel_handles import ChannelHandleMap, lookup_params
+from src.disk_cache import DiskCache
+
+
+@pytest.mark.unit
+class TestChannelHandleMap:
+    """Test name to channel ID resolution storage."""
+
+    def test_lookup_params_order(self):
+        """Handles try forHandle first, bare names forUsername first."""
+        assert lookup_params("@Name") == [{"forHandle": "@Name"}, {"forUsername": "Name"}]
+        assert lookup_params("Name") == [{"forUsername": "Name"}, {"forHandle": "@Name"}]
+
+    def test_names_are_case_insensitive(self):
+        """Mappings should be found regardless of case and surrounding spaces."""
+        handles = ChannelHandleMap()
+        handles.set("@Google", "UCgoogle")
+        assert handles.get(" @google ") == "UCgoogle"
+        assert handles.get("google") is None
+        assert handles.stats() == {"names": 1, "hits": 1, "misses": 1}
+
+    def test_mapping_expires(self):
+        """Mappings older than the TTL should be resolved again."""
+        handles = ChannelHandleMap(ttl=60)
+        handles.set("@google", "UCgoogle")
+        with patch("src.channel_handles.time.time", return_value=1e12):
+            assert handles.get("@google") is None
+
+    def test_persisted_across_instances(self, tmp_path):
+        """With a store, a new server process should reuse earlier resolutions."""
+        path = str(tmp_path / "cache.db")
+        ChannelHandleMap(store=DiskCache(path, max_bytes=1024 * 1024)).set("@Google", "UCgoogle")
+
+        handles = ChannelHandleMap(store=DiskCache(path, max_bytes=1024 * 1024))
+        assert handles.get("@google") == "UCgoogle"
+        assert handles.stats()["names"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_access_uses_store(self, tmp_path):
+        """aget/aset should read and write the store through its own thread."""
+        path = str(tmp_path / "cache.db")
+        await ChannelHandleMap(store=DiskCache(path, max_bytes=1024 * 1024)).aset("@Google", "UCgoogle")
+
+        handles = ChannelHandleMap(store=DiskCache(path, max_bytes=1024 * 1024))
+        assert await handles.aget("@google") == "UCgoogle"
+        assert await handles.aget("@nobody") is None
+        assert handles.stats() == {"names": 1, "hits": 1, "misses": 1}
@@ -1,7 +1,94 @@
 """Tests for YouTube client."""
-from src.youtube_client import YouTubeClient
+import os
+import threading
+from unittest.mock import Mock, patch
+from src.config import get_config
+from src.youtube_client import (
+    YouTubeClient, get_youtube_client, get_transcript_api, thread_http, reset_clients
+)
 
 
 def test_client_initialization():
     client = YouTubeClient(api_key="test_key")
     assert client.api_key == "test_key"
+
+
+def test_shared_client_is_process_wide():
+    os.environ["YOUTUBE_API_KEY"] = "test_key"
+    reset_clients()
+    try:
+        assert get_youtube_client() is get_youtube_client()
+        assert get_transcript_api() is get_transcript_api()
+    finally:
+        reset_clients()
+
+
+def test_tools_share_one_service_build():
+    os.environ["YOUTUBE_API_KEY"] = "test_key"
+    reset_clients()
+    try:
+        with patch("src.youtube_client.build") as mock_build:
+            from src.tools import search, video, channel
+            for module in (search, video, channel):
+                module.get_youtube_client().client
+            assert mock_build.call_count == 1
+    finally:
+        reset_clients()
+
+
+def test_thread_http_is_per_thread():
+    results = []
+    worker = threading.Thread(target=lambda: results.append(thread_http()))
+    worker.start()
+    worker.join()
+
+    assert thread_http() is thread_http()
+    assert results[0] is not thread_http()
+
+
+def test_thread_http_has_timeout():
+    from googleapiclient.http import DEFAULT_HTTP_TIMEOUT_SEC
+    http = thread_http()
+    assert http.timeout == DEFAULT_HTTP_TIMEOUT_SEC
+    assert 308 not in http.redirect_codes
+
+
+def test_client_uses_static_discovery():
+    client = YouTubeClient(api_key="test_key")
+    with patch("src.youtube_client.build") as mock_build:
+        client.client
+    kwargs = mock_build.call_args[1]
+    assert kwargs["static_discovery"] is True
+    assert kwargs["cache_discovery"] is False
+
+
+def test_client_builds_offline_and_records_build_time():
+    client = YouTubeClient(api_key="test_key")
+    with patch("httplib2.Http.request", side_effect=AssertionError("network used")):
+        seconds = client.warm_up()
+    assert client._client is not None
+    assert seconds == client.build_seconds
+    assert seconds >= 0
+
+
+def test_lazily_built_client_is_not_prebuilt():
+    client = YouTubeClient(api_key="test_key")
+    with patch("src.youtube_client.build"):
+        client.client
+        client.warm_up()
+    assert client.stats()["built"] is True
+    assert client.stats()["prebuilt"] is False
+
+
+def test_transcript_session_has_default_timeout():
+    reset_clients()
+    try:
+        session = get_transcript_api()._fetcher._http_client
+        adapter = session.get_adapter("https://www.youtube.com/watch")
+        with patch("requests.adapters.HTTPAdapter.send") as send:
+            adapter.send(Mock())
+            adapter.send(Mock(), timeout=5)
+        assert send.call_args_list[0].kwargs["timeout"] == get_config(require_api_key=False).transcript_timeout
+        assert send.call_args_list[1].kwargs["timeout"] == 5
+    finally:
+        reset_clients()
@@ -0,0 +1,175 @@
+"""Unit tests for request coalescing."""
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+
+from src.coalescer import RequestCoalescer
+from src.tools.video import youtube_get_video, video_coalescer
+from src.tools.channel import youtube_get_channel, channel_coalescer
+
+
+class RecordingFetcher:
+    """Batch fetcher that records each batch and returns {"id": key} items."""
+
+    def __init__(self, missing=(), error=None):
+        self.calls = []
+        self.missing = set(missing)
+        self.error = error
+
+    async def __call__(self, group, ids):
+        self.calls.append((group, list(ids)))
+        if self.error:
+            raise self.error
+        return {i: {"id": i, "group": group} for i in ids if i not in self.missing}
+
+
+@pytest.mark.unit
+class TestRequestCoalescer:
+    """Test RequestCoalescer behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_one_batch(self):
+        """Lookups within the window should be fetched in one batch."""
+        fetch = RecordingFetcher()
+        coalescer = RequestCoalescer(fetch, window=0.01)
+
+        results = await asyncio.gather(*(coalescer.load("g", f"id{i}") for i in range(10)))
+
+        assert [r["id"] for r in results] == [f"id{i}" for i in range(10)]
+        assert len(fetch.calls) == 1
+        assert coalescer.stats() == {"requests": 10, "batches": 1, "saved": 9}
+
+    @pytest.mark.asyncio
+    async def test_duplicate_keys_fetched_once(self):
+        """The same key requested twice should appear once in the batch."""
+        fetch = RecordingFetcher()
+        coalescer = RequestCoalescer(fetch, window=0.01)
+
+        await asyncio.gather(coalescer.load("g", "a"), coalescer.load("g", "a"))
+
+        assert fetch.calls == [("g", ["a"])]
+
+    @pytest.mark.asyncio
+    async def test_groups_batched_separately(self):
+        """Different groups should not share a batch."""
+        fetch = RecordingFetcher()
+        coalescer = RequestCoalescer(fetch, window=0.01)
+
+        await asyncio.gather(coalescer.load("g1", "a"), coalescer.load("g2", "b"))
+
+        assert sorted(fetch.calls) == [("g1", ["a"]), ("g2", ["b"])]
+
+    @pytest.mark.asyncio
+    async def test_flushes_at_max_batch(self):
+        """A group reaching max_batch should flush without waiting for the window."""
+        fetch = RecordingFetcher()
+        coalescer = RequestCoalescer(fetch, window=10, max_batch=3)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(coalescer.load("g", f"id{i}") for i in range(3))),
+            timeout=1
+        )
+
+        assert len(results) == 3
+        assert len(fetch.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_key_returns_none(self):
+        """Keys absent from the batch result should resolve to None."""
+        coalescer = RequestCoalescer(RecordingFetcher(missing={"b"}), window=0.01)
+
+        a, b = await asyncio.gather(coalescer.load("g", "a"), coalescer.load("g", "b"))
+
+        assert a["id"] == "a"
+        assert b is None
+
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_waiter(self):
+        """A failing batch should raise in every waiting caller."""
+        coalescer = RequestCoalescer(RecordingFetcher(error=RuntimeError("boom")), window=0.01)
+
+        results = await asyncio.gather(
+            coalescer.load("g", "a"), coalescer.load("g", "b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_zero_window_disables_batching(self):
+        """A zero window should fetch each lookup on its own."""
+        fetch = RecordingFetcher()
+        coalescer = RequestCoalescer(fetch, window=0)
+
+        await asyncio.gather(coalescer.load("g", "a"), coalescer.load("g", "b"))
+
+        assert len(fetch.calls) == 2
+
+
+@pytest.mark.unit
+class TestToolCoalescing:
+    """Test coalescing behind youtube_get_video and youtube_get_channel."""
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_parallel_get_video_calls_share_one_request(self, mock_get_client):
+        """Parallel youtube_get_video calls should become one videos.list request."""
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        mock_videos = Mock()
+        mock_videos.list.side_effect = lambda id, part: Mock(
+            execute=Mock(return_value={"items": [{"id": i} for i in id.split(",")]})
+        )
+        mock_client_instance.client.videos.return_value = mock_videos
+
+        ids = [f"vid{i}" for i in range(20)]
+        results = await asyncio.gather(*(youtube_get_video(video_id=i) for i in ids))
+
+        assert [r["data"]["id"] for r in results] == ids
+        assert mock_videos.list.call_count == 1
+        assert mock_videos.list.call_args[1]["id"] == ",".join(ids)
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_get_video_different_parts_not_merged(self, mock_get_client):
+        """Calls asking for different parts should use separate requests."""
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        mock_videos = Mock()
+        mock_videos.list.return_value.execute.return_value = {"items": [{"id": "a"}]}
+        mock_client_instance.client.videos.return_value = mock_videos
+
+        await asyncio.gather(
+            youtube_get_video(video_id="a", part=["snippet"]),
+            youtube_get_video(video_id="a", part=["statistics"]),
+        )
+
+        parts = sorted(c[1]["part"] for c in mock_videos.list.call_args_list)
+        assert parts == ["snippet", "statistics"]
+
+    @pytest.mark.asyncio
+    @patch("src.tools.channel.get_youtube_client")
+    async def test_parallel_get_channel_calls_share_one_request(self, mock_get_client):
+        """Parallel youtube_get_channel calls by ID should become one channels.list request."""
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        mock_channels = Mock()
+        mock_channels.list.side_effect = lambda id, part: Mock(
+            execute=Mock(return_value={"items": [{"id": i} for i in id.split(",") if i != "UCgone"]})
+        )
+        mock_client_instance.client.channels.return_value = mock_channels
+
+        found, missing = await asyncio.gather(
+            youtube_get_channel(channel_id="UCone"),
+            youtube_get_channel(channel_id="UCgone"),
+        )
+
+        assert found["data"]["id"] == "UCone"
+        assert missing["error"]["code"] == "NotFound"
+        assert mock_channels.list.call_count == 1
+
+    def test_window_read_from_config(self, monkeypatch):
+        """The window should default from YOUTUBE_COALESCE_WINDOW_MS."""
+        monkeypatch.setenv("YOUTUBE_COALESCE_WINDOW_MS", "20")
+        coalescer = RequestCoalescer(RecordingFetcher())
+        assert coalescer._window() == 0.02
+        assert video_coalescer.max_batch == channel_coalescer.max_batch == 50
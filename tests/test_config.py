@@ -15,3 +15,32 @@ def test_get_config_defaults():
     config = get_config()
     assert config.api_key == "test_key_for_defaults"
     assert config.rate_limit == 100
+
+def test_get_config_max_workers():
+    os.environ["YOUTUBE_API_KEY"] = "test_key"
+    os.environ["YOUTUBE_MAX_WORKERS"] = "4"
+    try:
+        assert get_config().max_workers == 4
+    finally:
+        os.environ.pop("YOUTUBE_MAX_WORKERS", None)
+
+def test_get_config_without_api_key_when_not_required():
+    saved = os.environ.pop("YOUTUBE_API_KEY", None)
+    try:
+        config = get_config(require_api_key=False)
+        assert config.api_key == ""
+        assert config.max_workers == 8
+    finally:
+        if saved is not None:
+            os.environ["YOUTUBE_API_KEY"] = saved
+
+def test_get_config_transcript_settings():
+    os.environ["YOUTUBE_TRANSCRIPT_CONCURRENCY"] = "2"
+    os.environ["YOUTUBE_TRANSCRIPT_TIMEOUT"] = "5.5"
+    try:
+        config = get_config(require_api_key=False)
+        assert config.transcript_concurrency == 2
+        assert config.transcript_timeout == 5.5
+    finally:
+        os.environ.pop("YOUTUBE_TRANSCRIPT_CONCURRENCY", None)
+        os.environ.pop("YOUTUBE_TRANSCRIPT_TIMEOUT", None)
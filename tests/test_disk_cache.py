@@ -0,0 +1,167 @@
+"""Unit tests for the persistent SQLite response cache."""
+import json
+import os
+import sqlite3
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+from src.cache import ResponseCache, get_response_cache, reset_response_cache
+from src.disk_cache import DiskCache
+
+
+@pytest.mark.unit
+class TestDiskCache:
+    """Test DiskCache behaviour."""
+
+    def test_round_trip(self, tmp_path):
+        """A stored payload should be returned until it expires."""
+        cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=1024 * 1024)
+        cache.set("k", '{"data":1}', time.time() + 60)
+
+        payload, expires_at = cache.get("k")
+        assert payload == '{"data":1}'
+        assert expires_at > time.time()
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Expired entries should not be returned."""
+        cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=1024 * 1024)
+        cache.set("k", '{"data":1}', time.time() - 1)
+        assert cache.get("k") is None
+
+    def test_values_are_compressed(self, tmp_path):
+        """Stored values should be smaller than the JSON text."""
+        cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=1024 * 1024)
+        payload = json.dumps({"text": "never gonna give you up " * 200})
+        cache.set("k", payload, time.time() + 60)
+
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["bytes"] < len(payload) / 5
+
+    def test_uses_wal_mode(self, tmp_path):
+        """The database should be in WAL mode so processes can share it."""
+        path = str(tmp_path / "cache.db")
+        DiskCache(path, max_bytes=1024)
+        mode = sqlite3.connect(path).execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_survives_restart(self, tmp_path):
+        """A new instance on the same file should see earlier entries."""
+        path = str(tmp_path / "cache.db")
+        DiskCache(path, max_bytes=1024 * 1024).set("k", '"v"', time.time() + 60)
+        assert DiskCache(path, max_bytes=1024 * 1024).get("k")[0] == '"v"'
+
+    def test_shared_between_instances(self, tmp_path):
+        """Two open instances (like two server processes) should see each other's writes."""
+        path = str(tmp_path / "cache.db")
+        first = DiskCache(path, max_bytes=1024 * 1024)
+        second = DiskCache(path, max_bytes=1024 * 1024)
+        first.set("a", '"1"', time.time() + 60)
+        second.set("b", '"2"', time.time() + 60)
+        assert second.get("a")[0] == '"1"'
+        assert first.get("b")[0] == '"2"'
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """evict() should drop the oldest-accessed entries until under max_bytes."""
+        cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=1024 * 1024)
+        for i, key in enumerate(["old", "mid", "new"]):
+            with patch("src.disk_cache.time.time", return_value=1000.0 + i):
+                cache.set(key, os.urandom(200).hex(), 10 ** 10)
+        cache.max_bytes = cache.stats()["bytes"] - 1
+
+        cache.evict()
+
+        assert cache.get("old") is None
+        assert cache.get("mid") is not None
+        assert cache.get("new") is not None
+
+    def test_evict_drops_expired(self, tmp_path):
+        """evict() should delete expired rows."""
+        cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=1024 * 1024)
+        cache.set("gone", '"x"', time.time() - 1)
+        cache.evict()
+        assert cache.stats()["entries"] == 0
+
+    def test_errors_are_misses(self, tmp_path):
+        """Database errors should be reported as misses, not raised."""
+        cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=1024 * 1024)
+        cache._connection().execute("DROP TABLE responses")
+        assert cache.get("k") is None
+        cache.set("k", '"v"', time.time() + 60)
+        assert cache.stats()["errors"] == 2
+
+
+@pytest.mark.unit
+class TestResponseCacheDiskTier:
+    """Test the ResponseCache persistent tier."""
+
+    def test_memory_miss_falls_back_to_disk(self, tmp_path):
+        """A fresh process should be served from the disk tier."""
+        path = str(tmp_path / "cache.db")
+        ResponseCache(max_bytes=1024, disk=DiskCache(path, 1024 * 1024)).set("k", {"data": 1}, ttl=60)
+
+        restarted = ResponseCache(max_bytes=1024, disk=DiskCache(path, 1024 * 1024))
+        assert restarted.get("k") == {"data": 1}
+        assert restarted.stats()["entries"] == 1
+        assert restarted.stats()["disk"]["hits"] == 1
+
+    def test_disk_only_when_memory_disabled(self, tmp_path):
+        """Setting the memory bound to 0 should still use the disk tier."""
+        cache = ResponseCache(max_bytes=0, disk=DiskCache(str(tmp_path / "cache.db"), 1024 * 1024))
+        cache.set("k", {"data": 1}, ttl=60)
+        assert cache.get("k") == {"data": 1}
+
+    @pytest.mark.asyncio
+    async def test_async_access_runs_off_the_event_loop(self, tmp_path):
+        """aget/aset should touch SQLite on the cache thread, not the caller's."""
+        disk = DiskCache(str(tmp_path / "cache.db"), 1024 * 1024)
+        threads = []
+        original = disk.get_first
+
+        def recording_get_first(keys):
+            threads.append(threading.current_thread())
+            return original(keys)
+
+        disk.get_first = recording_get_first
+        await ResponseCache(max_bytes=1024, disk=disk).aset("k", {"data": 1}, ttl=60)
+
+        restarted = ResponseCache(max_bytes=1024, disk=disk)
+        assert await restarted.aget("k") == {"data": 1}
+        assert await restarted.aget("missing") is None
+        assert threads and all(t is not threading.current_thread() for t in threads)
+        assert restarted.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_first_is_one_lookup(self, tmp_path):
+        """Probing several keys should take one disk query and count one hit or miss."""
+        disk = DiskCache(str(tmp_path / "cache.db"), 1024 * 1024)
+        disk.set("full", json.dumps({"data": 2}), time.time() + 60)
+        cache = ResponseCache(max_bytes=1024, disk=disk)
+
+        assert await cache.aget_first(["projected", "full"]) == ("full", {"data": 2})
+        assert await cache.aget_first(["other", "missing"]) == (None, None)
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert (stats["disk"]["hits"], stats["disk"]["misses"]) == (1, 1)
+
+    def test_shared_cache_uses_configured_path(self, tmp_path):
+        """YOUTUBE_CACHE_PATH should enable the disk tier."""
+        path = str(tmp_path / "nested" / "cache.db")
+        with patch.dict(os.environ, {"YOUTUBE_CACHE_PATH": path}):
+            reset_response_cache()
+            cache = get_response_cache()
+        assert cache.disk is not None
+        assert os.path.exists(path)
+
+    def test_unusable_path_falls_back_to_memory(self, tmp_path):
+        """An unwritable YOUTUBE_CACHE_PATH should disable the disk tier, not fail."""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        with patch.dict(os.environ, {"YOUTUBE_CACHE_PATH": str(blocker / "cache.db")}):
+            reset_response_cache()
+            cache = get_response_cache()
+        assert cache.disk is None
+        cache.set("k", {"data": 1}, ttl=60)
+        assert cache.get("k") == {"data": 1}
@@ -0,0 +1,127 @@
+"""Unit tests for the blocking-call execution layer."""
+import asyncio
+import os
+import time
+import httplib2
+import pytest
+from unittest.mock import Mock, patch
+
+from src.executor import execute, run_blocking, get_executor, shutdown_executor
+from src.tools.video import youtube_get_video
+
+DELAY = 0.2
+CONCURRENCY = 5
+
+
+def _slow_call(value):
+    time.sleep(DELAY)
+    return value
+
+
+@pytest.mark.unit
+class TestExecutor:
+    """Test the shared thread pool."""
+
+    def setup_method(self):
+        shutdown_executor()
+
+    def teardown_method(self):
+        shutdown_executor()
+
+    def test_pool_size_from_config(self):
+        """Thread pool should be sized by YOUTUBE_MAX_WORKERS."""
+        with patch.dict(os.environ, {"YOUTUBE_MAX_WORKERS": "3"}):
+            assert get_executor()._max_workers == 3
+
+    @pytest.mark.asyncio
+    async def test_run_blocking_returns_result(self):
+        """run_blocking should return the callable's result."""
+        assert await run_blocking(lambda a, b=0: a + b, 1, b=2) == 3
+
+    @pytest.mark.asyncio
+    async def test_run_blocking_propagates_exception(self):
+        """run_blocking should re-raise the callable's exception."""
+        def boom():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await run_blocking(boom)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_overlap(self):
+        """N concurrent blocking calls should finish in roughly the time of one."""
+        start = time.perf_counter()
+        results = await asyncio.gather(*(run_blocking(_slow_call, i) for i in range(CONCURRENCY)))
+        elapsed = time.perf_counter() - start
+
+        assert results == list(range(CONCURRENCY))
+        assert elapsed < DELAY * 2
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        """The event loop should keep running while a blocking call is in flight."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await run_blocking(_slow_call, None)
+        task.cancel()
+
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_MAX_WORKERS": "1"})
+    async def test_execute_reuses_thread_http(self):
+        """execute() should give each worker thread one reusable HTTP connection."""
+        seen = []
+
+        def fake_execute(http=None):
+            seen.append(http)
+            return {"ok": True}
+
+        request = Mock()
+        request.execute.side_effect = fake_execute
+
+        assert await execute(request) == {"ok": True}
+        await execute(request)
+
+        assert isinstance(seen[0], httplib2.Http)
+        assert seen[0] is seen[1]
+
+
+@pytest.mark.unit
+class TestToolConcurrency:
+    """Tools should overlap their blocking API calls."""
+
+    def setup_method(self):
+        shutdown_executor()
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.video.get_youtube_client")
+    async def test_concurrent_get_video_calls_overlap(self, mock_get_client):
+        """Concurrent youtube_get_video calls should not run back to back."""
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+
+        def slow_execute(http=None):
+            time.sleep(DELAY)
+            return {"items": [{"id": "abc123"}]}
+
+        mock_videos = Mock()
+        mock_videos.list.return_value.execute.side_effect = slow_execute
+        mock_client_instance.client.videos.return_value = mock_videos
+
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *(youtube_get_video(video_id="abc123") for _ in range(CONCURRENCY))
+        )
+        elapsed = time.perf_counter() - start
+
+        assert all(r["error"] is None for r in results)
+        assert elapsed < DELAY * 2
@@ -0,0 +1,346 @@
+"""Unit tests for partial-response field projections."""
+import pytest
+from unittest.mock import Mock, patch
+
+from src.fields import (
+    DEFAULT_FIELDS, api_fields, default_fields, parse_fields, payload_size, project, project_result, to_selector
+)
+from src.main import call_tool, server_stats
+
+
+def _thumbnails():
+    return {
+        size: {"url": f"https://i.ytimg.com/vi/abc123/{size}.jpg", "width": width, "height": width * 9 // 16}
+        for size, width in [("default", 120), ("medium", 320), ("high", 480), ("standard", 640), ("maxres", 1280)]
+    }
+
+
+FULL_VIDEO = {
+    "kind": "youtube#video",
+    "etag": "Ks-_Mh1QhMc",
+    "id": "abc123",
+    "snippet": {
+        "publishedAt": "2024-01-01T00:00:00Z",
+        "channelId": "UCabc123",
+        "title": "Test Video",
+        "description": "A description that runs for a while. " * 20,
+        "thumbnails": _thumbnails(),
+        "channelTitle": "Test Channel",
+        "tags": ["python", "tutorial", "programming"],
+        "categoryId": "27",
+        "liveBroadcastContent": "none",
+        "defaultAudioLanguage": "en",
+        "localized": {"title": "Test Video", "description": "A description that runs for a while. " * 20},
+    },
+    "contentDetails": {
+        "duration": "PT10M30S", "dimension": "2d", "definition": "hd", "caption": "true",
+        "licensedContent": True, "contentRating": {}, "projection": "rectangular",
+        "regionRestriction": {"blocked": ["DE", "FR"]},
+    },
+    "statistics": {"viewCount": "1000", "likeCount": "100", "favoriteCount": "0", "commentCount": "10"},
+}
+
+FULL_CHANNEL = {
+    "kind": "youtube#channel",
+    "etag": "x8bP1yJ2mEo",
+    "id": "UCabc123",
+    "snippet": {
+        "title": "Test Channel",
+        "description": "Channel description. " * 30,
+        "customUrl": "@testchannel",
+        "publishedAt": "2020-01-01T00:00:00Z",
+        "thumbnails": _thumbnails(),
+        "localized": {"title": "Test Channel", "description": "Channel description. " * 30},
+        "country": "US",
+    },
+    "contentDetails": {"relatedPlaylists": {"likes": "", "uploads": "UUabc123"}},
+    "statistics": {"viewCount": "1000000", "subscriberCount": "10000", "hiddenSubscriberCount": False,
+                   "videoCount": "500"},
+}
+
+FULL_SEARCH_RESULT = {
+    "kind": "youtube#searchResult",
+    "etag": "q1b2c3d4e5f",
+    "id": {"kind": "youtube#video", "videoId": "abc123"},
+    "snippet": {
+        "publishedAt": "2024-01-01T00:00:00Z",
+        "channelId": "UCabc123",
+        "title": "Test Video",
+        "description": "A short search snippet description...",
+        "thumbnails": _thumbnails(),
+        "channelTitle": "Test Channel",
+        "liveBroadcastContent": "none",
+        "publishTime": "2024-01-01T00:00:00Z",
+    },
+}
+
+FULL_PLAYLIST_ITEM = {
+    "kind": "youtube#playlistItem",
+    "etag": "pQ9r8s7t6u5",
+    "id": "UExhYmMxMjMuNTZCNDRGNkQxMDU1N0NDNg",
+    "snippet": {
+        "publishedAt": "2024-01-02T00:00:00Z",
+        "channelId": "UCabc123",
+        "title": "Test Video",
+        "description": "A description that runs for a while. " * 20,
+        "thumbnails": _thumbnails(),
+        "channelTitle": "Test Channel",
+        "playlistId": "PLabc123",
+        "position": 0,
+        "resourceId": {"kind": "youtube#video", "videoId": "abc123"},
+        "videoOwnerChannelTitle": "Test Channel",
+        "videoOwnerChannelId": "UCabc123",
+    },
+    "contentDetails": {"videoId": "abc123", "videoPublishedAt": "2024-01-01T00:00:00Z"},
+}
+
+FULL_PLAYLIST = {
+    "kind": "youtube#playlist",
+    "etag": "z9y8x7w6v5u",
+    "id": "PLabc123",
+    "snippet": {
+        "publishedAt": "2023-06-01T00:00:00Z",
+        "channelId": "UCabc123",
+        "title": "Test Playlist",
+        "description": "Playlist description. " * 10,
+        "thumbnails": _thumbnails(),
+        "channelTitle": "Test Channel",
+        "localized": {"title": "Test Playlist", "description": "Playlist description. " * 10},
+    },
+    "contentDetails": {"itemCount": 42},
+}
+
+_COMMENT_SNIPPET = {
+    "channelId": "UCabc123",
+    "videoId": "abc123",
+    "textDisplay": "Great video!",
+    "textOriginal": "Great video!",
+    "authorDisplayName": "@viewer",
+    "authorProfileImageUrl": "https://yt3.ggpht.com/ytc/AIdro_abcdefghijklmnopqrstuvwxyz=s48-c-k-c0x00ffffff-no-rj",
+    "authorChannelUrl": "http://www.youtube.com/@viewer",
+    "authorChannelId": {"value": "UCviewer"},
+    "canRate": True,
+    "viewerRating": "none",
+    "likeCount": 3,
+    "publishedAt": "2024-01-03T00:00:00Z",
+    "updatedAt": "2024-01-03T00:00:00Z",
+}
+
+FULL_COMMENT_THREAD = {
+    "kind": "youtube#commentThread",
+    "etag": "c0m3nt7hr34d",
+    "id": "Ugz_thread",
+    "snippet": {
+        "channelId": "UCabc123",
+        "videoId": "abc123",
+        "topLevelComment": {"kind": "youtube#comment", "etag": "e1", "id": "Ugz_thread", "snippet": _COMMENT_SNIPPET},
+        "canReply": True,
+        "totalReplyCount": 1,
+        "isPublic": True,
+    },
+    "replies": {"comments": [
+        {"kind": "youtube#comment", "etag": "e2", "id": "Ugz_thread.r1",
+         "snippet": {**_COMMENT_SNIPPET, "parentId": "Ugz_thread"}},
+    ]},
+}
+
+# (tool, representative full resource, minimum fraction of bytes the default saves)
+SAMPLES = [
+    ("youtube_search", FULL_SEARCH_RESULT, 0.5),
+    ("youtube_get_video", FULL_VIDEO, 0.4),
+    ("youtube_get_videos", FULL_VIDEO, 0.4),
+    ("youtube_get_channel", FULL_CHANNEL, 0.5),
+    ("youtube_get_playlist", FULL_PLAYLIST_ITEM, 0.4),
+    ("youtube_list_playlists", FULL_PLAYLIST, 0.5),
+    ("youtube_get_comments", FULL_COMMENT_THREAD, 0.4),
+]
+
+
+@pytest.mark.unit
+class TestParseFields:
+    """Test the selector parser."""
+
+    def test_nested_and_paths(self):
+        """Parentheses and slash paths should both produce nested selections."""
+        tree = parse_fields("id,snippet(title,thumbnails/high/url),statistics")
+        assert tree == {
+            "id": True,
+            "snippet": {"title": True, "thumbnails": {"high": {"url": True}}},
+            "statistics": True,
+        }
+
+    def test_repeated_fields_are_merged(self):
+        """Selecting the same parent twice should merge the children."""
+        assert parse_fields("snippet/title,snippet/description") == {
+            "snippet": {"title": True, "description": True}
+        }
+        assert parse_fields("snippet/title,snippet") == {"snippet": True}
+
+    def test_round_trip(self):
+        """to_selector() should produce an equivalent selector."""
+        for spec in DEFAULT_FIELDS.values():
+            tree = parse_fields(spec)
+            assert parse_fields(to_selector(tree)) == tree
+
+    @pytest.mark.parametrize("spec", ["", "a,", "a(b", "a)b", "a//b", "a(b))"])
+    def test_malformed_selectors_rejected(self, spec):
+        """Malformed selectors should raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_fields(spec)
+
+
+@pytest.mark.unit
+class TestProject:
+    """Test local projection."""
+
+    def test_project_dict_and_lists(self):
+        """Lists should be projected per element and missing fields skipped."""
+        value = {"items": [{"a": 1, "b": 2}, {"a": 3}], "c": 4}
+        assert project(value, parse_fields("items/a,missing")) == {"items": [{"a": 1}, {"a": 3}]}
+
+    def test_wildcard(self):
+        """'*' should select every key at its level."""
+        value = {"x": {"url": "u", "width": 1}, "y": {"url": "v", "width": 2}}
+        assert project(value, parse_fields("*/url")) == {"x": {"url": "u"}, "y": {"url": "v"}}
+
+    def test_api_fields_wraps_items(self):
+        """The API mask should select items plus pagination fields."""
+        assert api_fields("snippet/title") == "items(snippet(title)),nextPageToken,pageInfo"
+        assert api_fields("snippet/title", include_id=True) == "items(snippet(title),id),nextPageToken,pageInfo"
+        assert api_fields("id,statistics", exclude=["statistics"]) == "items(id),nextPageToken,pageInfo"
+        assert api_fields(None) is None
+        assert api_fields("*") is None
+
+    def test_project_result_keeps_error_markers(self):
+        """Batch lookups should keep per-ID error markers intact."""
+        result = {"data": [FULL_VIDEO, {"id": "nope", "error": {"code": "NotFound"}}], "error": None}
+        projected = project_result("youtube_get_videos", result, "id")
+        assert projected["data"] == [{"id": "abc123"}, {"id": "nope", "error": {"code": "NotFound"}}]
+        assert result["data"][0] is FULL_VIDEO
+
+    def test_project_result_playlist_items_only(self):
+        """Playlist projections should apply to items, not the details block."""
+        result = {"data": {"details": FULL_PLAYLIST, "items": [FULL_PLAYLIST_ITEM]}, "error": None}
+        projected = project_result("youtube_get_playlist", result, "snippet/title")
+        assert projected["data"]["details"] == FULL_PLAYLIST
+        assert projected["data"]["items"] == [{"snippet": {"title": "Test Video"}}]
+
+    def test_default_fields_add_requested_parts(self):
+        """Requested parts outside a tool's default are appended whole."""
+        assert default_fields("youtube_get_video") == DEFAULT_FIELDS["youtube_get_video"]
+        assert default_fields("youtube_get_video", ["snippet", "statistics"]) == DEFAULT_FIELDS["youtube_get_video"]
+        assert default_fields("youtube_get_video", ["snippet", "topicDetails,player"]) == (
+            DEFAULT_FIELDS["youtube_get_video"] + ",topicDetails,player"
+        )
+        assert default_fields("youtube_get_transcript", ["status"]) is None
+
+    @pytest.mark.parametrize("tool,resource,min_saving", SAMPLES)
+    def test_default_projection_bytes_saved(self, tool, resource, min_saving):
+        """Each tool's slim default should cut a representative resource substantially."""
+        before = payload_size(resource)
+        after = payload_size(project(resource, parse_fields(DEFAULT_FIELDS[tool])))
+        saving = 1 - after / before
+        print(f"{tool}: {before} -> {after} bytes ({saving:.0%} saved)")
+        assert saving >= min_saving
+
+
+@pytest.mark.unit
+class TestCallToolFields:
+    """Test fields handling in call_tool."""
+
+    def _video_client(self, mock_get_client, item=FULL_VIDEO):
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.client.videos.return_value.list.return_value.execute.return_value = {"items": [item]}
+        return mock_client_instance.client.videos.return_value.list
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_default_projection_applied(self, mock_get_client):
+        """Without fields, the slim default should be sent to the API and applied."""
+        videos_list = self._video_client(mock_get_client)
+        recorded = server_stats()["localProjection"].get("youtube_get_video", {}).get("calls", 0)
+
+        result = await call_tool("youtube_get_video", {"video_id": "abc123"})
+
+        assert "thumbnails" in result["data"]["snippet"]
+        assert set(result["data"]["snippet"]["thumbnails"]) == {"high"}
+        assert "localized" not in result["data"]["snippet"]
+        assert "etag" not in result["data"]
+        assert videos_list.call_args.kwargs["fields"].startswith("items(id,snippet(")
+        # Live results were already masked by the API; they are not measured
+        assert server_stats()["localProjection"].get("youtube_get_video", {}).get("calls", 0) == recorded
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_default_projection_keeps_requested_parts(self, mock_get_client):
+        """Parts outside the slim default should be requested and returned whole."""
+        status = {"uploadStatus": "processed", "privacyStatus": "public", "embeddable": True}
+        videos_list = self._video_client(mock_get_client, {**FULL_VIDEO, "status": status})
+
+        result = await call_tool("youtube_get_video", {"video_id": "abc123", "part": ["snippet", "status"]})
+
+        assert result["data"]["status"] == status
+        assert "localized" not in result["data"]["snippet"]
+        assert "status" in parse_fields(videos_list.call_args.kwargs["fields"])["items"]
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_projected_miss_counts_once(self, mock_get_client):
+        """Probing for a cached full response should not count a second miss."""
+        self._video_client(mock_get_client)
+
+        await call_tool("youtube_get_video", {"video_id": "abc123"})
+
+        assert server_stats()["cache"]["misses"] == 1
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_explicit_fields(self, mock_get_client):
+        """Explicit fields should be passed through and applied."""
+        videos_list = self._video_client(mock_get_client)
+
+        result = await call_tool("youtube_get_video", {"video_id": "abc123", "fields": "statistics/viewCount"})
+
+        assert result["data"] == {"statistics": {"viewCount": "1000"}}
+        assert videos_list.call_args.kwargs["fields"] == "items(statistics(viewCount),id),nextPageToken,pageInfo"
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_star_returns_full_resource(self, mock_get_client):
+        """fields='*' should return the full resource without a mask."""
+        videos_list = self._video_client(mock_get_client)
+
+        result = await call_tool("youtube_get_video", {"video_id": "abc123", "fields": "*"})
+
+        assert result["data"] == FULL_VIDEO
+        assert "fields" not in videos_list.call_args.kwargs
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_projection_served_from_cached_full_response(self, mock_get_client):
+        """A cached full response should answer later projections without an API call."""
+        videos_list = self._video_client(mock_get_client)
+
+        await call_tool("youtube_get_video", {"video_id": "abc123", "fields": "*"})
+        result = await call_tool("youtube_get_video", {"video_id": "abc123", "fields": "snippet/title"})
+
+        assert result["data"] == {"snippet": {"title": "Test Video"}}
+        assert videos_list.return_value.execute.call_count == 1
+        assert server_stats()["localProjection"]["youtube_get_video"]["localBytesSaved"] > 0
+
+    @pytest.mark.asyncio
+    async def test_transcript_fields_applied_locally(self):
+        """Tools without an API fields parameter should still be projected."""
+        transcript = {"data": {"videoId": "abc123", "text": "hi", "segments": [{"text": "hi"}]},
+                      "error": None, "pagination": None}
+        with patch("src.main.youtube_get_transcript", return_value=transcript):
+            result = await call_tool("youtube_get_transcript", {"video_id": "abc123", "fields": "videoId,text"})
+
+        assert result["data"] == {"videoId": "abc123", "text": "hi"}
+
+    @pytest.mark.asyncio
+    async def test_malformed_fields_rejected(self):
+        """An invalid selector should be rejected like other invalid arguments."""
+        with pytest.raises(ValueError, match="Invalid fields selector"):
+            await call_tool("youtube_get_video", {"video_id": "abc123", "fields": "snippet(title"})
@@ -18,8 +18,8 @@ class TestYouTubeSearchIntegration:
         os.environ["YOUTUBE_API_KEY"] = integration_api_key
 
         # Reset client
-        from src.tools import search
-        search._client = None
+        from src.youtube_client import reset_clients
+        reset_clients()
 
         result = await youtube_search(query="Python programming tutorial", max_results=5)
 
@@ -40,8 +40,8 @@ class TestYouTubeSearchIntegration:
         from src.tools.search import youtube_search
 
         os.environ["YOUTUBE_API_KEY"] = integration_api_key
-        from src.tools import search
-        search._client = None
+        from src.youtube_client import reset_clients
+        reset_clients()
 
         result = await youtube_search(query="Python", max_results=50)
 
@@ -61,8 +61,8 @@ class TestYouTubeGetVideoIntegration:
         from src.tools.video import youtube_get_video
 
         os.environ["YOUTUBE_API_KEY"] = integration_api_key
-        from src.tools import video
-        video._client = None
+        from src.youtube_client import reset_clients
+        reset_clients()
 
         # Use a known video ID
         result = await youtube_get_video(video_id="dQw4w9WxXcQ")
@@ -89,8 +89,8 @@ class TestYouTubeGetChannelIntegration:
         from src.tools.channel import youtube_get_channel
 
         os.environ["YOUTUBE_API_KEY"] = integration_api_key
-        from src.tools import channel
-        channel._client = None
+        from src.youtube_client import reset_clients
+        reset_clients()
 
         # Use Google Developers channel ID
         result = await youtube_get_channel(channel_id="UC_x5XG1OV2P6uZZ5FSM9Ttw")
@@ -116,8 +116,8 @@ class TestYouTubeGetCommentsIntegration:
         from src.tools.comments import youtube_get_comments
 
         os.environ["YOUTUBE_API_KEY"] = integration_api_key
-        from src.tools import comments
-        comments._client = None
+        from src.youtube_client import reset_clients
+        reset_clients()
 
         # Use a known video ID
         result = await youtube_get_comments(video_id="dQw4w9WxXcQ", max_results=5)
@@ -144,8 +144,8 @@ class TestYouTubeGetPlaylistIntegration:
         from src.tools.playlist import youtube_get_playlist
 
         os.environ["YOUTUBE_API_KEY"] = integration_api_key
-        from src.tools import playlist
-        playlist._client = None
+        from src.youtube_client import reset_clients
+        reset_clients()
 
         # Use a real playlist ID
         result = await youtube_get_playlist(playlist_id="PLrAXtmErZgOeiKm4sgNOknGvNjby9efdf", max_results=5)
@@ -167,8 +167,8 @@ class TestYouTubeListPlaylistsIntegration:
         from src.tools.playlist import youtube_list_playlists
 
         os.environ["YOUTUBE_API_KEY"] = integration_api_key
-        from src.tools import playlist
-        playlist._client = None
+        from src.youtube_client import reset_clients
+        reset_clients()
 
         # Use Google Developers channel
         result = await youtube_list_playlists(channel_id="UC_x5XG1OV2P6uZZ5FSM9Ttw", max_results=5)
@@ -189,8 +189,8 @@ class TestYouTubeGetTranscriptIntegration:
         from src.tools.transcript import youtube_get_transcript
 
         os.environ["YOUTUBE_API_KEY"] = integration_api_key
-        from src.tools import transcript
-        transcript._client = None
+        from src.youtube_client import reset_clients
+        reset_clients()
 
         # Use a video that likely has captions
         result = await youtube_get_transcript(video_id="dQw4w9WxXcQ", language="en")
@@ -11,9 +11,9 @@ class TestMCPProtocol:
 
     @pytest.mark.asyncio
     async def test_list_tools_returns_all_tools(self):
-        """list_tools() should return exactly 7 tools."""
+        """list_tools() should return exactly 11 tools."""
         tools = await list_tools()
-        assert len(tools) == 7
+        assert len(tools) == 11
 
     @pytest.mark.asyncio
     async def test_list_tools_tool_names(self):
@@ -23,8 +23,12 @@ class TestMCPProtocol:
         expected_names = {
             "youtube_search",
             "youtube_get_video",
+            "youtube_get_videos",
             "youtube_get_channel",
+            "youtube_get_channel_videos",
             "youtube_get_transcript",
+            "youtube_get_transcripts",
+            "youtube_search_transcripts",
             "youtube_get_playlist",
             "youtube_list_playlists",
             "youtube_get_comments",
@@ -199,3 +203,115 @@ class TestMCPProtocol:
         # The actual call_tool function in main.py raises ValueError for unknown tools
         with pytest.raises(ValueError, match="Unknown tool"):
             await call_tool("unknown_tool", {})
+
+
+@pytest.mark.mcp
+@pytest.mark.unit
+class TestStartup:
+    """Test server startup behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_prebuild_client_builds_shared_client(self, monkeypatch):
+        """prebuild_client() should build the shared client and report its build time."""
+        from src.main import prebuild_client, server_stats
+        from src.youtube_client import get_youtube_client, reset_clients
+
+        monkeypatch.setenv("YOUTUBE_API_KEY", "test_key")
+        reset_clients()
+        try:
+            seconds = await prebuild_client()
+            assert seconds is not None
+            assert get_youtube_client().build_seconds == seconds
+            client = server_stats()["client"]
+            assert client["built"] is True
+            assert client["prebuilt"] is True
+            assert client["buildSeconds"] == round(seconds, 4)
+        finally:
+            reset_clients()
+
+    @pytest.mark.asyncio
+    async def test_prebuild_client_without_api_key(self, monkeypatch):
+        """prebuild_client() should not fail startup when the API key is missing."""
+        from src.main import prebuild_client, server_stats
+        from src.youtube_client import reset_clients
+
+        monkeypatch.delenv("YOUTUBE_API_KEY", raising=False)
+        reset_clients()
+        assert await prebuild_client() is None
+        assert server_stats()["client"] == {"built": False, "buildSeconds": None, "prebuilt": False}
+
+
+@pytest.mark.mcp
+@pytest.mark.unit
+class TestStatsResource:
+    """Test the server stats resource."""
+
+    @pytest.mark.asyncio
+    async def test_list_resources_includes_stats(self):
+        """list_resources() should advertise the stats resource."""
+        from src.main import list_resources, STATS_URI
+        resources = await list_resources()
+        assert [str(r.uri) for r in resources] == [STATS_URI]
+
+    @pytest.mark.asyncio
+    async def test_read_stats_resource(self):
+        """Reading the stats resource should return cache metrics as JSON."""
+        from src.main import read_resource, STATS_URI
+        contents = await read_resource(STATS_URI)
+        stats = json.loads(contents[0].content)
+        assert "hits" in stats["cache"]
+
+    @pytest.mark.asyncio
+    async def test_read_unknown_resource_raises(self):
+        """Reading an unknown resource should raise ValueError."""
+        from src.main import read_resource
+        with pytest.raises(ValueError, match="Resource not found"):
+            await read_resource("youtube://nope")
+
+
+@pytest.mark.mcp
+@pytest.mark.unit
+class TestProgressNotifications:
+    """Test progress notifications for long-running tools."""
+
+    def test_no_reporter_outside_request(self):
+        """Outside an MCP request there is nowhere to send progress."""
+        from src.main import progress_reporter
+        assert progress_reporter() is None
+
+    @pytest.mark.asyncio
+    async def test_reporter_sends_to_progress_token(self):
+        """A request with a progressToken should get progress notifications."""
+        from unittest.mock import AsyncMock, Mock
+        from mcp.server.lowlevel.server import request_ctx
+        from src.main import progress_reporter
+
+        ctx = Mock()
+        ctx.meta.progressToken = "tok"
+        ctx.session.send_progress_notification = AsyncMock()
+        token = request_ctx.set(ctx)
+        try:
+            report = progress_reporter()
+            await report(50, 120)
+        finally:
+            request_ctx.reset(token)
+
+        ctx.session.send_progress_notification.assert_awaited_once_with("tok", 50, 120)
+
+    @pytest.mark.asyncio
+    async def test_reporter_passes_message(self):
+        """Per-item progress messages should be forwarded to the client."""
+        from unittest.mock import AsyncMock, Mock
+        from mcp.server.lowlevel.server import request_ctx
+        from src.main import progress_reporter
+
+        ctx = Mock()
+        ctx.meta.progressToken = "tok"
+        ctx.session.send_progress_notification = AsyncMock()
+        token = request_ctx.set(ctx)
+        try:
+            await progress_reporter()(1, 3, "abc123: ok")
+        finally:
+            request_ctx.reset(token)
+
+        ctx.session.send_progress_notification.assert_awaited_once_with("tok", 1, 3, message="abc123: ok")
@@ -0,0 +1,201 @@
+"""Unit tests for quota-unit accounting."""
+import os
+import pytest
+from unittest.mock import Mock, patch
+
+from src.disk_cache import DiskCache
+from src.executor import execute
+from src.main import call_tool, server_stats
+from src.quota import QuotaAccountant, QuotaExceeded, get_quota_accountant
+from src.rate_limiter import RateLimitExceeded
+
+
+def make_request(method_id, response=None):
+    request = Mock()
+    request.methodId = method_id
+    request.execute.return_value = response if response is not None else {"items": []}
+    return request
+
+
+@pytest.mark.unit
+class TestQuotaAccountant:
+    """Test QuotaAccountant behaviour."""
+
+    def test_costs_by_method(self):
+        """Search and captions should be charged their documented costs."""
+        assert QuotaAccountant.cost_of("youtube.search.list") == 100
+        assert QuotaAccountant.cost_of("youtube.captions.list") == 50
+        assert QuotaAccountant.cost_of("youtube.videos.list") == 1
+        assert QuotaAccountant.cost_of(None) == 1
+
+    def test_reserve_tracks_usage_per_tool(self):
+        """Units should be recorded against the tool that spent them."""
+        quota = QuotaAccountant(daily_budget=1000)
+        quota.reserve("youtube.search.list", tool="youtube_search")
+        quota.reserve("youtube.videos.list", tool="youtube_get_video")
+
+        info = quota.remaining("youtube_search")
+        assert (info["used"], info["remaining"]) == (101, 899)
+        assert info["tool"]["used"] == 100
+        assert quota.stats()["byTool"] == {"youtube_search": 100, "youtube_get_video": 1}
+
+    def test_global_budget_enforced(self):
+        """A call that would overrun the daily budget should be rejected."""
+        quota = QuotaAccountant(daily_budget=150)
+        quota.reserve("youtube.search.list", tool="youtube_search")
+
+        with pytest.raises(QuotaExceeded, match="50 of 150 left"):
+            quota.reserve("youtube.search.list", tool="youtube_search")
+        quota.reserve("youtube.videos.list", tool="youtube_get_video")
+        assert quota.stats()["rejected"] == 1
+
+    def test_tool_budget_enforced(self):
+        """A tool budget should cap that tool without affecting others."""
+        quota = QuotaAccountant(daily_budget=0, tool_budgets={"youtube_search": 100})
+        quota.reserve("youtube.search.list", tool="youtube_search")
+
+        with pytest.raises(QuotaExceeded, match="youtube_search"):
+            quota.reserve("youtube.search.list", tool="youtube_search")
+        quota.reserve("youtube.videos.list", tool="youtube_get_video")
+        assert quota.remaining("youtube_search")["tool"]["remaining"] == 0
+
+    def test_refund(self):
+        """Refunded units should no longer count as spent."""
+        quota = QuotaAccountant(daily_budget=100)
+        units = quota.reserve("youtube.search.list", tool="youtube_search")
+        quota.refund(units, tool="youtube_search")
+        assert quota.remaining()["used"] == 0
+
+    def test_usage_resets_on_new_day(self):
+        """Usage should start from zero when the quota day rolls over."""
+        quota = QuotaAccountant(daily_budget=100)
+        with patch.object(QuotaAccountant, "today", return_value="2024-01-01"):
+            quota.reserve("youtube.search.list", tool="youtube_search")
+        with patch.object(QuotaAccountant, "today", return_value="2024-01-02"):
+            quota.reserve("youtube.search.list", tool="youtube_search")
+            assert quota.remaining()["used"] == 100
+
+    def test_usage_persisted_in_store(self, tmp_path):
+        """Usage recorded through a DiskCache should be seen by a new process."""
+        path = str(tmp_path / "cache.sqlite")
+        first = QuotaAccountant(daily_budget=150, store=DiskCache(path, max_bytes=1 << 20))
+        first.reserve("youtube.search.list", tool="youtube_search")
+        first.flush()
+
+        second = QuotaAccountant(daily_budget=150, store=DiskCache(path, max_bytes=1 << 20))
+        # A new process loads the day's usage on the store thread at startup
+        second.store.submit(lambda: None).result(timeout=5)
+        assert second.remaining()["used"] == 100
+        with pytest.raises(QuotaExceeded):
+            second.reserve("youtube.search.list", tool="youtube_search")
+
+    def test_store_writes_are_batched(self):
+        """Charges should reach the store in one batch per sync, not per request."""
+        store = Mock()
+        store.quota_usage.return_value = {}
+        quota = QuotaAccountant(daily_budget=0, store=store)
+        for _ in range(3):
+            quota.reserve("youtube.videos.list", tool="youtube_get_video_details")
+        quota.remaining("youtube_get_video_details")
+        store.record_quota.assert_not_called()
+        store.quota_usage.assert_not_called()
+        # Only the startup load was queued; nothing ran inline
+        store.submit.assert_called_once_with(quota.flush)
+
+        store.quota_usage.return_value = {"youtube_get_video_details": 3, "youtube_search": 100}
+        quota.flush()
+        store.record_quota.assert_called_once_with(quota.today(), "youtube_get_video_details", 3)
+        assert quota.remaining()["used"] == 103
+
+    def test_day_rollover_queues_store_access(self):
+        """A new quota day should hand the old day's charges to the store thread."""
+        store = Mock()
+        quota = QuotaAccountant(daily_budget=0, store=store)
+        with patch.object(QuotaAccountant, "today", return_value="2024-01-01"):
+            quota.reserve("youtube.search.list", tool="youtube_search")
+        with patch.object(QuotaAccountant, "today", return_value="2024-01-02"):
+            assert quota.remaining()["used"] == 0
+        store.record_quota.assert_not_called()
+        store.quota_usage.assert_not_called()
+        store.submit.assert_any_call(quota._write, "2024-01-01", {"youtube_search": 100})
+
+    def test_sync_runs_on_store_thread(self, tmp_path):
+        """Once the sync interval passes, pending charges are written in the background."""
+        store = DiskCache(str(tmp_path / "cache.sqlite"), max_bytes=1 << 20)
+        quota = QuotaAccountant(daily_budget=0, store=store, sync_interval=0)
+        store.submit(lambda: None).result(timeout=5)
+        quota.reserve("youtube.search.list", tool="youtube_search")
+        store.submit(lambda: None).result(timeout=5)
+        assert store.quota_usage(quota.today()) == {"youtube_search": 100}
+
+    def test_shared_accountant_from_config(self):
+        """get_quota_accountant() should read its budgets from the environment."""
+        env = {"YOUTUBE_QUOTA_DAILY_BUDGET": "500", "YOUTUBE_QUOTA_TOOL_BUDGETS": "youtube_search=200"}
+        with patch.dict(os.environ, env):
+            quota = get_quota_accountant()
+        assert quota is get_quota_accountant()
+        assert quota.daily_budget == 500
+        assert quota.tool_budgets == {"youtube_search": 200}
+
+
+@pytest.mark.unit
+class TestExecuteQuota:
+    """Test that Data API requests are charged before they are sent."""
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_QUOTA_DAILY_BUDGET": "150"})
+    async def test_execute_rejects_over_budget(self):
+        """A request over budget should fail without reaching the API."""
+        request = make_request("youtube.search.list")
+        await execute(request)
+        with pytest.raises(QuotaExceeded):
+            await execute(request)
+        assert request.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_RATE_LIMIT": "1", "YOUTUBE_RATE_LIMIT_PERIOD": "minute",
+                             "YOUTUBE_RATE_LIMIT_MAX_WAIT": "0"})
+    async def test_rate_limited_request_refunded(self):
+        """A request rejected by the rate limiter should not spend quota."""
+        await execute(make_request("youtube.search.list"))
+        with pytest.raises(RateLimitExceeded):
+            await execute(make_request("youtube.search.list"))
+        assert get_quota_accountant().remaining()["used"] == 100
+
+
+@pytest.mark.unit
+class TestCallToolQuota:
+    """Test quota metadata in call_tool results."""
+
+    @pytest.mark.asyncio
+    @patch("src.tools.search.get_youtube_client")
+    async def test_result_reports_call_cost(self, mock_get_client):
+        """Results should carry the units spent by the call and what is left."""
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.client.search.return_value.list.return_value = make_request("youtube.search.list")
+
+        first = await call_tool("youtube_search", {"query": "python"})
+        second = await call_tool("youtube_search", {"query": "python"})
+
+        assert first["quota"]["callCost"] == 100
+        assert first["quota"]["tool"] == {"name": "youtube_search", "used": 100, "budget": None, "remaining": None}
+        assert first["quota"]["remaining"] == 9900
+        # Served from cache: nothing charged
+        assert second["quota"]["callCost"] == 0
+        assert server_stats()["quota"]["byTool"] == {"youtube_search": 100}
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_QUOTA_TOOL_BUDGETS": "youtube_search=100"})
+    @patch("src.tools.search.get_youtube_client")
+    async def test_tool_reports_quota_error(self, mock_get_client):
+        """Tools should surface QuotaExceeded as an error code."""
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.client.search.return_value.list.return_value = make_request("youtube.search.list")
+
+        await call_tool("youtube_search", {"query": "a"})
+        second = await call_tool("youtube_search", {"query": "b"})
+
+        assert second["error"]["code"] == "QuotaExceeded"
+        assert second["quota"]["callCost"] == 0
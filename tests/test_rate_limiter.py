@@ -0,0 +1,129 @@
+"""Unit tests for the token-bucket rate limiter."""
+import asyncio
+import os
+import time
+import pytest
+from unittest.mock import Mock, patch
+
+from src.executor import execute
+from src.rate_limiter import TokenBucket, RateLimitExceeded, get_rate_limiter
+from src.tools.search import youtube_search
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Test TokenBucket behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_burst_within_capacity_does_not_wait(self):
+        """Requests within the bucket capacity should not wait."""
+        bucket = TokenBucket(rate=5, period=1.0)
+        waits = [await bucket.acquire() for _ in range(5)]
+        assert waits == [0.0] * 5
+
+    @pytest.mark.asyncio
+    async def test_excess_requests_are_queued(self):
+        """Requests beyond capacity should wait for refilled tokens."""
+        bucket = TokenBucket(rate=20, period=1.0, burst=1)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+        elapsed = time.perf_counter() - start
+
+        # One immediate token, then three more at 20/s
+        assert elapsed >= 0.14
+        assert bucket.stats()["acquired"] == 4
+        assert bucket.stats()["longestWaitSeconds"] >= 0.14
+
+    @pytest.mark.asyncio
+    async def test_reports_queue_depth(self):
+        """Waiting callers should show up as queue depth."""
+        bucket = TokenBucket(rate=10, period=1.0, burst=1)
+        await bucket.acquire()
+
+        waiters = [asyncio.create_task(bucket.acquire()) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert bucket.stats()["queueDepth"] == 3
+
+        await asyncio.gather(*waiters)
+        assert bucket.stats()["queueDepth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_beyond_max_raises(self):
+        """A request that would wait longer than max_wait should fail fast."""
+        bucket = TokenBucket(rate=1, period=60.0, max_wait=1.0)
+        await bucket.acquire()
+
+        with pytest.raises(RateLimitExceeded):
+            await bucket.acquire()
+        assert bucket.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_returns_token(self):
+        """Cancelling a queued request should give its reserved token back."""
+        bucket = TokenBucket(rate=10, period=1.0, burst=1)
+        await bucket.acquire()
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert bucket._tokens > -1
+
+    @pytest.mark.asyncio
+    async def test_zero_rate_disables_limiting(self):
+        """A rate of 0 should disable limiting."""
+        bucket = TokenBucket(rate=0)
+        assert [await bucket.acquire() for _ in range(3)] == [0.0] * 3
+        assert bucket.stats()["enabled"] is False
+
+    def test_shared_limiter_from_config(self):
+        """get_rate_limiter() should honour YOUTUBE_RATE_LIMIT and its period."""
+        env = {"YOUTUBE_RATE_LIMIT": "30", "YOUTUBE_RATE_LIMIT_PERIOD": "minute", "YOUTUBE_RATE_LIMIT_MAX_WAIT": "5"}
+        with patch.dict(os.environ, env):
+            limiter = get_rate_limiter()
+        assert limiter is get_rate_limiter()
+        assert (limiter.rate, limiter.period, limiter.max_wait) == (30, 60.0, 5.0)
+
+    def test_invalid_period_rejected(self):
+        """An unknown period should be a configuration error."""
+        from src.config import get_config
+        with patch.dict(os.environ, {"YOUTUBE_API_KEY": "k", "YOUTUBE_RATE_LIMIT_PERIOD": "hour"}):
+            with pytest.raises(ValueError, match="YOUTUBE_RATE_LIMIT_PERIOD"):
+                get_config()
+
+
+@pytest.mark.unit
+class TestExecuteRateLimited:
+    """Test that Data API requests go through the shared limiter."""
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_RATE_LIMIT": "2", "YOUTUBE_RATE_LIMIT_PERIOD": "minute",
+                             "YOUTUBE_RATE_LIMIT_MAX_WAIT": "0"})
+    async def test_execute_acquires_token(self):
+        """execute() should consume a token per request."""
+        request = Mock()
+        request.execute.return_value = {"ok": True}
+
+        await execute(request)
+        await execute(request)
+        with pytest.raises(RateLimitExceeded):
+            await execute(request)
+        assert request.execute.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_RATE_LIMIT": "1", "YOUTUBE_RATE_LIMIT_PERIOD": "minute",
+                             "YOUTUBE_RATE_LIMIT_MAX_WAIT": "0"})
+    @patch("src.tools.search.get_youtube_client")
+    async def test_tool_reports_rate_limit_error(self, mock_get_client):
+        """Tools should surface RateLimitExceeded as an error code."""
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.client.search.return_value.list.return_value.execute.return_value = {"items": []}
+
+        first = await youtube_search(query="a")
+        second = await youtube_search(query="b")
+
+        assert first["error"] is None
+        assert second["error"]["code"] == "RateLimitExceeded"
@@ -0,0 +1,120 @@
+"""Unit tests for single-flight deduplication."""
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from src.main import call_tool, singleflight
+from src.singleflight import SingleFlight
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    """Test SingleFlight behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_fetch(self):
+        """Concurrent calls with the same key should run fn once."""
+        flight = SingleFlight()
+        runs = 0
+
+        async def fetch():
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.05)
+            return {"value": runs}
+
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+
+        assert runs == 1
+        assert all(r is results[0] for r in results)
+        assert flight.stats() == {"calls": 5, "collapsed": 4, "inFlight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Different keys should not be collapsed."""
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return 1
+
+        await asyncio.gather(flight.do("a", fetch), flight.do("b", fetch))
+
+        assert flight.stats()["collapsed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_collapsed(self):
+        """A finished call should not be reused by later calls."""
+        flight = SingleFlight()
+        runs = 0
+
+        async def fetch():
+            nonlocal runs
+            runs += 1
+            return runs
+
+        assert await flight.do("k", fetch) == 1
+        assert await flight.do("k", fetch) == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_shared_with_waiters(self):
+        """Every waiter should receive the leader's exception."""
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flight.do("k", fetch), flight.do("k", fetch), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.stats()["inFlight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_waiter_survives_leader_cancellation(self):
+        """If the leading call is cancelled, a waiter should run the fetch itself."""
+        flight = SingleFlight()
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+
+        async def fast():
+            return "ok"
+
+        leader = asyncio.create_task(flight.do("k", slow))
+        await started.wait()
+        waiter = asyncio.create_task(flight.do("k", fast))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == "ok"
+
+
+@pytest.mark.unit
+class TestCallToolSingleFlight:
+    """Test single-flight in the call_tool dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_collapsed(self):
+        """Identical concurrent tool calls should reach the tool once."""
+        runs = 0
+
+        async def slow_transcript(**kwargs):
+            nonlocal runs
+            runs += 1
+            await asyncio.sleep(0.05)
+            return {"data": {"videoId": kwargs["video_id"]}, "error": None, "pagination": None}
+
+        before = singleflight.stats()["collapsed"]
+        with patch("src.main.youtube_get_transcript", new=slow_transcript):
+            results = await asyncio.gather(
+                *(call_tool("youtube_get_transcript", {"video_id": "abc123"}) for _ in range(3))
+            )
+
+        assert runs == 1
+        assert all(r["data"]["videoId"] == "abc123" for r in results)
+        assert singleflight.stats()["collapsed"] - before == 2
@@ -28,12 +28,11 @@ class TestYouTubeGetChannel:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.channel._client", None)
-    @patch("src.tools.channel.YouTubeClient")
-    async def test_get_channel_by_id_success(self, mock_client_class):
+    @patch("src.tools.channel.get_youtube_client")
+    async def test_get_channel_by_id_success(self, mock_get_client):
         """youtube_get_channel should work with channel ID."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_channels = Mock()
         mock_channels.list.return_value.execute.return_value = {
@@ -52,12 +51,11 @@ class TestYouTubeGetChannel:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.channel._client", None)
-    @patch("src.tools.channel.YouTubeClient")
-    async def test_get_channel_by_username_strips_at(self, mock_client_class):
-        """youtube_get_channel should strip @ from username."""
+    @patch("src.tools.channel.get_youtube_client")
+    async def test_get_channel_by_handle_uses_for_handle(self, mock_get_client):
+        """youtube_get_channel should look up @names with forHandle."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_channels = Mock()
         mock_channels.list.return_value.execute.return_value = {
@@ -68,16 +66,16 @@ class TestYouTubeGetChannel:
         await youtube_get_channel(username="@testchannel")
 
         call_args = mock_channels.list.call_args
-        assert call_args[1]["forUsername"] == "testchannel"
+        assert call_args[1]["forHandle"] == "@testchannel"
+        assert "forUsername" not in call_args[1]
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.channel._client", None)
-    @patch("src.tools.channel.YouTubeClient")
-    async def test_get_channel_no_id_or_username(self, mock_client_class):
+    @patch("src.tools.channel.get_youtube_client")
+    async def test_get_channel_no_id_or_username(self, mock_get_client):
         """youtube_get_channel should return InvalidInput when no ID or username."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         result = await youtube_get_channel()
 
@@ -87,12 +85,11 @@ class TestYouTubeGetChannel:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.channel._client", None)
-    @patch("src.tools.channel.YouTubeClient")
-    async def test_get_channel_not_found(self, mock_client_class):
+    @patch("src.tools.channel.get_youtube_client")
+    async def test_get_channel_not_found(self, mock_get_client):
         """youtube_get_channel should return NotFound for missing channel."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_channels = Mock()
         mock_channels.list.return_value.execute.return_value = {"items": []}
@@ -105,12 +102,11 @@ class TestYouTubeGetChannel:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.channel._client", None)
-    @patch("src.tools.channel.YouTubeClient")
-    async def test_get_channel_handles_api_exception(self, mock_client_class):
+    @patch("src.tools.channel.get_youtube_client")
+    async def test_get_channel_handles_api_exception(self, mock_get_client):
         """youtube_get_channel should handle API exceptions gracefully."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_channels = Mock()
         mock_channels.list.return_value.execute.side_effect = Exception("API Error")
@@ -120,3 +116,84 @@ class TestYouTubeGetChannel:
 
         assert result["data"] is None
         assert result["error"]["code"] == "Exception"
+
+
+def mock_channel_lookups(mock_get_client, by_handle=None, by_username=None, by_id=None):
+    """Route channels.list calls by their lookup parameter."""
+    mock_channels = mock_get_client.return_value.client.channels.return_value
+
+    def list_channels(**kwargs):
+        if "forHandle" in kwargs:
+            items = (by_handle or {}).get(kwargs["forHandle"].lower())
+        elif "forUsername" in kwargs:
+            items = (by_username or {}).get(kwargs["forUsername"].lower())
+        else:
+            items = [(by_id or {})[i] for i in kwargs["id"].split(",") if i in (by_id or {})]
+        request = Mock()
+        request.execute.return_value = {"items": items or []}
+        return request
+
+    mock_channels.list.side_effect = list_channels
+    return mock_channels
+
+
+@pytest.mark.unit
+class TestChannelHandles:
+    """Test handle resolution and the handle map."""
+
+    CHANNEL = {"id": "UCabc123", "snippet": {"title": "Test"}}
+
+    @pytest.mark.asyncio
+    @patch("src.tools.channel.get_youtube_client")
+    async def test_handle_resolved_once(self, mock_get_client):
+        """Later lookups of a handle should go straight to the channel ID."""
+        mock_channels = mock_channel_lookups(
+            mock_get_client, by_handle={"@testchannel": [self.CHANNEL]}, by_id={"UCabc123": self.CHANNEL}
+        )
+
+        first = await youtube_get_channel(username="@TestChannel")
+        second = await youtube_get_channel(username="@testchannel")
+
+        assert first["data"]["id"] == second["data"]["id"] == "UCabc123"
+        calls = [c.kwargs for c in mock_channels.list.call_args_list]
+        assert "forHandle" in calls[0]
+        assert calls[1]["id"] == "UCabc123"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    @patch("src.tools.channel.get_youtube_client")
+    async def test_username_falls_back_to_handle(self, mock_get_client):
+        """A bare name should try forUsername, then forHandle."""
+        mock_channels = mock_channel_lookups(mock_get_client, by_handle={"@newstyle": [self.CHANNEL]})
+
+        result = await youtube_get_channel(username="newstyle")
+
+        assert result["data"]["id"] == "UCabc123"
+        calls = [c.kwargs for c in mock_channels.list.call_args_list]
+        assert calls[0]["forUsername"] == "newstyle"
+        assert calls[1]["forHandle"] == "@newstyle"
+
+    @pytest.mark.asyncio
+    @patch("src.tools.channel.get_youtube_client")
+    async def test_unknown_name_not_remembered(self, mock_get_client):
+        """A name no channel has should be NotFound and stay unresolved."""
+        from src.channel_handles import get_channel_handles
+        mock_channel_lookups(mock_get_client)
+
+        result = await youtube_get_channel(username="@nobody")
+
+        assert result["error"]["code"] == "NotFound"
+        assert get_channel_handles().get("@nobody") is None
+
+    @pytest.mark.asyncio
+    @patch("src.tools.channel.get_youtube_client")
+    async def test_concurrent_resolutions_shared(self, mock_get_client):
+        """Concurrent first lookups of one handle should share a request."""
+        import asyncio
+        from src.tools.channel import resolve_channel_id
+        mock_channels = mock_channel_lookups(mock_get_client, by_handle={"@testchannel": [self.CHANNEL]})
+
+        ids = await asyncio.gather(*(resolve_channel_id("@testchannel") for _ in range(4)))
+
+        assert ids == ["UCabc123"] * 4
+        assert mock_channels.list.call_count == 1
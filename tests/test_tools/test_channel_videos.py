@@ -0,0 +1,156 @@
+"""Unit tests for youtube_get_channel_videos tool."""
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from src.tools.channel_videos import youtube_get_channel_videos, GetChannelVideosArgs, parse_timestamp
+
+
+def upload(video_id, published_at):
+    return {
+        "snippet": {"title": f"Video {video_id}", "resourceId": {"videoId": video_id}},
+        "contentDetails": {"videoId": video_id, "videoPublishedAt": published_at},
+    }
+
+
+# Newest first, like a real uploads playlist
+PAGES = {
+    None: {"items": [upload("v1", "2024-03-01T00:00:00Z"), upload("v2", "2024-02-01T00:00:00Z")],
+           "nextPageToken": "p2", "pageInfo": {"totalResults": 5}},
+    "p2": {"items": [upload("v3", "2024-01-15T00:00:00Z"), upload("v4", "2023-12-01T00:00:00Z")],
+           "nextPageToken": "p3", "pageInfo": {"totalResults": 5}},
+    "p3": {"items": [upload("v5", "2023-11-01T00:00:00Z")], "pageInfo": {"totalResults": 5}},
+}
+
+
+def request(response):
+    req = Mock()
+    req.execute.return_value = response
+    return req
+
+
+@pytest.fixture
+def youtube():
+    """Patch the channel, playlist and video clients with canned responses."""
+    with patch("src.tools.channel.get_youtube_client") as channel_client, \
+         patch("src.tools.playlist.get_youtube_client") as playlist_client, \
+         patch("src.tools.video.get_youtube_client") as video_client:
+        channels = channel_client.return_value.client.channels.return_value
+        channels.list.side_effect = lambda **kw: request({"items": [
+            {"id": "UCabc123", "contentDetails": {"relatedPlaylists": {"uploads": "UUabc123"}}}
+        ] if kw.get("id") == "UCabc123" or "forHandle" in kw else []})
+
+        items = playlist_client.return_value.client.playlistItems.return_value
+        items.list.side_effect = lambda **kw: request(PAGES[kw.get("pageToken")])
+
+        videos = video_client.return_value.client.videos.return_value
+        videos.list.side_effect = lambda **kw: request({"items": [
+            {"id": v, "statistics": {"viewCount": "10"}, "contentDetails": {"duration": "PT1M"}}
+            for v in kw["id"].split(",")
+        ]})
+        yield Mock(channels=channels, items=items, videos=videos)
+
+
+@pytest.mark.unit
+class TestGetChannelVideosArgs:
+    """Test GetChannelVideosArgs Pydantic model."""
+
+    def test_defaults(self):
+        """GetChannelVideosArgs should default to 50 enriched videos."""
+        args = GetChannelVideosArgs(channel_id="UCabc123")
+        assert args.limit == 50
+        assert args.enrich is True
+        assert args.published_after is None
+
+    def test_parse_timestamp(self):
+        """Dates, times and Z suffixes should all parse as UTC."""
+        assert parse_timestamp("2024-01-01") == parse_timestamp("2024-01-01T00:00:00Z")
+        assert parse_timestamp("2024-01-01T00:00:00+00:00").tzinfo is not None
+
+
+@pytest.mark.unit
+class TestYouTubeGetChannelVideos:
+    """Test youtube_get_channel_videos function."""
+
+    @pytest.mark.asyncio
+    async def test_walks_uploads_and_enriches(self, youtube):
+        """All uploads should be returned with statistics merged in."""
+        result = await youtube_get_channel_videos(channel_id="UCabc123")
+
+        data = result["data"]
+        assert data["uploadsPlaylistId"] == "UUabc123"
+        assert [item["videoId"] for item in data["items"]] == ["v1", "v2", "v3", "v4", "v5"]
+        assert data["items"][0]["statistics"] == {"viewCount": "10"}
+        assert data["items"][4]["contentDetails"] == {"duration": "PT1M"}
+        assert result["pagination"] == {"nextPageToken": None, "totalResults": 5}
+        # One lookup per page of uploads
+        assert youtube.videos.list.call_count == 3
+        assert youtube.items.list.call_args_list[0].kwargs["playlistId"] == "UUabc123"
+
+    @pytest.mark.asyncio
+    async def test_published_after_stops_paging(self, youtube):
+        """Paging should stop at the first video older than the cutoff."""
+        result = await youtube_get_channel_videos(channel_id="UCabc123", published_after="2024-01-01")
+
+        assert [item["videoId"] for item in result["data"]["items"]] == ["v1", "v2", "v3"]
+        assert result["pagination"]["nextPageToken"] is None
+        assert youtube.items.list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_limit_and_resume(self, youtube):
+        """limit should cap the walk and leave a token to resume from."""
+        result = await youtube_get_channel_videos(channel_id="UCabc123", limit=2, enrich=False)
+
+        assert [item["videoId"] for item in result["data"]["items"]] == ["v1", "v2"]
+        assert result["pagination"]["nextPageToken"] == "p2"
+        youtube.videos.list.assert_not_called()
+
+        resumed = await youtube_get_channel_videos(channel_id="UCabc123", page_token="p2", enrich=False)
+        assert [item["videoId"] for item in resumed["data"]["items"]] == ["v3", "v4", "v5"]
+
+    @pytest.mark.asyncio
+    async def test_uploads_playlist_cached(self, youtube):
+        """The channel's uploads playlist should be looked up once."""
+        await youtube_get_channel_videos(channel_id="UCabc123", limit=1, enrich=False)
+        await youtube_get_channel_videos(channel_id="UCabc123", limit=1, enrich=False)
+
+        youtube.channels.list.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_by_handle(self, youtube):
+        """A handle should be resolved to the channel before walking its uploads."""
+        result = await youtube_get_channel_videos(username="@testchannel", limit=1, enrich=False)
+
+        assert result["data"]["channelId"] == "UCabc123"
+        assert youtube.channels.list.call_args_list[0].kwargs["forHandle"] == "@testchannel"
+
+    @pytest.mark.asyncio
+    async def test_progress_per_page(self, youtube):
+        """Progress should be reported after each page."""
+        progress = AsyncMock()
+        await youtube_get_channel_videos(channel_id="UCabc123", enrich=False, progress=progress)
+
+        assert [c.args for c in progress.await_args_list] == [(2, 5), (4, 5), (5, 5)]
+
+    @pytest.mark.asyncio
+    async def test_unknown_channel(self, youtube):
+        """A channel that does not exist should be NotFound."""
+        result = await youtube_get_channel_videos(channel_id="UCmissing")
+
+        assert result["error"]["code"] == "NotFound"
+        youtube.items.list.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_input(self):
+        """Missing channel or a malformed cutoff should be InvalidInput."""
+        assert (await youtube_get_channel_videos())["error"]["code"] == "InvalidInput"
+        result = await youtube_get_channel_videos(channel_id="UCabc123", published_after="last week")
+        assert result["error"]["code"] == "InvalidInput"
+
+    @pytest.mark.asyncio
+    async def test_quota_cost(self, youtube):
+        """Listing five uploads with enrichment should cost far less than one search."""
+        from src.main import call_tool
+        result = await call_tool("youtube_get_channel_videos", {"channel_id": "UCabc123"})
+
+        assert result["error"] is None
+        # channels.list + 3 playlistItems pages + 3 videos lookups
+        assert result["quota"]["callCost"] == 7
@@ -1,8 +1,10 @@
 """Unit tests for youtube_get_comments tool."""
 import pytest
 import os
-from unittest.mock import Mock, patch
-from src.tools.comments import youtube_get_comments, GetCommentsArgs
+import threading
+import time
+from unittest.mock import AsyncMock, Mock, patch
+from src.tools.comments import youtube_get_comments, iter_comment_threads, GetCommentsArgs
 
 
 @pytest.mark.unit
@@ -23,12 +25,11 @@ class TestYouTubeGetComments:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.comments._client", None)
-    @patch("src.tools.comments.YouTubeClient")
-    async def test_get_comments_success(self, mock_client_class):
+    @patch("src.tools.comments.get_youtube_client")
+    async def test_get_comments_success(self, mock_get_client):
         """youtube_get_comments should return comments on success."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_threads = Mock()
         mock_threads.list.return_value.execute.return_value = {
@@ -50,12 +51,11 @@ class TestYouTubeGetComments:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.comments._client", None)
-    @patch("src.tools.comments.YouTubeClient")
-    async def test_get_comments_max_results_capped_at_100(self, mock_client_class):
+    @patch("src.tools.comments.get_youtube_client")
+    async def test_get_comments_max_results_capped_at_100(self, mock_get_client):
         """youtube_get_comments should cap max_results at 100."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_threads = Mock()
         mock_threads.list.return_value.execute.return_value = {"items": [], "pageInfo": {"totalResults": 0}}
@@ -68,12 +68,11 @@ class TestYouTubeGetComments:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.comments._client", None)
-    @patch("src.tools.comments.YouTubeClient")
-    async def test_get_comments_with_page_token(self, mock_client_class):
+    @patch("src.tools.comments.get_youtube_client")
+    async def test_get_comments_with_page_token(self, mock_get_client):
         """youtube_get_comments should pass page_token to API."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_threads = Mock()
         mock_threads.list.return_value.execute.return_value = {"items": [], "pageInfo": {"totalResults": 0}}
@@ -86,12 +85,11 @@ class TestYouTubeGetComments:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.comments._client", None)
-    @patch("src.tools.comments.YouTubeClient")
-    async def test_get_comments_defaults_to_relevance_order(self, mock_client_class):
+    @patch("src.tools.comments.get_youtube_client")
+    async def test_get_comments_defaults_to_relevance_order(self, mock_get_client):
         """youtube_get_comments should default to relevance order."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_threads = Mock()
         mock_threads.list.return_value.execute.return_value = {"items": [], "pageInfo": {"totalResults": 0}}
@@ -104,12 +102,11 @@ class TestYouTubeGetComments:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.comments._client", None)
-    @patch("src.tools.comments.YouTubeClient")
-    async def test_get_comments_handles_api_exception(self, mock_client_class):
+    @patch("src.tools.comments.get_youtube_client")
+    async def test_get_comments_handles_api_exception(self, mock_get_client):
         """youtube_get_comments should handle API exceptions gracefully."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_threads = Mock()
         mock_threads.list.return_value.execute.side_effect = Exception("API Error")
@@ -120,3 +117,144 @@ class TestYouTubeGetComments:
         assert result["data"] is None
         assert result["error"]["code"] == "Exception"
         assert result["pagination"] is None
+
+
+def _thread(thread_id, total_replies, inline=0):
+    return {
+        "id": thread_id,
+        "snippet": {"totalReplyCount": total_replies},
+        "replies": {"comments": [{"id": f"{thread_id}.r{i}"} for i in range(inline)]},
+    }
+
+
+def _fake_api(mock_get_client, thread_pages, reply_pages, delay=0.0):
+    """Route commentThreads/comments list calls by pageToken / parentId."""
+    mock_client_instance = Mock()
+    mock_get_client.return_value = mock_client_instance
+    in_flight = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def threads_list(**kwargs):
+        request = Mock()
+        request.execute.return_value = thread_pages[kwargs.get("pageToken")]
+        return request
+
+    def comments_list(**kwargs):
+        def execute(http=None):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(delay)
+            with lock:
+                in_flight["now"] -= 1
+            return reply_pages[(kwargs["parentId"], kwargs.get("pageToken"))]
+        request = Mock()
+        request.execute.side_effect = execute
+        return request
+
+    mock_client_instance.client.commentThreads.return_value.list.side_effect = threads_list
+    mock_client_instance.client.comments.return_value.list.side_effect = comments_list
+    return mock_client_instance, in_flight
+
+
+@pytest.mark.unit
+class TestCrawlComments:
+    """Test the crawl mode of youtube_get_comments."""
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.comments.get_youtube_client")
+    async def test_crawl_walks_pages_and_completes_replies(self, mock_get_client):
+        """Crawl should paginate threads and fetch replies beyond the inline ones."""
+        thread_pages = {
+            None: {"items": [_thread("t1", 0), _thread("t2", 2, inline=2)], "nextPageToken": "p2"},
+            "p2": {"items": [_thread("t3", 150, inline=5)]},
+        }
+        reply_pages = {
+            ("t3", None): {"items": [{"id": f"t3.r{i}"} for i in range(100)], "nextPageToken": "r2"},
+            ("t3", "r2"): {"items": [{"id": f"t3.r{i}"} for i in range(100, 150)]},
+        }
+        mock_client_instance, _ = _fake_api(mock_get_client, thread_pages, reply_pages)
+
+        result = await youtube_get_comments(video_id="abc123", crawl=True)
+
+        assert result["error"] is None
+        assert [t["id"] for t in result["data"]] == ["t1", "t2", "t3"]
+        assert len(result["data"][1]["replies"]["comments"]) == 2
+        assert len(result["data"][2]["replies"]["comments"]) == 150
+        assert result["pagination"] == {"nextPageToken": None, "totalResults": 3}
+        # Only the truncated thread needed comments.list
+        parents = {c.kwargs["parentId"] for c in mock_client_instance.client.comments.return_value.list.call_args_list}
+        assert parents == {"t3"}
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.comments.get_youtube_client")
+    async def test_reply_fetches_are_bounded(self, mock_get_client):
+        """Reply lookups should run concurrently but at most REPLY_CONCURRENCY at once."""
+        threads = [_thread(f"t{i}", 10) for i in range(20)]
+        reply_pages = {(f"t{i}", None): {"items": [{"id": "r"}] * 10} for i in range(20)}
+        _, in_flight = _fake_api(mock_get_client, {None: {"items": threads}}, reply_pages, delay=0.02)
+
+        with patch("src.tools.comments.REPLY_CONCURRENCY", 4):
+            result = await youtube_get_comments(video_id="abc123", crawl=True)
+
+        assert result["error"] is None
+        assert 1 < in_flight["max"] <= 4
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.comments.get_youtube_client")
+    async def test_crawl_returns_chunks(self, mock_get_client):
+        """A chunk should stop at chunk_size and return the token for the next chunk."""
+        thread_pages = {
+            None: {"items": [_thread(f"a{i}", 0) for i in range(3)], "nextPageToken": "p2"},
+            "p2": {"items": [_thread(f"b{i}", 0) for i in range(2)], "nextPageToken": "p3"},
+            "p3": {"items": [_thread("c0", 0)]},
+        }
+        mock_client_instance, _ = _fake_api(mock_get_client, thread_pages, {})
+        progress = AsyncMock()
+
+        first = await youtube_get_comments(video_id="abc123", crawl=True, chunk_size=5, progress=progress)
+        second = await youtube_get_comments(
+            video_id="abc123", crawl=True, chunk_size=5, page_token=first["pagination"]["nextPageToken"]
+        )
+
+        assert len(first["data"]) == 5
+        assert first["pagination"]["nextPageToken"] == "p3"
+        assert [t["id"] for t in second["data"]] == ["c0"]
+        assert progress.await_count == 2
+        # The first chunk never requested the page beyond its limit
+        tokens = [c.kwargs["pageToken"] for c in mock_client_instance.client.commentThreads.return_value.list.call_args_list]
+        assert tokens == [None, "p2", "p3"]
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.comments.get_youtube_client")
+    async def test_closing_generator_cancels_prefetch(self, mock_get_client):
+        """Stopping iteration early should not leave a page request pending."""
+        thread_pages = {
+            None: {"items": [_thread("t1", 0)], "nextPageToken": "p2"},
+            "p2": {"items": [_thread("t2", 0)]},
+        }
+        _fake_api(mock_get_client, thread_pages, {})
+
+        pages = iter_comment_threads("abc123")
+        first = await pages.__anext__()
+        await pages.aclose()
+
+        assert [t["id"] for t in first["items"]] == ["t1"]
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.comments.get_youtube_client")
+    async def test_crawl_reports_reply_errors(self, mock_get_client):
+        """A failing reply lookup should surface as the tool error."""
+        thread_pages = {None: {"items": [_thread("t1", 5)]}}
+        mock_client_instance, _ = _fake_api(mock_get_client, thread_pages, {})
+        mock_client_instance.client.comments.return_value.list.side_effect = Exception("API Error")
+
+        result = await youtube_get_comments(video_id="abc123", crawl=True)
+
+        assert result["data"] is None
+        assert result["error"]["code"] == "Exception"
@@ -1,8 +1,12 @@
 """Unit tests for youtube_get_playlist and youtube_list_playlists tools."""
 import pytest
 import os
-from unittest.mock import Mock, patch
-from src.tools.playlist import youtube_get_playlist, youtube_list_playlists, GetPlaylistArgs, ListPlaylistsArgs
+import time
+from unittest.mock import AsyncMock, Mock, call, patch
+from src.tools.playlist import (
+    youtube_get_playlist, youtube_list_playlists, iter_playlist_pages,
+    GetPlaylistArgs, ListPlaylistsArgs, COMPACT_ITEM_FIELDS, MAX_PLAYLIST_ITEMS
+)
 
 
 @pytest.mark.unit
@@ -33,12 +37,11 @@ class TestYouTubeGetPlaylist:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.playlist._client", None)
-    @patch("src.tools.playlist.YouTubeClient")
-    async def test_get_playlist_success(self, mock_client_class):
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_get_playlist_success(self, mock_get_client):
         """youtube_get_playlist should return playlist data on success."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_items = Mock()
         mock_items.list.return_value.execute.return_value = {
@@ -63,12 +66,11 @@ class TestYouTubeGetPlaylist:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.playlist._client", None)
-    @patch("src.tools.playlist.YouTubeClient")
-    async def test_get_playlist_max_results_capped_at_50(self, mock_client_class):
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_get_playlist_max_results_capped_at_50(self, mock_get_client):
         """youtube_get_playlist should cap max_results at 50."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_items = Mock()
         mock_items.list.return_value.execute.return_value = {"items": [], "pageInfo": {"totalResults": 0}}
@@ -85,12 +87,11 @@ class TestYouTubeGetPlaylist:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.playlist._client", None)
-    @patch("src.tools.playlist.YouTubeClient")
-    async def test_get_playlist_handles_api_exception(self, mock_client_class):
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_get_playlist_handles_api_exception(self, mock_get_client):
         """youtube_get_playlist should handle API exceptions gracefully."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_items = Mock()
         mock_items.list.return_value.execute.side_effect = Exception("API Error")
@@ -109,12 +110,11 @@ class TestYouTubeListPlaylists:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.playlist._client", None)
-    @patch("src.tools.playlist.YouTubeClient")
-    async def test_list_playlists_success(self, mock_client_class):
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_list_playlists_success(self, mock_get_client):
         """youtube_list_playlists should return playlists on success."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_playlists = Mock()
         mock_playlists.list.return_value.execute.return_value = {
@@ -136,12 +136,11 @@ class TestYouTubeListPlaylists:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.playlist._client", None)
-    @patch("src.tools.playlist.YouTubeClient")
-    async def test_list_playlists_max_results_capped_at_50(self, mock_client_class):
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_list_playlists_max_results_capped_at_50(self, mock_get_client):
         """youtube_list_playlists should cap max_results at 50."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_playlists = Mock()
         mock_playlists.list.return_value.execute.return_value = {"items": [], "pageInfo": {"totalResults": 0}}
@@ -154,12 +153,11 @@ class TestYouTubeListPlaylists:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.playlist._client", None)
-    @patch("src.tools.playlist.YouTubeClient")
-    async def test_list_playlists_handles_api_exception(self, mock_client_class):
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_list_playlists_handles_api_exception(self, mock_get_client):
         """youtube_list_playlists should handle API exceptions gracefully."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_playlists = Mock()
         mock_playlists.list.return_value.execute.side_effect = Exception("API Error")
@@ -170,3 +168,214 @@ class TestYouTubeListPlaylists:
         assert result["data"] is None
         assert result["error"]["code"] == "Exception"
         assert result["pagination"] is None
+
+
+@pytest.mark.unit
+class TestGetPlaylistConcurrency:
+    """Test the concurrent details + items fetch in youtube_get_playlist."""
+
+    DELAY = 0.2
+
+    def _slow_client(self, mock_get_client):
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+
+        def slow(response):
+            def execute(http=None):
+                time.sleep(self.DELAY)
+                return response
+            return execute
+
+        mock_client_instance.client.playlistItems.return_value.list.return_value.execute.side_effect = slow(
+            {"items": [{"id": "item1"}], "pageInfo": {"totalResults": 1}}
+        )
+        mock_client_instance.client.playlists.return_value.list.return_value.execute.side_effect = slow(
+            {"items": [{"id": "PLabc123"}]}
+        )
+        return mock_client_instance
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_details_and_items_fetched_concurrently(self, mock_get_client):
+        """Both requests should overlap: one round trip of latency instead of two."""
+        self._slow_client(mock_get_client)
+
+        start = time.perf_counter()
+        result = await youtube_get_playlist(playlist_id="PLabc123")
+        elapsed = time.perf_counter() - start
+
+        assert result["error"] is None
+        # Sequential requests would take 2 * DELAY
+        assert elapsed < self.DELAY * 1.75
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_details_cached_across_pages(self, mock_get_client):
+        """Fetching further pages should reuse the cached playlist details."""
+        mock_client_instance = self._slow_client(mock_get_client)
+
+        await youtube_get_playlist(playlist_id="PLabc123", max_results=10)
+        second = await youtube_get_playlist(playlist_id="PLabc123", max_results=20)
+
+        assert second["data"]["details"]["id"] == "PLabc123"
+        assert mock_client_instance.client.playlists.return_value.list.return_value.execute.call_count == 1
+        assert mock_client_instance.client.playlistItems.return_value.list.return_value.execute.call_count == 2
+
+
+def _page(start, count, next_token, total):
+    return {
+        "items": [
+            {
+                "snippet": {"title": f"Video {i}", "position": i, "resourceId": {"videoId": f"vid{i}"},
+                            "description": "long text that compact items drop"},
+                "contentDetails": {"videoId": f"vid{i}", "videoPublishedAt": "2024-01-01T00:00:00Z"},
+            }
+            for i in range(start, start + count)
+        ],
+        "nextPageToken": next_token,
+        "pageInfo": {"totalResults": total},
+    }
+
+
+@pytest.mark.unit
+class TestGetPlaylistAllPages:
+    """Test the auto-paginating mode of youtube_get_playlist."""
+
+    def _client(self, mock_get_client, pages):
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        mock_client_instance.client.playlistItems.return_value.list.return_value.execute.side_effect = pages
+        mock_client_instance.client.playlists.return_value.list.return_value.execute.return_value = {
+            "items": [{"id": "PLabc123"}]
+        }
+        return mock_client_instance
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_walks_every_page(self, mock_get_client):
+        """all_pages should follow nextPageToken until the last page."""
+        mock_client_instance = self._client(mock_get_client, [
+            _page(0, 50, "p2", 120), _page(50, 50, "p3", 120), _page(100, 20, None, 120)
+        ])
+
+        result = await youtube_get_playlist(playlist_id="PLabc123", all_pages=True)
+
+        assert result["error"] is None
+        assert [item["position"] for item in result["data"]["items"]] == list(range(120))
+        assert result["pagination"] == {"nextPageToken": None, "totalResults": 120}
+        tokens = [c.kwargs["pageToken"] for c in mock_client_instance.client.playlistItems.return_value.list.call_args_list]
+        assert tokens == [None, "p2", "p3"]
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_limit_stops_early(self, mock_get_client):
+        """The item limit should cap the last page and return a resume token."""
+        mock_client_instance = self._client(mock_get_client, [_page(0, 50, "p2", 5000), _page(50, 20, "p3", 5000)])
+
+        result = await youtube_get_playlist(playlist_id="PLabc123", all_pages=True, limit=70)
+
+        assert len(result["data"]["items"]) == 70
+        assert result["pagination"]["nextPageToken"] == "p3"
+        sizes = [c.kwargs["maxResults"] for c in mock_client_instance.client.playlistItems.return_value.list.call_args_list]
+        assert sizes == [50, 20]
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_limit_is_clamped(self, mock_get_client):
+        """An oversized limit should stop at MAX_PLAYLIST_ITEMS."""
+        pages = [_page(i * 50, 50, f"p{i + 2}", 10 ** 6) for i in range(MAX_PLAYLIST_ITEMS // 50 + 1)]
+        mock_client_instance = self._client(mock_get_client, pages)
+
+        result = await youtube_get_playlist(playlist_id="PLabc123", all_pages=True, limit=10 ** 6)
+
+        assert len(result["data"]["items"]) == MAX_PLAYLIST_ITEMS
+        assert result["pagination"]["nextPageToken"] == f"p{MAX_PLAYLIST_ITEMS // 50 + 1}"
+        list_calls = mock_client_instance.client.playlistItems.return_value.list.call_count
+        assert list_calls == MAX_PLAYLIST_ITEMS // 50
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_items_are_compact(self, mock_get_client):
+        """Items should be projected to compact form and request only those fields."""
+        mock_client_instance = self._client(mock_get_client, [_page(0, 1, None, 1)])
+
+        result = await youtube_get_playlist(playlist_id="PLabc123", all_pages=True)
+
+        assert result["data"]["items"] == [{
+            "videoId": "vid0", "title": "Video 0", "position": 0, "channelId": None,
+            "channelTitle": None, "publishedAt": "2024-01-01T00:00:00Z",
+        }]
+        call = mock_client_instance.client.playlistItems.return_value.list.call_args
+        assert call.kwargs["fields"] == COMPACT_ITEM_FIELDS
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_reports_progress_per_page(self, mock_get_client):
+        """The progress callback should be awaited after every page."""
+        self._client(mock_get_client, [_page(0, 50, "p2", 80), _page(50, 30, None, 80)])
+        progress = AsyncMock()
+
+        await youtube_get_playlist(playlist_id="PLabc123", all_pages=True, progress=progress)
+
+        assert progress.await_args_list == [call(50, 80), call(80, 80)]
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_iter_playlist_pages_is_lazy(self, mock_get_client):
+        """Pages should only be fetched as the generator is consumed."""
+        mock_client_instance = self._client(mock_get_client, [_page(0, 50, "p2", 100), _page(50, 50, None, 100)])
+
+        pages = iter_playlist_pages("PLabc123")
+        first = await pages.__anext__()
+        await pages.aclose()
+
+        assert len(first["items"]) == 50
+        assert mock_client_instance.client.playlistItems.return_value.list.return_value.execute.call_count == 1
+
+
+@pytest.mark.unit
+class TestListPlaylistsByHandle:
+    """Test youtube_list_playlists with a channel handle."""
+
+    @pytest.mark.asyncio
+    @patch("src.tools.channel.get_youtube_client")
+    @patch("src.tools.playlist.get_youtube_client")
+    async def test_handle_resolved_once(self, mock_get_client, mock_get_channel_client):
+        """The handle should be resolved on the first call only."""
+        mock_channels = mock_get_channel_client.return_value.client.channels.return_value
+        mock_channels.list.return_value.execute.return_value = {"items": [{"id": "UCabc123"}]}
+        mock_playlists = mock_get_client.return_value.client.playlists.return_value
+        mock_playlists.list.return_value.execute.return_value = {"items": [{"id": "PL1"}]}
+
+        await youtube_list_playlists(username="@testchannel")
+        result = await youtube_list_playlists(username="@TestChannel", max_results=5)
+
+        assert result["data"] == [{"id": "PL1"}]
+        mock_channels.list.assert_called_once()
+        assert mock_channels.list.call_args.kwargs["forHandle"] == "@testchannel"
+        assert mock_playlists.list.call_args.kwargs["channelId"] == "UCabc123"
+
+    @pytest.mark.asyncio
+    @patch("src.tools.channel.get_youtube_client")
+    async def test_unknown_handle(self, mock_get_channel_client):
+        """An unresolvable handle should be NotFound."""
+        mock_channels = mock_get_channel_client.return_value.client.channels.return_value
+        mock_channels.list.return_value.execute.return_value = {"items": []}
+
+        result = await youtube_list_playlists(username="@nobody")
+
+        assert result["error"]["code"] == "NotFound"
+
+    @pytest.mark.asyncio
+    async def test_requires_channel(self):
+        """Calling without channel_id or username should be InvalidInput."""
+        result = await youtube_list_playlists()
+        assert result["error"]["code"] == "InvalidInput"
@@ -1,6 +1,7 @@
 """Unit tests for youtube_search tool."""
 import pytest
 import os
+import time
 from unittest.mock import Mock, patch, MagicMock
 from src.tools.search import youtube_search, SearchArgs
 
@@ -44,13 +45,12 @@ class TestYouTubeSearch:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.search._client", None)
-    @patch("src.tools.search.YouTubeClient")
-    async def test_search_success(self, mock_client_class):
+    @patch("src.tools.search.get_youtube_client")
+    async def test_search_success(self, mock_get_client):
         """youtube_search should return results on success."""
         # Setup mock client
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_search = Mock()
         mock_search.list.return_value.execute.return_value = {
@@ -86,12 +86,11 @@ class TestYouTubeSearch:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.search._client", None)
-    @patch("src.tools.search.YouTubeClient")
-    async def test_search_max_results_capped_at_50(self, mock_client_class):
+    @patch("src.tools.search.get_youtube_client")
+    async def test_search_max_results_capped_at_50(self, mock_get_client):
         """youtube_search should cap max_results at 50."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_search = Mock()
         mock_search.list.return_value.execute.return_value = {"items": [], "pageInfo": {"totalResults": 0}}
@@ -105,12 +104,11 @@ class TestYouTubeSearch:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.search._client", None)
-    @patch("src.tools.search.YouTubeClient")
-    async def test_search_order_parameter(self, mock_client_class):
+    @patch("src.tools.search.get_youtube_client")
+    async def test_search_order_parameter(self, mock_get_client):
         """youtube_search should pass order parameter to API."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_search = Mock()
         mock_search.list.return_value.execute.return_value = {"items": [], "pageInfo": {"totalResults": 0}}
@@ -123,12 +121,11 @@ class TestYouTubeSearch:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.search._client", None)
-    @patch("src.tools.search.YouTubeClient")
-    async def test_search_type_parameter(self, mock_client_class):
+    @patch("src.tools.search.get_youtube_client")
+    async def test_search_type_parameter(self, mock_get_client):
         """youtube_search should pass type parameter to API."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_search = Mock()
         mock_search.list.return_value.execute.return_value = {"items": [], "pageInfo": {"totalResults": 0}}
@@ -141,12 +138,11 @@ class TestYouTubeSearch:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.search._client", None)
-    @patch("src.tools.search.YouTubeClient")
-    async def test_search_handles_empty_results(self, mock_client_class):
+    @patch("src.tools.search.get_youtube_client")
+    async def test_search_handles_empty_results(self, mock_get_client):
         """youtube_search should handle empty results."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_search = Mock()
         mock_search.list.return_value.execute.return_value = {
@@ -162,12 +158,11 @@ class TestYouTubeSearch:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.search._client", None)
-    @patch("src.tools.search.YouTubeClient")
-    async def test_search_preserves_pagination_token(self, mock_client_class):
+    @patch("src.tools.search.get_youtube_client")
+    async def test_search_preserves_pagination_token(self, mock_get_client):
         """youtube_search should preserve nextPageToken."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_search = Mock()
         mock_search.list.return_value.execute.return_value = {
@@ -183,12 +178,11 @@ class TestYouTubeSearch:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.search._client", None)
-    @patch("src.tools.search.YouTubeClient")
-    async def test_search_handles_api_exception(self, mock_client_class):
+    @patch("src.tools.search.get_youtube_client")
+    async def test_search_handles_api_exception(self, mock_get_client):
         """youtube_search should handle API exceptions gracefully."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_search = Mock()
         mock_search.list.return_value.execute.side_effect = Exception("API Error")
@@ -203,12 +197,11 @@ class TestYouTubeSearch:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.search._client", None)
-    @patch("src.tools.search.YouTubeClient")
-    async def test_search_handles_quota_exceeded(self, mock_client_class):
+    @patch("src.tools.search.get_youtube_client")
+    async def test_search_handles_quota_exceeded(self, mock_get_client):
         """youtube_search should handle quota exceeded errors."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_search = Mock()
         mock_search.list.return_value.execute.side_effect = Exception("Quota exceeded")
@@ -222,12 +215,11 @@ class TestYouTubeSearch:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.search._client", None)
-    @patch("src.tools.search.YouTubeClient")
-    async def test_search_uses_correct_parts(self, mock_client_class):
+    @patch("src.tools.search.get_youtube_client")
+    async def test_search_uses_correct_parts(self, mock_get_client):
         """youtube_search should request correct API parts."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_search = Mock()
         mock_search.list.return_value.execute.return_value = {"items": [], "pageInfo": {"totalResults": 0}}
@@ -238,3 +230,115 @@ class TestYouTubeSearch:
         call_args = mock_search.list.call_args
         assert "part" in call_args[1]
         assert call_args[1]["part"] == "id,snippet"
+
+
+def _search_page(prefix, count, next_token=None):
+    return {
+        "items": [{"id": {"kind": "youtube#video", "videoId": f"{prefix}{i}"}, "snippet": {}} for i in range(count)],
+        "nextPageToken": next_token,
+        "pageInfo": {"totalResults": 1000},
+    }
+
+
+def _fake_search_api(mock_search_client, mock_video_client, pages, delay=0.0):
+    """Serve search pages by pageToken and echo videos.list IDs back with statistics."""
+    mock_client_instance = Mock()
+    mock_search_client.return_value = mock_client_instance
+    mock_video_client.return_value = mock_client_instance
+
+    def search_list(**kwargs):
+        def execute(http=None):
+            time.sleep(delay)
+            return pages[kwargs.get("pageToken")]
+        request = Mock()
+        request.execute.side_effect = execute
+        return request
+
+    def videos_list(**kwargs):
+        def execute(http=None):
+            time.sleep(delay)
+            return {"items": [
+                {"id": vid, "statistics": {"viewCount": "7"}, "contentDetails": {"duration": "PT1M"}}
+                for vid in kwargs["id"].split(",")
+            ]}
+        request = Mock()
+        request.execute.side_effect = execute
+        return request
+
+    mock_client_instance.client.search.return_value.list.side_effect = search_list
+    mock_client_instance.client.videos.return_value.list.side_effect = videos_list
+    return mock_client_instance
+
+
+@pytest.mark.unit
+class TestSearchPaginationAndEnrichment:
+    """Test page_token, multi-page search and enrichment."""
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.video.get_youtube_client")
+    @patch("src.tools.search.get_youtube_client")
+    async def test_page_token_passed(self, mock_get_client, mock_video_client):
+        """page_token should be forwarded to search.list."""
+        _fake_search_api(mock_get_client, mock_video_client, {"tok": _search_page("a", 2)})
+
+        result = await youtube_search(query="test", page_token="tok")
+
+        assert len(result["data"]) == 2
+        call_args = mock_get_client.return_value.client.search.return_value.list.call_args
+        assert call_args[1]["pageToken"] == "tok"
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.video.get_youtube_client")
+    @patch("src.tools.search.get_youtube_client")
+    async def test_multiple_pages(self, mock_get_client, mock_video_client):
+        """pages should follow nextPageToken and return the token after the last page."""
+        _fake_search_api(mock_get_client, mock_video_client, {
+            None: _search_page("a", 2, "p2"), "p2": _search_page("b", 2, "p3")
+        })
+
+        result = await youtube_search(query="test", pages=2)
+
+        assert [item["id"]["videoId"] for item in result["data"]] == ["a0", "a1", "b0", "b1"]
+        assert result["pagination"]["nextPageToken"] == "p3"
+        assert mock_get_client.return_value.client.search.return_value.list.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.video.get_youtube_client")
+    @patch("src.tools.search.get_youtube_client")
+    async def test_enrich_merges_video_details(self, mock_get_client, mock_video_client):
+        """enrich should add statistics and contentDetails with one videos.list per page."""
+        page = _search_page("a", 3)
+        page["items"].append({"id": {"kind": "youtube#channel", "channelId": "UC1"}, "snippet": {}})
+        mock_client_instance = _fake_search_api(mock_get_client, mock_video_client, {None: page})
+
+        result = await youtube_search(query="test", enrich=True)
+
+        videos = result["data"][:3]
+        assert all(v["statistics"] == {"viewCount": "7"} for v in videos)
+        assert all(v["contentDetails"] == {"duration": "PT1M"} for v in videos)
+        assert "statistics" not in result["data"][3]
+        call_args = mock_client_instance.client.videos.return_value.list.call_args
+        assert call_args[1]["id"] == "a0,a1,a2"
+        assert call_args[1]["part"] == "statistics,contentDetails"
+
+    @pytest.mark.asyncio
+    @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
+    @patch("src.tools.video.get_youtube_client")
+    @patch("src.tools.search.get_youtube_client")
+    async def test_next_search_overlaps_enrichment(self, mock_get_client, mock_video_client):
+        """Page N+1's search should run while page N is being enriched."""
+        delay = 0.1
+        _fake_search_api(mock_get_client, mock_video_client, {
+            None: _search_page("a", 2, "p2"), "p2": _search_page("b", 2)
+        }, delay=delay)
+
+        start = time.perf_counter()
+        result = await youtube_search(query="test", pages=2, enrich=True)
+        elapsed = time.perf_counter() - start
+
+        assert all("statistics" in item for item in result["data"])
+        # Sequential: search, enrich, search, enrich = 4 delays; pipelined: 3
+        assert elapsed < delay * 3.6
@@ -1,8 +1,10 @@
 """Unit tests for youtube_get_transcript tool."""
+import asyncio
 import pytest
-import os
 from unittest.mock import Mock, patch, MagicMock
-from src.tools.transcript import youtube_get_transcript, GetTranscriptArgs, _transcript_api, _client
+from src.tools.transcript import (
+    youtube_get_transcript, GetTranscriptArgs, choose_track, get_track_list, reset_transcript_caches
+)
 
 
 @pytest.mark.unit
@@ -16,57 +18,82 @@ class TestGetTranscriptArgs:
         assert args.language == "en"
 
 
+def make_track(code, generated=False, translations=(), texts=("Hello world", "This is a test")):
+    """Mock youtube-transcript-api Transcript."""
+    track = Mock()
+    track.language_code = code
+    track.language = code.upper()
+    track.is_generated = generated
+    track.is_translatable = bool(translations)
+    track.translation_languages = [Mock(language_code=c) for c in translations]
+    track.fetch.return_value = [
+        Mock(text=text, start=float(i), duration=1.0) for i, text in enumerate(texts)
+    ]
+    track.translate.side_effect = lambda c: make_track(c, generated=True, texts=texts)
+    return track
+
+
+def mock_transcript_api(mock_get_api, tracks):
+    mock_api_instance = MagicMock()
+    mock_get_api.return_value = mock_api_instance
+    mock_api_instance.list.return_value = tracks
+    return mock_api_instance
+
+
 @pytest.mark.unit
 class TestYouTubeGetTranscript:
     """Test youtube_get_transcript function."""
 
-    def setup_method(self):
-        """Reset module-level state before each test."""
-        import src.tools.transcript as transcript_module
-        transcript_module._transcript_api = None
-        transcript_module._client = None
-
     @pytest.mark.asyncio
     async def test_get_transcript_success(self):
         """youtube_get_transcript should return transcript data."""
-        with patch("src.tools.transcript.YouTubeTranscriptApi") as MockApiClass, \
-             patch("src.tools.transcript.YouTubeClient") as MockClientClass:
-            # Mock transcript API instance
-            mock_api_instance = MagicMock()
-            MockApiClass.return_value = mock_api_instance
-
-            mock_transcript_data = [
-                Mock(text="Hello world", start=0.0, duration=1.0),
-                Mock(text="This is a test", start=1.0, duration=1.0),
-            ]
-            mock_api_instance.fetch.return_value = mock_transcript_data
-
-            # Mock YouTube client (for available tracks)
-            mock_client_instance = MagicMock()
-            MockClientClass.return_value = mock_client_instance
-            mock_client_instance.client.captions().list().execute.return_value = {"items": []}
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            track = make_track("en")
+            mock_api_instance = mock_transcript_api(mock_get_api, [track])
 
             result = await youtube_get_transcript(video_id="abc123", language="en")
 
             assert result["data"]["videoId"] == "abc123"
             assert result["data"]["language"] == "en"
+            assert result["data"]["trackKind"] == "standard"
             assert result["data"]["segmentCount"] == 2
+            assert "availableTracks" not in result["data"]
             assert result["error"] is None
+            # One listing, one fetch of the chosen track
+            mock_api_instance.list.assert_called_once()
+            track.fetch.assert_called_once()
+            mock_api_instance.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_transcript_include_tracks(self):
+        """include_tracks should describe the listed tracks."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_transcript_api(mock_get_api, [make_track("en", translations=["fr"]), make_track("de", generated=True)])
+
+            result = await youtube_get_transcript(video_id="abc123", include_tracks=True)
+
+            assert result["data"]["availableTracks"] == [
+                {"language": "en", "name": "EN", "kind": "standard", "translatable": True},
+                {"language": "de", "name": "DE", "kind": "asr", "translatable": False},
+            ]
+
+    @pytest.mark.asyncio
+    async def test_get_transcript_spends_no_quota(self):
+        """A transcript call should not touch the Data API quota."""
+        from src.main import call_tool
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_transcript_api(mock_get_api, [make_track("en")])
+
+            result = await call_tool("youtube_get_transcript", {"video_id": "abc123"})
+
+        assert result["error"] is None
+        assert result["quota"]["callCost"] == 0
 
     @pytest.mark.asyncio
     async def test_get_transcript_no_transcript_available(self):
         """youtube_get_transcript should return NotFound when no transcript available."""
-        with patch("src.tools.transcript.YouTubeTranscriptApi") as MockApiClass:
-            mock_api_instance = MagicMock()
-            MockApiClass.return_value = mock_api_instance
-            mock_api_instance.list.return_value = []
-
-            from youtube_transcript_api import NoTranscriptFound
-            # First call raises NoTranscriptFound, second call also raises it (no auto-generated)
-            mock_api_instance.fetch.side_effect = [
-                NoTranscriptFound("abc123", ["en"], []),
-                NoTranscriptFound("abc123", [], [])
-            ]
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_transcript_api(mock_get_api, [])
 
             result = await youtube_get_transcript(video_id="abc123")
 
@@ -76,12 +103,11 @@ class TestYouTubeGetTranscript:
     @pytest.mark.asyncio
     async def test_get_transcript_transcripts_disabled(self):
         """youtube_get_transcript should return error when transcripts disabled."""
-        with patch("src.tools.transcript.YouTubeTranscriptApi") as MockApiClass:
-            mock_api_instance = MagicMock()
-            MockApiClass.return_value = mock_api_instance
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_api_instance = mock_transcript_api(mock_get_api, [])
 
             from youtube_transcript_api import TranscriptsDisabled
-            mock_api_instance.fetch.side_effect = TranscriptsDisabled("abc123")
+            mock_api_instance.list.side_effect = TranscriptsDisabled("abc123")
 
             result = await youtube_get_transcript(video_id="abc123")
 
@@ -92,13 +118,444 @@ class TestYouTubeGetTranscript:
     @pytest.mark.asyncio
     async def test_get_transcript_handles_exception(self):
         """youtube_get_transcript should handle API exceptions gracefully."""
-        with patch("src.tools.transcript.YouTubeTranscriptApi") as MockApiClass:
-            mock_api_instance = MagicMock()
-            MockApiClass.return_value = mock_api_instance
-            mock_api_instance.fetch.side_effect = Exception("API Error")
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_api_instance = mock_transcript_api(mock_get_api, [])
+            mock_api_instance.list.side_effect = Exception("API Error")
 
             result = await youtube_get_transcript(video_id="abc123")
 
             assert result["data"] is None
             assert result["error"]["code"] == "Exception"
             assert result["pagination"] is None
+
+
+@pytest.mark.unit
+class TestTrackSelection:
+    """Test language negotiation and the track list cache."""
+
+    def test_manual_preferred_over_generated(self):
+        """A manual track should win over a generated one in the same language."""
+        generated, manual = make_track("en", generated=True), make_track("en")
+        assert choose_track([generated, manual], "en") == (manual, False)
+
+    def test_exact_language_before_regional_variant(self):
+        """An exact language match should beat a regional variant."""
+        variant, exact = make_track("en-GB"), make_track("en", generated=True)
+        assert choose_track([variant, exact], "en") == (exact, False)
+        assert choose_track([variant], "en") == (variant, False)
+
+    def test_translation_when_language_missing(self):
+        """A translatable track should be translated before falling back."""
+        track = make_track("de", translations=["en"])
+        chosen, translated = choose_track([make_track("ja"), track], "en")
+        assert translated is True
+        assert chosen.language_code == "en"
+        track.translate.assert_called_once_with("en")
+
+    def test_falls_back_to_any_track(self):
+        """With no match or translation, the first manual track is used."""
+        generated, manual = make_track("ja", generated=True), make_track("de")
+        assert choose_track([generated, manual], "en") == (manual, False)
+        assert choose_track([], "en") == (None, False)
+
+    @pytest.mark.asyncio
+    async def test_track_list_cached_per_video(self):
+        """Repeated requests for a video should reuse its track list."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_api_instance = mock_transcript_api(mock_get_api, [make_track("en"), make_track("fr")])
+
+            await youtube_get_transcript(video_id="abc123", language="en")
+            result = await youtube_get_transcript(video_id="abc123", language="fr")
+
+            assert result["data"]["language"] == "fr"
+            mock_api_instance.list.assert_called_once_with("abc123")
+
+    @pytest.mark.asyncio
+    async def test_track_list_expires(self):
+        """A listing older than TRACK_LIST_TTL should be refreshed."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api, \
+             patch("src.tools.transcript.TRACK_LIST_TTL", 0):
+            mock_api_instance = mock_transcript_api(mock_get_api, [make_track("en")])
+
+            await get_track_list("abc123")
+            await get_track_list("abc123")
+
+            assert mock_api_instance.list.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_listings_shared(self):
+        """Concurrent requests for one video should share a single listing."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_api_instance = mock_transcript_api(mock_get_api, [make_track("en")])
+
+            results = await asyncio.gather(*(get_track_list("abc123") for _ in range(5)))
+
+            assert all(len(tracks) == 1 for tracks in results)
+            assert mock_api_instance.list.call_count == 1
+
+
+@pytest.mark.unit
+class TestTranscriptRanges:
+    """Test time-range and paginated transcript retrieval."""
+
+    TEXTS = tuple(f"line {i}" for i in range(10))  # starts 0..9, 1s each
+
+    @pytest.mark.asyncio
+    async def test_time_range(self):
+        """start_time/end_time should select the overlapping segments."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_transcript_api(mock_get_api, [make_track("en", texts=self.TEXTS)])
+
+            result = await youtube_get_transcript(video_id="abc123", start_time=3.0, end_time=6.0)
+
+            assert [s["text"] for s in result["data"]["segments"]] == ["line 3", "line 4", "line 5"]
+            assert result["data"]["text"] == "line 3 line 4 line 5"
+            assert result["pagination"]["totalResults"] == 3
+            assert result["pagination"]["nextOffset"] is None
+
+    @pytest.mark.asyncio
+    async def test_offset_limit_pages(self):
+        """offset/limit should page through the transcript via nextOffset."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_transcript_api(mock_get_api, [make_track("en", texts=self.TEXTS)])
+
+            first = await youtube_get_transcript(video_id="abc123", limit=4)
+            second = await youtube_get_transcript(
+                video_id="abc123", limit=4, offset=first["pagination"]["nextOffset"]
+            )
+
+            assert first["data"]["segmentCount"] == 4
+            assert first["pagination"]["nextOffset"] == 4
+            assert first["pagination"]["totalResults"] == 10
+            assert second["data"]["segments"][0]["text"] == "line 4"
+            assert second["pagination"]["nextOffset"] == 8
+
+    @pytest.mark.asyncio
+    async def test_include_flags(self):
+        """include_text/include_segments should drop the unwanted representation."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_transcript_api(mock_get_api, [make_track("en")])
+
+            text_only = await youtube_get_transcript(video_id="abc123", include_segments=False)
+            segments_only = await youtube_get_transcript(video_id="abc123", include_text=False)
+
+            assert "segments" not in text_only["data"]
+            assert text_only["data"]["text"] == "Hello world This is a test"
+            assert "text" not in segments_only["data"]
+            assert len(segments_only["data"]["segments"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_ranges_reuse_cached_transcript(self):
+        """Different ranges of one transcript should fetch the track once."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            track = make_track("en", texts=self.TEXTS)
+            mock_transcript_api(mock_get_api, [track])
+
+            await youtube_get_transcript(video_id="abc123", start_time=0.0, end_time=2.0)
+            await youtube_get_transcript(video_id="abc123", start_time=5.0)
+            results = await asyncio.gather(*(
+                youtube_get_transcript(video_id="abc123", offset=i, limit=1) for i in range(3)
+            ))
+
+            assert [r["data"]["segments"][0]["text"] for r in results] == ["line 0", "line 1", "line 2"]
+            track.fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_columnar_format(self):
+        """format=columnar should return parallel arrays instead of segment objects."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_transcript_api(mock_get_api, [make_track("en", texts=self.TEXTS)])
+
+            result = await youtube_get_transcript(video_id="abc123", format="columnar", offset=2, limit=2)
+
+            assert "segments" not in result["data"]
+            assert result["data"]["columns"] == {
+                "starts": [2.0, 3.0],
+                "durations": [1.0, 1.0],
+                "texts": ["line 2", "line 3"],
+            }
+
+    @pytest.mark.asyncio
+    async def test_unknown_format_rejected(self):
+        """An unknown format should be an InvalidInput error without fetching."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            result = await youtube_get_transcript(video_id="abc123", format="xml")
+
+            assert result["error"]["code"] == "InvalidInput"
+            mock_get_api.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_chunks_format(self):
+        """format=chunks should merge segments into timed paragraphs."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_transcript_api(mock_get_api, [make_track("en", texts=self.TEXTS)])
+
+            result = await youtube_get_transcript(
+                video_id="abc123", format="chunks", chunk_chars=20, include_text=False
+            )
+
+            chunks = result["data"]["chunks"]
+            assert [c["text"] for c in chunks] == [
+                "line 0 line 1 line 2", "line 3 line 4 line 5", "line 6 line 7 line 8", "line 9"
+            ]
+            assert chunks[1]["start"] == 3.0 and chunks[1]["end"] == 6.0
+            assert "segments" not in result["data"] and "text" not in result["data"]
+
+
+@pytest.mark.unit
+class TestSearchTranscripts:
+    """Test youtube_search_transcripts."""
+
+    @pytest.mark.asyncio
+    async def test_searches_loaded_transcripts(self):
+        """Transcripts fetched earlier should be searchable without refetching."""
+        from src.tools.transcript import youtube_search_transcripts
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            track = make_track("en", texts=("welcome back", "today we cover binary search trees"))
+            mock_transcript_api(mock_get_api, [track])
+            await youtube_get_transcript(video_id="abc123")
+
+            result = await youtube_search_transcripts(query="binary trees")
+
+            hit = result["data"]["hits"][0]
+            assert hit["videoId"] == "abc123"
+            assert "binary search trees" in hit["text"]
+            assert hit["start"] == 0.0
+            assert result["pagination"]["totalResults"] == 1
+            track.fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_loads_missing_videos(self):
+        """Listed videos without a loaded transcript should be fetched, failures reported."""
+        from src.tools.transcript import youtube_search_transcripts
+        from youtube_transcript_api import TranscriptsDisabled
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_api_instance = mock_transcript_api(mock_get_api, [])
+            tracks = {"vid1": [make_track("en", texts=("graph algorithms",))]}
+
+            def list_tracks(video_id):
+                if video_id not in tracks:
+                    raise TranscriptsDisabled(video_id)
+                return tracks[video_id]
+
+            mock_api_instance.list.side_effect = list_tracks
+
+            result = await youtube_search_transcripts(query="graph", video_ids=["vid1", "vid2"])
+
+            assert [h["videoId"] for h in result["data"]["hits"]] == ["vid1"]
+            assert result["data"]["unavailable"][0]["videoId"] == "vid2"
+            assert result["data"]["unavailable"][0]["error"]["code"] == "TranscriptsDisabled"
+
+    @pytest.mark.asyncio
+    async def test_not_cached_by_call_tool(self):
+        """Search results should reflect transcripts loaded after an earlier search."""
+        from src.main import call_tool
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_transcript_api(mock_get_api, [make_track("en", texts=("quantum computing",))])
+
+            before = await call_tool("youtube_search_transcripts", {"query": "quantum"})
+            await call_tool("youtube_get_transcript", {"video_id": "abc123"})
+            after = await call_tool("youtube_search_transcripts", {"query": "quantum", "fields": "videoId,start"})
+
+        assert before["data"]["hits"] == []
+        assert after["data"]["hits"] == [{"videoId": "abc123", "start": 0.0}]
+        assert after["quota"]["callCost"] == 0
+
+
+@pytest.mark.unit
+class TestGetTranscripts:
+    """Test youtube_get_transcripts."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order_with_errors(self):
+        """Each video should get its transcript or an error marker, in input order."""
+        from src.tools.transcript import youtube_get_transcripts
+        from youtube_transcript_api import TranscriptsDisabled
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_api_instance = mock_transcript_api(mock_get_api, [])
+            tracks = {"vid1": [make_track("en")], "vid3": [make_track("en", texts=("third",))], "vid4": []}
+
+            def list_tracks(video_id):
+                if video_id not in tracks:
+                    raise TranscriptsDisabled(video_id)
+                return tracks[video_id]
+
+            mock_api_instance.list.side_effect = list_tracks
+
+            result = await youtube_get_transcripts(video_ids=["vid1", "vid2", "vid3", "vid4", "vid1"])
+
+            data = result["data"]
+            assert [entry["videoId"] for entry in data] == ["vid1", "vid2", "vid3", "vid4"]
+            assert data[0]["text"] == "Hello world This is a test"
+            assert "segments" not in data[0]
+            assert data[1]["error"]["code"] == "TranscriptsDisabled"
+            assert data[2]["text"] == "third"
+            assert data[3]["error"]["code"] == "NotFound"
+            assert result["pagination"]["totalResults"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_capped(self):
+        """No more than the configured number of transcripts should load at once."""
+        import threading
+        import time
+        from src.tools.transcript import youtube_get_transcripts
+        lock = threading.Lock()
+        active = [0]
+        peak = [0]
+
+        def slow_fetch():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            return [Mock(text="hi", start=0.0, duration=1.0)]
+
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api, \
+             patch.dict("os.environ", {"YOUTUBE_TRANSCRIPT_CONCURRENCY": "3"}):
+            mock_api_instance = mock_transcript_api(mock_get_api, [])
+
+            def list_tracks(video_id):
+                track = make_track("en")
+                track.fetch.side_effect = slow_fetch
+                return [track]
+
+            mock_api_instance.list.side_effect = list_tracks
+
+            capped = await youtube_get_transcripts(video_ids=[f"v{i}" for i in range(8)], concurrency=10)
+            reset_transcript_caches()
+            peak_capped, peak[0] = peak[0], 0
+            lowered = await youtube_get_transcripts(video_ids=[f"v{i}" for i in range(4)], concurrency=1)
+
+        assert all("error" not in entry for entry in capped["data"] + lowered["data"])
+        assert 1 < peak_capped <= 3
+        assert peak[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_per_video_timeout(self):
+        """A transcript slower than the timeout should become a Timeout error."""
+        import time
+        from src.tools.transcript import youtube_get_transcripts
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            slow, fast = make_track("en"), make_track("en")
+            slow.fetch.side_effect = lambda: time.sleep(0.5) or []
+            mock_api_instance = mock_transcript_api(mock_get_api, [])
+            mock_api_instance.list.side_effect = lambda video_id: [slow if video_id == "slow" else fast]
+
+            result = await youtube_get_transcripts(video_ids=["slow", "fast"], timeout=0.1)
+
+            assert result["data"][0]["error"]["code"] == "Timeout"
+            assert result["data"][1]["segmentCount"] == 2
+
+    @pytest.mark.asyncio
+    async def test_playlist_source_and_progress(self):
+        """playlist_id should supply the videos, with progress sent per completed video."""
+        from unittest.mock import AsyncMock
+        from src.tools.transcript import youtube_get_transcripts
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api, \
+             patch("src.tools.playlist.get_youtube_client") as mock_get_client:
+            mock_transcript_api(mock_get_api, [make_track("en")])
+            items = mock_get_client.return_value.client.playlistItems.return_value
+            items.list.return_value.execute.return_value = {
+                "items": [{"contentDetails": {"videoId": v}} for v in ("pv1", "pv2", "pv3")],
+                "pageInfo": {"totalResults": 3}
+            }
+            progress = AsyncMock()
+
+            result = await youtube_get_transcripts(playlist_id="PLabc", max_videos=2, progress=progress)
+
+            assert [entry["videoId"] for entry in result["data"]] == ["pv1", "pv2"]
+            assert progress.await_count == 2
+            assert progress.await_args_list[-1].args[:2] == (2, 2)
+            assert progress.await_args_list[-1].args[2].endswith(": ok")
+
+    @pytest.mark.asyncio
+    async def test_max_videos_only_limits_playlist(self):
+        """Explicit video_ids should all be fetched; max_videos caps the playlist part."""
+        from src.tools.transcript import youtube_get_transcripts
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api, \
+             patch("src.tools.playlist.get_youtube_client") as mock_get_client:
+            mock_transcript_api(mock_get_api, [make_track("en")])
+            items = mock_get_client.return_value.client.playlistItems.return_value
+            items.list.return_value.execute.return_value = {
+                "items": [{"contentDetails": {"videoId": v}} for v in ("pv1", "pv2", "pv3")],
+                "pageInfo": {"totalResults": 3}
+            }
+
+            result = await youtube_get_transcripts(video_ids=["v1", "v2", "v3"], playlist_id="PLabc", max_videos=1)
+
+            assert [entry["videoId"] for entry in result["data"]] == ["v1", "v2", "v3", "pv1"]
+            assert result["pagination"]["totalResults"] == 4
+
+    @pytest.mark.asyncio
+    async def test_reuses_transcript_cache(self):
+        """Transcripts already loaded should not be fetched again."""
+        from src.tools.transcript import youtube_get_transcripts
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            track = make_track("en")
+            mock_transcript_api(mock_get_api, [track])
+
+            await youtube_get_transcript(video_id="abc123")
+            result = await youtube_get_transcripts(video_ids=["abc123"], format="chunks", include_segments=True)
+
+            assert result["data"][0]["chunks"][0]["text"] == "Hello world This is a test"
+            track.fetch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_requires_videos_or_playlist(self):
+        """Calling without video_ids or playlist_id should be InvalidInput."""
+        from src.tools.transcript import youtube_get_transcripts
+        result = await youtube_get_transcripts()
+        assert result["error"]["code"] == "InvalidInput"
+
+
+@pytest.mark.unit
+class TestTranscriptFailures:
+    """Test negative caching of videos without transcripts."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_remembered(self):
+        """A video with transcripts disabled should not be listed again within the TTL."""
+        from youtube_transcript_api import TranscriptsDisabled
+        from src.tools.transcript import youtube_get_transcripts
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_api_instance = mock_transcript_api(mock_get_api, [])
+            mock_api_instance.list.side_effect = TranscriptsDisabled("abc123")
+
+            first = await youtube_get_transcript(video_id="abc123")
+            second = await youtube_get_transcript(video_id="abc123")
+            bulk = await youtube_get_transcripts(video_ids=["abc123"])
+
+            assert first["error"]["code"] == second["error"]["code"] == "TranscriptsDisabled"
+            assert bulk["data"][0]["error"]["code"] == "TranscriptsDisabled"
+            mock_api_instance.list.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_not_found_expires(self):
+        """A remembered NotFound should be retried once the negative TTL passes."""
+        import time
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_api_instance = mock_transcript_api(mock_get_api, [])
+
+            await youtube_get_transcript(video_id="abc123")
+            mock_api_instance.list.return_value = [make_track("en")]
+            still_missing = await youtube_get_transcript(video_id="abc123", include_segments=False)
+            with patch("src.tools.transcript.time.monotonic", return_value=time.monotonic() + 10_000):
+                found = await youtube_get_transcript(video_id="abc123", include_segments=False)
+
+            assert still_missing["error"]["code"] == "NotFound"
+            assert found["error"] is None
+
+    @pytest.mark.asyncio
+    async def test_other_errors_not_remembered(self):
+        """Transient failures should be retried on the next call."""
+        with patch("src.tools.transcript.get_transcript_api") as mock_get_api:
+            mock_api_instance = mock_transcript_api(mock_get_api, [make_track("en")])
+            mock_api_instance.list.side_effect = [Exception("network"), [make_track("en")]]
+
+            first = await youtube_get_transcript(video_id="abc123")
+            second = await youtube_get_transcript(video_id="abc123")
+
+            assert first["error"]["code"] == "Exception"
+            assert second["error"] is None
@@ -1,8 +1,9 @@
 """Unit tests for youtube_get_video tool."""
 import pytest
 import os
+import time
 from unittest.mock import Mock, patch
-from src.tools.video import youtube_get_video, GetVideoArgs
+from src.tools.video import youtube_get_video, youtube_get_videos, GetVideoArgs, GetVideosArgs
 
 
 @pytest.mark.unit
@@ -28,12 +29,11 @@ class TestYouTubeGetVideo:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.video._client", None)
-    @patch("src.tools.video.YouTubeClient")
-    async def test_get_video_success(self, mock_client_class):
+    @patch("src.tools.video.get_youtube_client")
+    async def test_get_video_success(self, mock_get_client):
         """youtube_get_video should return video details on success."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_videos = Mock()
         mock_videos.list.return_value.execute.return_value = {
@@ -53,12 +53,11 @@ class TestYouTubeGetVideo:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.video._client", None)
-    @patch("src.tools.video.YouTubeClient")
-    async def test_get_video_not_found(self, mock_client_class):
+    @patch("src.tools.video.get_youtube_client")
+    async def test_get_video_not_found(self, mock_get_client):
         """youtube_get_video should return NotFound error for missing video."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_videos = Mock()
         mock_videos.list.return_value.execute.return_value = {"items": []}
@@ -73,12 +72,11 @@ class TestYouTubeGetVideo:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.video._client", None)
-    @patch("src.tools.video.YouTubeClient")
-    async def test_get_video_custom_part(self, mock_client_class):
+    @patch("src.tools.video.get_youtube_client")
+    async def test_get_video_custom_part(self, mock_get_client):
         """youtube_get_video should use custom part parameter."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_videos = Mock()
         mock_videos.list.return_value.execute.return_value = {"items": [{"id": "abc123"}]}
@@ -91,12 +89,11 @@ class TestYouTubeGetVideo:
 
     @pytest.mark.asyncio
     @patch.dict(os.environ, {"YOUTUBE_API_KEY": "test_key"})
-    @patch("src.tools.video._client", None)
-    @patch("src.tools.video.YouTubeClient")
-    async def test_get_video_handles_api_exception(self, mock_client_class):
+    @patch("src.tools.video.get_youtube_client")
+    async def test_get_video_handles_api_exception(self, mock_get_client):
         """youtube_get_video should handle API exceptions gracefully."""
         mock_client_instance = Mock()
-        mock_client_class.return_value = mock_client_instance
+        mock_get_client.return_value = mock_client_instance
 
         mock_videos = Mock()
         mock_videos.list.return_value.execute.side_effect = Exception("API Error")
@@ -107,3 +104,115 @@ class TestYouTubeGetVideo:
         assert result["data"] is None
         assert result["error"]["code"] == "Exception"
         assert result["pagination"] is None
+
+
+def _videos_list_by_ids(existing=None, delay=0.0):
+    """Build a videos().list side effect that returns items for the requested IDs."""
+    def list_side_effect(id, part):
+        ids = id.split(",")
+        request = Mock()
+
+        def execute(http=None):
+            time.sleep(delay)
+            return {"items": [{"id": i} for i in ids if existing is None or i in existing]}
+
+        request.execute.side_effect = execute
+        return request
+    return list_side_effect
+
+
+@pytest.mark.unit
+class TestYouTubeGetVideos:
+    """Test youtube_get_videos batch function."""
+
+    def test_get_videos_args_defaults(self):
+        """GetVideosArgs should use the same default parts as GetVideoArgs."""
+        args = GetVideosArgs(video_ids=["a", "b"])
+        assert args.part == ["snippet", "statistics", "contentDetails"]
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_get_videos_chunks_by_50(self, mock_get_client):
+        """youtube_get_videos should issue one videos.list call per 50 IDs."""
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        mock_videos = Mock()
+        mock_videos.list.side_effect = _videos_list_by_ids()
+        mock_client_instance.client.videos.return_value = mock_videos
+
+        video_ids = [f"vid{i:03d}" for i in range(120)]
+        result = await youtube_get_videos(video_ids=video_ids)
+
+        assert mock_videos.list.call_count == 3
+        sizes = sorted(len(c[1]["id"].split(",")) for c in mock_videos.list.call_args_list)
+        assert sizes == [20, 50, 50]
+        assert [item["id"] for item in result["data"]] == video_ids
+        assert result["pagination"]["totalResults"] == 120
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_get_videos_marks_missing_ids(self, mock_get_client):
+        """Missing IDs should get NotFound markers in their input position."""
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        mock_videos = Mock()
+        mock_videos.list.side_effect = _videos_list_by_ids(existing={"a", "c"})
+        mock_client_instance.client.videos.return_value = mock_videos
+
+        result = await youtube_get_videos(video_ids=["a", "missing", "c", "a"])
+
+        assert result["error"] is None
+        assert [item["id"] for item in result["data"]] == ["a", "missing", "c", "a"]
+        assert "error" not in result["data"][0]
+        assert result["data"][1]["error"]["code"] == "NotFound"
+        # Duplicates are fetched once
+        assert mock_videos.list.call_args[1]["id"] == "a,missing,c"
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_get_videos_failed_chunk_marks_its_ids(self, mock_get_client):
+        """A failing chunk should mark only its own IDs with the error."""
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        good = _videos_list_by_ids()
+
+        def list_side_effect(id, part):
+            if id.startswith("bad"):
+                request = Mock()
+                request.execute.side_effect = Exception("API Error")
+                return request
+            return good(id=id, part=part)
+
+        mock_videos = Mock()
+        mock_videos.list.side_effect = list_side_effect
+        mock_client_instance.client.videos.return_value = mock_videos
+
+        video_ids = [f"ok{i:02d}" for i in range(50)] + ["bad1"]
+        result = await youtube_get_videos(video_ids=video_ids)
+
+        assert result["error"] is None
+        assert "error" not in result["data"][0]
+        assert result["data"][50]["error"]["code"] == "Exception"
+
+    @pytest.mark.asyncio
+    @patch("src.tools.video.get_youtube_client")
+    async def test_get_videos_chunks_run_concurrently(self, mock_get_client):
+        """Chunks should be requested concurrently, not back to back."""
+        mock_client_instance = Mock()
+        mock_get_client.return_value = mock_client_instance
+        mock_videos = Mock()
+        mock_videos.list.side_effect = _videos_list_by_ids(delay=0.2)
+        mock_client_instance.client.videos.return_value = mock_videos
+
+        start = time.perf_counter()
+        await youtube_get_videos(video_ids=[f"vid{i:03d}" for i in range(200)])
+        elapsed = time.perf_counter() - start
+
+        assert mock_videos.list.call_count == 4
+        assert elapsed < 0.4
+
+    @pytest.mark.asyncio
+    async def test_get_videos_requires_ids(self):
+        """An empty ID list should be rejected."""
+        result = await youtube_get_videos(video_ids=[])
+        assert result["error"]["code"] == "InvalidInput"
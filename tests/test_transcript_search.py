@@ -0,0 +1,71 @@
+"""Unit tests for the transcript keyword index."""
+import pytest
+
+from src.transcript_search import TranscriptSearchIndex, tokenize
+from src.transcript_store import TranscriptIndex
+
+
+def make_index(video_id, texts, language="en"):
+    return TranscriptIndex(
+        video_id, language, "standard", False,
+        [i * 3.0 for i in range(len(texts))], [3.0] * len(texts), list(texts)
+    )
+
+
+@pytest.mark.unit
+class TestTranscriptSearchIndex:
+    """Test BM25 ranking and incremental updates."""
+
+    def test_tokenize(self):
+        """Tokens should be lowercased words without punctuation."""
+        assert tokenize("Hello, World! It's 2024") == ["hello", "world", "it", "s", "2024"]
+
+    def test_ranked_timestamped_hits(self):
+        """Passages with more (and rarer) matches should rank first."""
+        search = TranscriptSearchIndex(passage_chars=20)
+        search.add(make_index("vid1", ["intro to python", "the weather today", "python python decorators"]))
+        search.add(make_index("vid2", ["cooking pasta", "python snakes in the wild"]))
+
+        found = search.search("python decorators")
+
+        assert found["total"] == 3
+        best = found["hits"][0]
+        assert best["videoId"] == "vid1"
+        assert best["text"] == "python python decorators"
+        assert (best["start"], best["end"]) == (6.0, 9.0)
+        assert [h["score"] for h in found["hits"]] == sorted((h["score"] for h in found["hits"]), reverse=True)
+
+    def test_filter_by_video_and_limit(self):
+        """video_ids and limit should restrict the hits."""
+        search = TranscriptSearchIndex(passage_chars=20)
+        search.add(make_index("vid1", ["python one", "python two"]))
+        search.add(make_index("vid2", ["python three"]))
+
+        assert {h["videoId"] for h in search.search("python", video_ids=["vid2"])["hits"]} == {"vid2"}
+        assert len(search.search("python", limit=1)["hits"]) == 1
+
+    def test_no_match(self):
+        """Unknown terms and empty queries should return no hits."""
+        search = TranscriptSearchIndex()
+        search.add(make_index("vid1", ["hello world"]))
+        assert search.search("missing")["hits"] == []
+        assert search.search("?!")["total"] == 0
+
+    def test_readding_replaces_transcript(self):
+        """Adding a transcript again should replace its earlier passages."""
+        search = TranscriptSearchIndex(passage_chars=20)
+        search.add(make_index("vid1", ["old words"]))
+        search.add(make_index("vid1", ["new words"]))
+
+        assert search.search("old")["hits"] == []
+        assert search.stats() == {"transcripts": 1, "passages": 1, "terms": 2}
+
+    def test_evicts_oldest_transcripts(self):
+        """Only max_transcripts transcripts should stay indexed."""
+        search = TranscriptSearchIndex(max_transcripts=2)
+        for video_id in ("vid1", "vid2", "vid3"):
+            search.add(make_index(video_id, [f"topic {video_id}"]))
+
+        assert not search.has_video("vid1")
+        assert search.search("vid1")["hits"] == []
+        assert search.has_video("vid3")
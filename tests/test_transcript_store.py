@@ -0,0 +1,236 @@
+"""Unit tests for the transcript segment store."""
+import json
+import tracemalloc
+
+import pytest
+from unittest.mock import patch
+
+from src.fields import payload_size
+from src.transcript_store import TranscriptCache, TranscriptIndex
+
+
+def make_index(count=10, step=2.0, duration=1.5, video_id="abc123"):
+    segments = [{"text": f"s{i}", "start": i * step, "duration": duration} for i in range(count)]
+    return TranscriptIndex.from_segments(video_id, "en", "standard", False, segments)
+
+
+def select_texts(index, **kwargs):
+    return index.texts[index.select(**kwargs)["slice"]]
+
+
+@pytest.mark.unit
+class TestTranscriptIndex:
+    """Test time-range and offset/limit selection."""
+
+    def test_segments_sorted_by_start(self):
+        """Segments should be ordered by start time whatever the input order."""
+        index = TranscriptIndex.from_segments("abc123", "en", "standard", False, [
+            {"text": "b", "start": 5.0, "duration": 1.0},
+            {"text": "a", "start": 1.0, "duration": 2.0},
+        ])
+        assert index.starts.tolist() == [1.0, 5.0]
+        assert index.segments() == [
+            {"text": "a", "start": 1.0, "duration": 2.0},
+            {"text": "b", "start": 5.0, "duration": 1.0},
+        ]
+
+    def test_time_range(self):
+        """Segments overlapping [start_time, end_time) should be selected."""
+        index = make_index()  # starts 0, 2, 4, ... each 1.5s long
+        assert select_texts(index, start_time=4.0, end_time=9.0) == ["s2", "s3", "s4"]
+
+    def test_range_includes_segment_still_running(self):
+        """A segment that started before start_time but is still running is included."""
+        index = make_index()
+        assert select_texts(index, start_time=5.0)[0] == "s2"
+        # s2 ends at 5.5, so it is over by 5.6
+        assert select_texts(index, start_time=5.6)[0] == "s3"
+
+    def test_empty_ranges(self):
+        """Ranges past the end or inverted should select nothing."""
+        index = make_index()
+        assert select_texts(index, start_time=100.0) == []
+        assert index.select(start_time=10.0, end_time=5.0)["total"] == 0
+
+    def test_offset_limit_pages(self):
+        """offset/limit should page through the range with nextOffset."""
+        index = make_index()
+        first = index.select(start_time=2.0, limit=4)
+        second = index.select(start_time=2.0, offset=first["nextOffset"], limit=4)
+        third = index.select(start_time=2.0, offset=second["nextOffset"], limit=4)
+
+        assert index.texts[first["slice"]] == ["s1", "s2", "s3", "s4"]
+        assert first["total"] == 9
+        assert index.texts[second["slice"]] == ["s5", "s6", "s7", "s8"]
+        assert index.texts[third["slice"]] == ["s9"]
+        assert third["nextOffset"] is None
+
+    def test_empty_page_ends_paging(self):
+        """A non-positive limit should not hand back the same offset to follow."""
+        index = make_index()
+        for limit in (0, -3):
+            page = index.select(offset=1, limit=limit)
+            assert index.texts[page["slice"]] == []
+            assert page["nextOffset"] is None
+
+    def test_offset_past_end(self):
+        """An offset beyond the range should return no segments."""
+        assert select_texts(make_index(), offset=50) == []
+
+    def test_columns(self):
+        """columns() should return the same page as parallel arrays."""
+        index = make_index(4)
+        positions = index.select(offset=1, limit=2)["slice"]
+        assert index.columns(positions) == {
+            "starts": [2.0, 4.0],
+            "durations": [1.5, 1.5],
+            "texts": ["s1", "s2"],
+        }
+        assert index.text(positions) == "s1 s2"
+
+
+@pytest.mark.unit
+class TestCompactStorage:
+    """Measure the columnar store against a list of segment dicts."""
+
+    COUNT = 5000  # about 3.5 hours of 2.5s captions
+
+    def build_segments(self):
+        return [
+            {"text": f"caption line number {i} of a long talk", "start": round(i * 2.5, 2), "duration": 2.48}
+            for i in range(self.COUNT)
+        ]
+
+    def allocated(self, build):
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            value = build()
+            return value, tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+
+    def test_memory(self):
+        """The index should hold a transcript in well under half the memory of dicts."""
+        texts = [f"caption line number {i} of a long talk" for i in range(self.COUNT)]
+
+        def dicts():
+            return [{"text": text, "start": i * 2.5, "duration": 2.48} for i, text in enumerate(texts)]
+
+        def columns():
+            return TranscriptIndex(
+                "abc123", "en", "standard", False,
+                [i * 2.5 for i in range(self.COUNT)], [2.48] * self.COUNT, texts
+            )
+
+        _, dict_bytes = self.allocated(dicts)
+        index, index_bytes = self.allocated(columns)
+        assert len(index) == self.COUNT
+        # Texts are shared by both layouts; only the per-segment overhead is compared
+        print(f"segment overhead: dicts {dict_bytes} bytes, columns {index_bytes} bytes")
+        assert index_bytes < dict_bytes / 2
+
+    def test_serialized_size(self):
+        """Columnar output should serialize noticeably smaller than segment objects."""
+        segments = self.build_segments()
+        index = TranscriptIndex.from_segments("abc123", "en", "standard", False, segments)
+
+        as_segments = payload_size(index.segments())
+        as_columns = payload_size(index.columns())
+        print(f"serialized: segments {as_segments} bytes, columnar {as_columns} bytes")
+        assert json.loads(json.dumps(index.segments())) == segments
+        assert as_columns < as_segments * 0.8
+
+
+@pytest.mark.unit
+class TestTranscriptCache:
+    """Test the segment-bounded transcript cache."""
+
+    def test_hit_and_miss(self):
+        """Stored indexes should be returned until they expire."""
+        cache = TranscriptCache(ttl=60, max_segments=100)
+        index = make_index()
+        cache.set("k", index)
+        assert cache.get("k") is index
+        assert cache.get("other") is None
+        assert cache.stats()["hits"] == 1
+
+    def test_expiry(self):
+        """Expired entries should be dropped."""
+        cache = TranscriptCache(ttl=60, max_segments=100)
+        cache.set("k", make_index())
+        with patch("src.transcript_store.time.monotonic", return_value=1e12):
+            assert cache.get("k") is None
+        assert cache.stats()["segments"] == 0
+
+    def test_evicts_least_recently_used_by_segments(self):
+        """The cache should stay within its segment budget, evicting LRU first."""
+        cache = TranscriptCache(ttl=60, max_segments=25)
+        cache.set("a", make_index(10))
+        cache.set("b", make_index(10))
+        cache.get("a")
+        cache.set("c", make_index(10))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["segments"] == 20
+
+    def test_oversized_transcript_not_cached(self):
+        """A transcript larger than the whole budget should not be stored."""
+        cache = TranscriptCache(ttl=60, max_segments=5)
+        cache.set("a", make_index(10))
+        assert cache.get("a") is None
+
+
+@pytest.mark.unit
+class TestChunks:
+    """Test merging segments into paragraphs."""
+
+    def test_chunks_by_characters(self):
+        """Paragraphs should stay within max_chars and cover every segment."""
+        index = make_index(10)  # "s0".."s9", 2 chars each, joined with spaces
+        chunks = index.chunks(max_chars=8)
+        assert [c["text"] for c in chunks] == ["s0 s1 s2", "s3 s4 s5", "s6 s7 s8", "s9"]
+        assert chunks[0]["start"] == 0.0
+        assert chunks[0]["end"] == 5.5
+        assert chunks[-1] == {"start": 18.0, "end": 19.5, "text": "s9"}
+
+    def test_long_segment_kept_whole(self):
+        """A segment longer than max_chars should become its own paragraph."""
+        index = TranscriptIndex("abc123", "en", "standard", False, [0, 1, 2], [1, 1, 1], ["a", "x" * 20, "b"])
+        assert [c["text"] for c in index.chunks(max_chars=5)] == ["a", "x" * 20, "b"]
+
+    def test_chunks_by_pause(self):
+        """A silence of at least min_pause should start a new paragraph."""
+        index = TranscriptIndex(
+            "abc123", "en", "standard", False,
+            [0.0, 1.0, 2.0, 6.0, 7.0], [1.0, 1.0, 1.0, 1.0, 1.0], ["a", "b", "c", "d", "e"]
+        )
+        chunks = index.chunks(min_pause=2.0)
+        assert chunks == [
+            {"start": 0.0, "end": 3.0, "text": "a b c"},
+            {"start": 6.0, "end": 8.0, "text": "d e"},
+        ]
+
+    def test_overlapping_captions_are_not_pauses(self):
+        """Overlapping caption timings should not register as gaps."""
+        index = TranscriptIndex(
+            "abc123", "en", "asr", False, [0.0, 1.0, 4.0], [5.0, 1.0, 1.0], ["a", "b", "c"]
+        )
+        assert [c["text"] for c in index.chunks(min_pause=2.0)] == ["a b c"]
+
+    def test_chunks_within_positions(self):
+        """Chunking should only cover the selected page."""
+        index = make_index(10)
+        positions = index.select(start_time=4.0, limit=3)["slice"]
+        assert index.chunks(positions) == [{"start": 4.0, "end": 9.5, "text": "s2 s3 s4"}]
+
+    def test_chunks_shrink_long_transcripts(self):
+        """Paragraphs should cut the number of items and serialized size."""
+        segments = TestCompactStorage().build_segments()
+        index = TranscriptIndex.from_segments("abc123", "en", "standard", False, segments)
+        chunks = index.chunks(max_chars=1000)
+        print(f"{len(segments)} segments -> {len(chunks)} chunks, "
+              f"{payload_size(segments)} -> {payload_size(chunks)} bytes")
+        assert len(chunks) < len(segments) / 20
+        assert payload_size(chunks) < payload_size(segments) * 0.6